@@ -22,6 +22,7 @@ Usage:
     bundle = pipeline.generate_bundle(requirements, schema_version="v1", request_id="req")
 """
 import inspect
+import threading
 from typing import Any
 
 from app.providers.base import Provider, ProviderError
@@ -50,7 +51,16 @@ class FallbackPipeline(Provider):
         if not providers:
             raise ValueError("FallbackPipeline requires at least one provider.")
         self._providers = providers
-        self._active_provider: Provider | None = None
+        # Per-thread, so a shared pipeline forwards usage from this request's winner.
+        self._active = threading.local()
+
+    @property
+    def _active_provider(self) -> Provider | None:
+        return getattr(self._active, "provider", None)
+
+    @_active_provider.setter
+    def _active_provider(self, provider: Provider | None) -> None:
+        self._active.provider = provider
 
     def generate_raw(
         self,
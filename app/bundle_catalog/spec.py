@@ -13,6 +13,7 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any
 
 
@@ -91,7 +92,28 @@ class BundleSpec:
             "properties": {d.key: d.json_schema for d in self.docs},
         }
 
-    @property
+    @cached_property
+    def validation_plan(self) -> tuple[tuple[str, tuple[tuple[str, str, bool], ...]], ...]:
+        """Per-doc ``(field, expected_type, string_items)`` checks, compiled once per spec.
+
+        Consumed by ``_validate_bundle_schema`` so each request walks flat tuples
+        instead of re-resolving nested schema dicts.
+        """
+        plan = []
+        for doc in self.docs:
+            properties = doc.json_schema["properties"]
+            checks = tuple(
+                (
+                    field_name,
+                    properties[field_name]["type"],
+                    properties[field_name].get("items", {}).get("type") == "string",
+                )
+                for field_name in doc.json_schema["required"]
+            )
+            plan.append((doc.key, checks))
+        return tuple(plan)
+
+    @cached_property
     def stability_checklist(self) -> str:
         """Dynamically generated stability checklist for the LLM prompt."""
         keys_str = ", ".join(self.doc_keys)
@@ -130,14 +152,22 @@ class BundleSpec:
         """Map of doc_key → critical_non_empty_headings for all docs."""
         return {d.key: d.critical_non_empty_headings for d in self.docs}
 
-    def stabilizer_structure(self) -> dict[str, dict[str, Any]]:
-        """Map of doc_key → stabilizer_defaults, used by stabilize_bundle()."""
+    @cached_property
+    def _stabilizer_structure(self) -> dict[str, dict[str, Any]]:
         return {d.key: d.stabilizer_defaults for d in self.docs}
 
-    def build_json_schema_str(self) -> str:
-        """JSON-serialized schema for embedding in LLM prompts."""
+    def stabilizer_structure(self) -> dict[str, dict[str, Any]]:
+        """Map of doc_key → stabilizer_defaults, used by stabilize_bundle() (built once per spec)."""
+        return self._stabilizer_structure
+
+    @cached_property
+    def _json_schema_str(self) -> str:
         return json.dumps(self.json_schema, ensure_ascii=False)
 
+    def build_json_schema_str(self) -> str:
+        """JSON-serialized schema for embedding in LLM prompts (serialized once per spec)."""
+        return self._json_schema_str
+
     def ui_metadata(self) -> dict[str, Any]:
         """Metadata dict for the GET /bundles API response."""
         return {
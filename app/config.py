@@ -95,6 +95,16 @@ def is_markitdown_plugins_enabled() -> bool:
     return env_is_enabled("DECISIONDOC_MARKITDOWN_PLUGINS_ENABLED", "0")
 
 
+def is_parallel_render_enabled() -> bool:
+    """Whether bundle docs are rendered on a shared thread pool instead of in sequence."""
+    return env_is_enabled("DECISIONDOC_PARALLEL_RENDER", "0")
+
+
+def is_relaxed_durability() -> bool:
+    """Whether batched local writes skip the per-file fsync (``DECISIONDOC_DURABILITY=relaxed``)."""
+    return os.getenv("DECISIONDOC_DURABILITY", "strict").strip().lower() == "relaxed"
+
+
 def get_markitdown_max_chars() -> int:
     """Maximum MarkItDown fallback text returned per uploaded file."""
     return _get_int("DECISIONDOC_MARKITDOWN_MAX_CHARS", 12_000)
@@ -166,6 +176,30 @@ def get_llm_retry_backoff_seconds() -> list[int]:
         return [1, 3, 7]
 
 
+def get_max_concurrent_provider_calls() -> int:
+    """Upper bound on in-flight provider calls per GenerationService.
+
+    Configurable via DECISIONDOC_MAX_CONCURRENT_REQUESTS env var (default: 8, minimum: 1).
+    """
+    return max(1, _get_int("DECISIONDOC_MAX_CONCURRENT_REQUESTS", 8))
+
+
+def get_provider_pool_size() -> int:
+    """Worker threads in the shared pool that runs blocking provider SDK calls.
+
+    Configurable via DECISIONDOC_PROVIDER_POOL env var (default: 16, minimum: 1).
+    """
+    return max(1, _get_int("DECISIONDOC_PROVIDER_POOL", 16))
+
+
+def get_memory_cache_size() -> int:
+    """Number of bundles kept in the in-process LRU in front of the disk cache.
+
+    Configurable via DECISIONDOC_MEM_CACHE_SIZE env var (default: 128, 0 disables).
+    """
+    return max(0, _get_int("DECISIONDOC_MEM_CACHE_SIZE", 128))
+
+
 def get_finetune_auto_threshold() -> int:
     """Minimum number of fine-tune records before auto-training triggers.
 
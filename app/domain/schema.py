@@ -98,6 +98,9 @@ BUNDLE_JSON_SCHEMA_V1: dict = {
     },
 }
 
+# Serialized once at import; the legacy schema is constant and embedded in every prompt.
+_BUNDLE_JSON_SCHEMA_V1_STR = json.dumps(BUNDLE_JSON_SCHEMA_V1, ensure_ascii=False)
+
 _STABILITY_CHECKLIST = (
     "Stability checklist:\n"
     "- Return one JSON bundle object only.\n"
@@ -159,7 +162,7 @@ def build_bundle_prompt(
         lang_hint = getattr(bundle_spec, "prompt_hint", "")
     else:
         stability_checklist = _STABILITY_CHECKLIST
-        schema_json = json.dumps(BUNDLE_JSON_SCHEMA_V1, ensure_ascii=False)
+        schema_json = _BUNDLE_JSON_SCHEMA_V1_STR
         lang = "en"
         lang_hint = ""
 
@@ -209,7 +212,9 @@ def build_bundle_prompt(
     doc_tone = requirements.get("doc_tone", "formal") if isinstance(requirements, dict) else getattr(requirements, "doc_tone", "formal")
     tone_instruction = _TONE_MAP.get(doc_tone, "")
 
-    # 프롬프트 조립: 스타일 가이드 → Few-shot → 스키마 → 요구사항
+    # 프롬프트 조립: 스타일 가이드 → Few-shot → 스키마 → 톤 → 요구사항
+    # 번들별로 고정된 부분을 앞에 두어 provider 측 prompt prefix 캐시가 적중하도록 하고,
+    # 요청마다 달라지는 톤 지시와 requirements는 뒤에 둔다.
     prompt = (
         f"{system_instruction}"
         "Return ONLY JSON matching this schema. No markdown.\n"
@@ -223,11 +228,13 @@ def build_bundle_prompt(
             f"{few_shot}\n"
             f"=== 예시 끝 ===\n\n"
         )
-    if tone_instruction:
-        prompt += f"\n[문서 톤 지시] {tone_instruction}\n"
     prompt += (
         f"schema_version={schema_version}\n"
         f"schema={schema_json}\n"
+    )
+    if tone_instruction:
+        prompt += f"\n[문서 톤 지시] {tone_instruction}\n"
+    prompt += (
         f"requirements={json.dumps(_clean_requirements_for_prompt(requirements), ensure_ascii=False)}"
     )
     if _has_attachment_grounding_context(requirements):
@@ -2,6 +2,18 @@ from collections import Counter
 from typing import Any
 
 
+def _has_repeated_lines(text: str) -> bool:
+    """Whether any non-blank line (stripped) occurs three or more times; stops at the first."""
+    counts: Counter[str] = Counter()
+    for raw in text.splitlines():
+        line = raw.strip()
+        if line:
+            counts[line] += 1
+            if counts[line] >= 3:
+                return True
+    return False
+
+
 def compute_heuristic_score(rendered: dict[str, str], metrics: dict[str, Any]) -> dict[str, Any]:
     score = 100.0
     reasons: list[str] = []
@@ -35,9 +47,7 @@ def compute_heuristic_score(rendered: dict[str, str], metrics: dict[str, Any]) -
             reasons.append(f"{doc_type}_chars_below_600")
 
     for doc_type, text in rendered.items():
-        lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-        repeated = any(count >= 3 for count in Counter(lines).values())
-        if repeated:
+        if _has_repeated_lines(text):
             score -= 10
             reasons.append(f"repetition_detected:{doc_type}")
 
@@ -2,6 +2,9 @@ import re
 
 from app.domain.headings import BANNED_TOKENS, CRITICAL_NON_EMPTY_HEADINGS, LINT_HEADINGS
 
+# One alternation scanned once per document instead of one regex search per token.
+_BANNED_TOKEN_RE = re.compile(r"\b(?:" + "|".join(re.escape(t) for t in BANNED_TOKENS) + r")\b")
+
 
 def _section_content(markdown: str, heading: str) -> str:
     start = markdown.find(heading)
@@ -40,9 +43,9 @@ def lint_docs(
             if required not in markdown:
                 errors.append(f"{doc_type}:missing:{required}")
 
-        for token in BANNED_TOKENS:
-            if re.search(rf"\b{re.escape(token)}\b", markdown):
-                errors.append(f"{doc_type}:banned_token:{token}")
+        found = set(_BANNED_TOKEN_RE.findall(markdown))
+        if found:
+            errors.extend(f"{doc_type}:banned_token:{token}" for token in BANNED_TOKENS if token in found)
 
         for heading in effective_critical.get(doc_type, []):
             section = _section_content(markdown, heading)
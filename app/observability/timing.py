@@ -14,3 +14,11 @@ class Timer:
         finally:
             elapsed = (time.perf_counter() - start) * 1000
             self.durations_ms[key] = int(round(elapsed))
+
+    @staticmethod
+    def tic() -> int:
+        """Start a stage on the hot path without a context-manager frame; pair with ``toc``."""
+        return time.perf_counter_ns()
+
+    def toc(self, key: str, start_ns: int) -> None:
+        self.durations_ms[key] = int(round((time.perf_counter_ns() - start_ns) / 1_000_000))
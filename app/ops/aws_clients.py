@@ -2,7 +2,7 @@ import json
 import os
 from datetime import UTC, datetime
 from time import perf_counter
-from typing import Any
+from typing import Any, Callable
 from uuid import uuid4
 
 
@@ -12,6 +12,11 @@ class AwsClientsMixin:
     def _elapsed_ms(self, started: float) -> int:
         return max(0, int((perf_counter() - started) * 1000))
 
+    def _timed(self, fn: Callable[..., Any], /, **kwargs: Any) -> tuple[Any, int]:
+        started = perf_counter()
+        result = fn(**kwargs)
+        return result, self._elapsed_ms(started)
+
     def _default_lambda_log_group(self) -> str:
         function_name = os.getenv("AWS_LAMBDA_FUNCTION_NAME", "").strip()
         if not function_name:
@@ -3,12 +3,77 @@ import logging
 import os
 from collections import Counter
 from datetime import datetime
-from typing import Any
+from statistics import quantiles
+from typing import Any, NamedTuple
 
 from app.ops.investigation_helpers import _to_int
 
 logger = logging.getLogger("decisiondoc.ops")
 
+_decode_json = json.JSONDecoder().decode
+
+# (query_id, metric_name, stat) rows for the GetMetricData batch in _collect_metrics.
+_LAMBDA_METRICS = (
+    ("lambda_invocations", "Invocations", "Sum"),
+    ("lambda_errors", "Errors", "Sum"),
+    ("lambda_throttles", "Throttles", "Sum"),
+    ("lambda_duration_p95", "Duration", "p95"),
+)
+_API_GATEWAY_METRICS = (
+    ("api_count", "Count", "Sum"),
+    ("api_4xx", "4XXError", "Sum"),
+    ("api_5xx", "5XXError", "Sum"),
+    ("api_integration_latency_p95", "IntegrationLatency", "p95"),
+)
+
+
+def _metric_ints(values: list[Any]) -> list[int]:
+    """Coerce CloudWatch datapoints to ints, checking the common float/int types first."""
+    numeric_values: list[int] = []
+    append = numeric_values.append
+    for value in values:
+        value_type = type(value)
+        if value_type is float:
+            append(int(round(value)))
+        elif value_type is int:
+            append(value)
+        else:
+            numeric = _to_int(value)
+            if numeric is not None:
+                append(numeric)
+    return numeric_values
+
+
+class _LogEvent(NamedTuple):
+    """Normalized view of the structured log fields read by ``_collect_logs``."""
+
+    failed: bool
+    error_code: str | None
+    request_id: str | None
+    prompt_tokens: int | None
+    output_tokens: int | None
+    total_tokens: int | None
+
+
+def _parse_log_event(message: str) -> _LogEvent | None:
+    try:
+        payload = _decode_json(message)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    get = payload.get
+    error_code = get("error_code")
+    request_id = get("request_id")
+    return _LogEvent(
+        failed=get("event") == "request.failed",
+        error_code=error_code if isinstance(error_code, str) and error_code else None,
+        request_id=request_id if isinstance(request_id, str) and request_id else None,
+        prompt_tokens=_to_int(get("llm_prompt_tokens")),
+        output_tokens=_to_int(get("llm_output_tokens")),
+        total_tokens=_to_int(get("llm_total_tokens")),
+    )
+
 
 class MetricsCollectorMixin:
     """CloudWatch metrics/logs collection and summary building for OpsInvestigationService."""
@@ -37,69 +102,32 @@ class MetricsCollectorMixin:
         if not function_name:
             return result
 
+        lambda_dims = [{"Name": "FunctionName", "Value": function_name}]
         queries = [
             self._metric_query(
-                query_id="lambda_invocations",
-                namespace="AWS/Lambda",
-                metric_name="Invocations",
-                dimensions=[{"Name": "FunctionName", "Value": function_name}],
-                stat="Sum",
-            ),
-            self._metric_query(
-                query_id="lambda_errors",
-                namespace="AWS/Lambda",
-                metric_name="Errors",
-                dimensions=[{"Name": "FunctionName", "Value": function_name}],
-                stat="Sum",
-            ),
-            self._metric_query(
-                query_id="lambda_throttles",
-                namespace="AWS/Lambda",
-                metric_name="Throttles",
-                dimensions=[{"Name": "FunctionName", "Value": function_name}],
-                stat="Sum",
-            ),
-            self._metric_query(
-                query_id="lambda_duration_p95",
-                namespace="AWS/Lambda",
-                metric_name="Duration",
-                dimensions=[{"Name": "FunctionName", "Value": function_name}],
-                stat="p95",
-            ),
+                query_id=query_id,
+                metric_stat=self._metric_stat(
+                    namespace="AWS/Lambda",
+                    metric_name=metric_name,
+                    dimensions=lambda_dims,
+                    stat=stat,
+                ),
+            )
+            for query_id, metric_name, stat in _LAMBDA_METRICS
         ]
         if api_id:
-            dims = [{"Name": "ApiId", "Value": api_id}, {"Name": "Stage", "Value": stage}]
+            api_dims = [{"Name": "ApiId", "Value": api_id}, {"Name": "Stage", "Value": stage}]
             queries.extend(
-                [
-                    self._metric_query(
-                        query_id="api_count",
-                        namespace="AWS/ApiGateway",
-                        metric_name="Count",
-                        dimensions=dims,
-                        stat="Sum",
-                    ),
-                    self._metric_query(
-                        query_id="api_4xx",
+                self._metric_query(
+                    query_id=query_id,
+                    metric_stat=self._metric_stat(
                         namespace="AWS/ApiGateway",
-                        metric_name="4XXError",
-                        dimensions=dims,
-                        stat="Sum",
+                        metric_name=metric_name,
+                        dimensions=api_dims,
+                        stat=stat,
                     ),
-                    self._metric_query(
-                        query_id="api_5xx",
-                        namespace="AWS/ApiGateway",
-                        metric_name="5XXError",
-                        dimensions=dims,
-                        stat="Sum",
-                    ),
-                    self._metric_query(
-                        query_id="api_integration_latency_p95",
-                        namespace="AWS/ApiGateway",
-                        metric_name="IntegrationLatency",
-                        dimensions=dims,
-                        stat="p95",
-                    ),
-                ]
+                )
+                for query_id, metric_name, stat in _API_GATEWAY_METRICS
             )
 
         try:
@@ -166,6 +194,7 @@ class MetricsCollectorMixin:
             if not isinstance(events, list):
                 events = []
             self._log_events_returned = len(events)
+            ids_full = False
             for event in events:
                 if not isinstance(event, dict):
                     continue
@@ -173,27 +202,24 @@ class MetricsCollectorMixin:
                 message = event.get("message", "")
                 if not isinstance(message, str):
                     continue
-                try:
-                    payload = json.loads(message)
-                except ValueError:
-                    continue
-                if not isinstance(payload, dict):
+                parsed = _parse_log_event(message)
+                if parsed is None:
                     continue
 
-                error_code = payload.get("error_code")
-                if isinstance(error_code, str) and error_code:
-                    error_codes[error_code] += 1
-                if payload.get("event") == "request.failed":
+                if parsed.error_code is not None:
+                    error_codes[parsed.error_code] += 1
+                if parsed.failed:
                     failed_events += 1
 
-                request_id = payload.get("request_id")
-                if isinstance(request_id, str) and request_id and request_id not in sample_request_ids:
-                    if len(sample_request_ids) < 10:
+                if not ids_full:
+                    request_id = parsed.request_id
+                    if request_id is not None and request_id not in sample_request_ids:
                         sample_request_ids.append(request_id)
+                        ids_full = len(sample_request_ids) >= 10
 
-                prompt_tokens = _to_int(payload.get("llm_prompt_tokens"))
-                output_tokens = _to_int(payload.get("llm_output_tokens"))
-                total_tokens = _to_int(payload.get("llm_total_tokens"))
+                prompt_tokens = parsed.prompt_tokens
+                output_tokens = parsed.output_tokens
+                total_tokens = parsed.total_tokens
                 if total_tokens is None and prompt_tokens is None and output_tokens is None:
                     continue
                 usage_samples += 1
@@ -240,41 +266,34 @@ class MetricsCollectorMixin:
             "sample_request_ids": logs["sample_request_ids"],
         }
 
-    def _metric_query(
+    def _metric_stat(
         self,
         *,
-        query_id: str,
         namespace: str,
         metric_name: str,
         dimensions: list[dict[str, str]],
         stat: str,
     ) -> dict[str, Any]:
         return {
-            "Id": query_id,
-            "MetricStat": {
-                "Metric": {
-                    "Namespace": namespace,
-                    "MetricName": metric_name,
-                    "Dimensions": dimensions,
-                },
-                "Period": 60,
-                "Stat": stat,
+            "Metric": {
+                "Namespace": namespace,
+                "MetricName": metric_name,
+                "Dimensions": dimensions,
             },
-            "ReturnData": True,
+            "Period": 60,
+            "Stat": stat,
         }
 
+    def _metric_query(self, *, query_id: str, metric_stat: dict[str, Any]) -> dict[str, Any]:
+        return {"Id": query_id, "MetricStat": metric_stat, "ReturnData": True}
+
     def _sum_metric(self, item: dict[str, Any] | None) -> int:
         if not isinstance(item, dict):
             return 0
         values = item.get("Values")
         if not isinstance(values, list):
             return 0
-        total = 0
-        for value in values:
-            numeric = _to_int(value)
-            if numeric is not None:
-                total += numeric
-        return total
+        return sum(_metric_ints(values))
 
     def _p95_metric(self, item: dict[str, Any] | None) -> int | None:
         if not isinstance(item, dict):
@@ -282,7 +301,10 @@ class MetricsCollectorMixin:
         values = item.get("Values")
         if not isinstance(values, list) or not values:
             return None
-        numeric_values = [v for v in (_to_int(value) for value in values) if v is not None]
+        numeric_values = _metric_ints(values)
         if not numeric_values:
             return None
-        return max(numeric_values)
+        if len(numeric_values) == 1:
+            return numeric_values[0]
+        # "inclusive" matches the linear interpolation used by numpy.percentile.
+        return int(round(quantiles(numeric_values, n=20, method="inclusive")[18]))
@@ -1,5 +1,6 @@
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from time import perf_counter
 from typing import Any, Callable
@@ -175,12 +176,21 @@ class OpsInvestigationService(
             )
             return response
 
-        metrics_started = perf_counter()
-        metrics = self._collect_metrics(start=now - timedelta(minutes=window_minutes), end=now, stage=stage)
-        metrics_ms = self._elapsed_ms(metrics_started)
-        logs_started = perf_counter()
-        logs = self._collect_logs(start=now - timedelta(minutes=window_minutes), end=now)
-        logs_ms = self._elapsed_ms(logs_started)
+        # CloudWatch Metrics and Logs are independent APIs; overlap the two round-trips.
+        window_start = now - timedelta(minutes=window_minutes)
+        # boto3's default session is not thread-safe: build both clients here, before fanning out.
+        for build_client in (self._cloudwatch, self._logs):
+            try:
+                build_client()
+            except Exception:
+                pass  # the collector retries and logs the failure
+        with ThreadPoolExecutor(max_workers=2, thread_name_prefix="ops-collect") as executor:
+            metrics_future = executor.submit(
+                self._timed, self._collect_metrics, start=window_start, end=now, stage=stage
+            )
+            logs_future = executor.submit(self._timed, self._collect_logs, start=window_start, end=now)
+            metrics, metrics_ms = metrics_future.result()
+            logs, logs_ms = logs_future.result()
         summary = self._build_summary(metrics=metrics, logs=logs)
 
         run_id = self._build_run_id(now)
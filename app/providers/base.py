@@ -1,3 +1,4 @@
+import threading
 from abc import ABC, abstractmethod
 from typing import Any
 
@@ -7,16 +8,25 @@ class ProviderError(Exception):
 
 
 class UsageTokenMixin:
-    """Mixin that standardizes usage-token tracking for LLM providers."""
+    """Mixin that standardizes usage-token tracking for LLM providers.
 
-    _last_usage_tokens: dict[str, int] | None = None
+    Usage is kept per calling thread, so one provider instance can be shared by
+    concurrent requests without handing one request's token counts to another.
+    """
+
+    def _usage_local(self) -> threading.local:
+        local = self.__dict__.get("_usage_tokens_local")
+        if local is None:
+            local = self.__dict__.setdefault("_usage_tokens_local", threading.local())
+        return local
 
     def _set_usage_tokens(self, usage_map: dict[str, int] | None) -> None:
-        self._last_usage_tokens = usage_map
+        self._usage_local().tokens = usage_map
 
     def consume_usage_tokens(self) -> dict[str, int] | None:
-        usage = self._last_usage_tokens
-        self._last_usage_tokens = None
+        local = self._usage_local()
+        usage = getattr(local, "tokens", None)
+        local.tokens = None
         return usage
 
 
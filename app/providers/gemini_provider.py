@@ -1,11 +1,57 @@
 import json
+import logging
 import os
-from typing import Any
-
-import anyio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any, Callable
 
+from app.config import get_provider_pool_size
 from app.domain.schema import build_bundle_prompt
 from app.providers.base import Provider, ProviderError, UsageTokenMixin
+from app.providers.rate_limit import estimate_prompt_tokens, get_rate_limiter
+
+_log = logging.getLogger("decisiondoc.provider.gemini")
+
+# Shared worker pool for the blocking Gemini SDK, sized once at import from
+# DECISIONDOC_PROVIDER_POOL. DECISIONDOC_PROVIDER_TIMEOUT is enforced by the SDK's
+# own HTTP timeout; ``future.result(timeout=...)`` is only a backstop for calls
+# that hang outside the HTTP request, so it waits a little longer.
+_EXECUTOR = ThreadPoolExecutor(max_workers=get_provider_pool_size(), thread_name_prefix="prov")
+_BACKSTOP_GRACE_SECONDS = 5.0
+
+# A running future can't be cancelled: each one that outlives the backstop keeps a
+# pool worker busy until the SDK returns. Track them so the starvation is visible.
+_abandoned: set[Future] = set()
+_abandoned_lock = threading.Lock()
+
+
+def abandoned_call_count() -> int:
+    """Number of timed-out Gemini calls still occupying a provider pool worker."""
+    with _abandoned_lock:
+        return len(_abandoned)
+
+
+def _forget_abandoned(future: Future) -> None:
+    with _abandoned_lock:
+        _abandoned.discard(future)
+
+
+def _call_with_timeout(fn: Callable[[], Any], timeout: float) -> Any:
+    future = _EXECUTOR.submit(fn)
+    try:
+        return future.result(timeout=timeout + _BACKSTOP_GRACE_SECONDS)
+    except FuturesTimeoutError as exc:
+        if not future.cancel():
+            with _abandoned_lock:
+                _abandoned.add(future)
+            future.add_done_callback(_forget_abandoned)
+            _log.warning(
+                "Gemini call outlived the %.0fs timeout backstop; %d abandoned call(s) still hold pool workers",
+                timeout + _BACKSTOP_GRACE_SECONDS,
+                abandoned_call_count(),
+            )
+        raise ProviderError("Provider request failed.") from exc
 
 
 class GeminiProvider(UsageTokenMixin, Provider):
@@ -15,6 +61,23 @@ class GeminiProvider(UsageTokenMixin, Provider):
         self.api_key = os.getenv("GEMINI_API_KEY", "")
         if not self.api_key:
             raise ProviderError("Provider configuration error.")
+        self._client: tuple[int, Any] | None = None
+
+    def _sdk(self, timeout: int) -> tuple[Any, Any]:
+        """Return ``(client, types)``, building the client once per timeout so its HTTP pool is reused."""
+        try:
+            from google import genai
+            from google.genai import types
+        except ImportError as exc:  # pragma: no cover - env dependent
+            raise ProviderError("Provider SDK unavailable.") from exc
+
+        cached = self._client
+        if cached is None or cached[0] != timeout:
+            # HttpOptions.timeout is in milliseconds.
+            http_options = types.HttpOptions(timeout=timeout * 1000)
+            cached = (timeout, genai.Client(api_key=self.api_key, http_options=http_options))
+            self._client = cached
+        return cached[1], types
 
     def generate_raw(self, prompt: str, *, request_id: str, max_output_tokens: int | None = None) -> str:
         """Call Gemini and return the raw text response.
@@ -28,15 +91,9 @@ class GeminiProvider(UsageTokenMixin, Provider):
         self._set_usage_tokens(None)
 
         try:
-            from google import genai
-            from google.genai import types
-        except ImportError as exc:  # pragma: no cover - env dependent
-            raise ProviderError("Provider SDK unavailable.") from exc
-
-        try:
-            client = genai.Client(api_key=self.api_key)
-
             _timeout = int(os.getenv("DECISIONDOC_PROVIDER_TIMEOUT", "120"))
+            client, types = self._sdk(_timeout)
+
             # Priority: explicit kwarg > env var
             effective_max = max_output_tokens or (
                 int(v) if (v := os.getenv("DECISIONDOC_MAX_OUTPUT_TOKENS")) else None
@@ -46,17 +103,16 @@ class GeminiProvider(UsageTokenMixin, Provider):
                 **({"max_output_tokens": effective_max} if effective_max else {}),
             )
 
-            async def _call_with_timeout():
-                with anyio.fail_after(_timeout):
-                    return await anyio.to_thread.run_sync(
-                        lambda: client.models.generate_content(
-                            model=os.getenv("DECISIONDOC_GEMINI_MODEL", "gemini-2.0-flash"),
-                            contents=prompt,
-                            config=_gen_config,
-                        )
-                    )
-
-            response = anyio.run(_call_with_timeout)
+            model = os.getenv("DECISIONDOC_GEMINI_MODEL", "gemini-2.0-flash")
+            get_rate_limiter().acquire(self.name, model, estimate_prompt_tokens(prompt))
+            response = _call_with_timeout(
+                lambda: client.models.generate_content(
+                    model=model,
+                    contents=prompt,
+                    config=_gen_config,
+                ),
+                _timeout,
+            )
             usage = getattr(response, "usage_metadata", None)
             usage_map: dict[str, int] | None = None
             if usage is not None:
@@ -100,14 +156,8 @@ class GeminiProvider(UsageTokenMixin, Provider):
         self._set_usage_tokens(None)
 
         try:
-            from google import genai
-            from google.genai import types
-        except ImportError as exc:  # pragma: no cover - env dependent
-            raise ProviderError("Provider SDK unavailable.") from exc
-
-        try:
-            client = genai.Client(api_key=self.api_key)
             _timeout = int(os.getenv("DECISIONDOC_PROVIDER_TIMEOUT", "120"))
+            client, types = self._sdk(_timeout)
             prompt = (
                 "첨부된 파일에서 사람이 읽을 수 있는 텍스트와 설득 근거가 되는 시각 요소를 추출하세요. "
                 "파일이 스캔 PDF라면 OCR 결과를 우선 정리하고, 이미지/도표/표지 구성을 함께 설명하세요. "
@@ -119,19 +169,16 @@ class GeminiProvider(UsageTokenMixin, Provider):
                 mime_type=_detect_attachment_mime_type(filename),
             )
 
-            async def _call_with_timeout():
-                with anyio.fail_after(_timeout):
-                    return await anyio.to_thread.run_sync(
-                        lambda: client.models.generate_content(
-                            model=os.getenv("DECISIONDOC_GEMINI_VISION_MODEL") or os.getenv(
-                                "DECISIONDOC_GEMINI_MODEL", "gemini-2.0-flash"
-                            ),
-                            contents=[prompt, part],
-                            config=types.GenerateContentConfig(max_output_tokens=900),
-                        )
-                    )
-
-            response = anyio.run(_call_with_timeout)
+            response = _call_with_timeout(
+                lambda: client.models.generate_content(
+                    model=os.getenv("DECISIONDOC_GEMINI_VISION_MODEL") or os.getenv(
+                        "DECISIONDOC_GEMINI_MODEL", "gemini-2.0-flash"
+                    ),
+                    contents=[prompt, part],
+                    config=types.GenerateContentConfig(max_output_tokens=900),
+                ),
+                _timeout,
+            )
             usage = getattr(response, "usage_metadata", None)
             usage_map: dict[str, int] | None = None
             if usage is not None:
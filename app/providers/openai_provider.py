@@ -1,14 +1,11 @@
-import asyncio
 import base64
 import json
 import os
-from concurrent.futures import ThreadPoolExecutor
-from typing import Any  # noqa: F401 — used in _create_kwargs type annotation
-
-import anyio
+from typing import Any
 
 from app.domain.schema import build_bundle_prompt
 from app.providers.base import Provider, ProviderError, UsageTokenMixin
+from app.providers.rate_limit import estimate_prompt_tokens, get_rate_limiter
 
 
 class OpenAIProvider(UsageTokenMixin, Provider):
@@ -19,6 +16,21 @@ class OpenAIProvider(UsageTokenMixin, Provider):
         if not self.api_key:
             raise ProviderError("Provider configuration error.")
         self._model_override = model_override
+        self._client: tuple[int, Any] | None = None
+
+    def _sdk_client(self) -> Any:
+        """Return the SDK client, built once per timeout so its HTTP pool is reused."""
+        try:
+            from openai import OpenAI
+        except ImportError as exc:  # pragma: no cover - env dependent
+            raise ProviderError("Provider SDK unavailable.") from exc
+
+        timeout = int(os.getenv("DECISIONDOC_PROVIDER_TIMEOUT", "120"))
+        cached = self._client
+        if cached is None or cached[0] != timeout:
+            cached = (timeout, OpenAI(api_key=self.api_key, max_retries=0, timeout=timeout))
+            self._client = cached
+        return cached[1]
 
     def generate_raw(self, prompt: str, *, request_id: str, max_output_tokens: int | None = None) -> str:
         """Call OpenAI and return the raw text response.
@@ -31,41 +43,26 @@ class OpenAIProvider(UsageTokenMixin, Provider):
         # Reset stale token state from any previous call before making a new one.
         self._set_usage_tokens(None)
 
-        try:
-            from openai import OpenAI
-        except ImportError as exc:  # pragma: no cover - env dependent
-            raise ProviderError("Provider SDK unavailable.") from exc
-
-        _timeout = int(os.getenv("DECISIONDOC_PROVIDER_TIMEOUT", "120"))
-        client = OpenAI(api_key=self.api_key, max_retries=0, timeout=_timeout)
+        client = self._sdk_client()
 
         try:
             # Priority: explicit kwarg > env var
             effective_max = max_output_tokens or (
                 int(v) if (v := os.getenv("DECISIONDOC_MAX_OUTPUT_TOKENS")) else None
             )
+            model = self._model_override or os.getenv("DECISIONDOC_OPENAI_MODEL", "gpt-4o-mini")
             _create_kwargs: dict[str, Any] = dict(
-                model=self._model_override or os.getenv("DECISIONDOC_OPENAI_MODEL", "gpt-4o-mini"),
+                model=model,
                 input=prompt,
                 text={"format": {"type": "json_object"}},
             )
             if effective_max:
                 _create_kwargs["max_output_tokens"] = effective_max
 
-            async def _call_with_timeout():
-                with anyio.fail_after(_timeout):
-                    return await anyio.to_thread.run_sync(
-                        lambda: client.responses.create(**_create_kwargs)
-                    )
+            get_rate_limiter().acquire(self.name, model, estimate_prompt_tokens(prompt))
 
-            try:
-                asyncio.get_running_loop()
-            except RuntimeError:
-                response = anyio.run(_call_with_timeout)
-            else:
-                # Keep the sync provider API usable even when called under an active event loop.
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    response = executor.submit(anyio.run, _call_with_timeout).result()
+            # The SDK client enforces the provider timeout itself, so call it directly on this thread.
+            response = client.responses.create(**_create_kwargs)
             usage = getattr(response, "usage", None)
             usage_map: dict[str, int] | None = None
             if usage is not None:
@@ -103,15 +100,9 @@ class OpenAIProvider(UsageTokenMixin, Provider):
     def extract_attachment_text(self, filename: str, raw: bytes, *, request_id: str) -> str:
         self._set_usage_tokens(None)
 
-        try:
-            from openai import OpenAI
-        except ImportError as exc:  # pragma: no cover - env dependent
-            raise ProviderError("Provider SDK unavailable.") from exc
-
+        client = self._sdk_client()
         mime_type = _detect_attachment_mime_type(filename)
         encoded_data = base64.b64encode(raw).decode("ascii")
-        _timeout = int(os.getenv("DECISIONDOC_PROVIDER_TIMEOUT", "120"))
-        client = OpenAI(api_key=self.api_key, max_retries=0, timeout=_timeout)
         model = os.getenv("DECISIONDOC_OPENAI_VISION_MODEL") or self._model_override or os.getenv(
             "DECISIONDOC_OPENAI_MODEL", "gpt-4o-mini"
         )
@@ -128,41 +119,29 @@ class OpenAIProvider(UsageTokenMixin, Provider):
             "- 문서/PPT에서 어떻게 쓰면 설득력이 높아지는지 2~4개 bullet"
         )
 
-        async def _call_with_timeout():
-            with anyio.fail_after(_timeout):
-                return await anyio.to_thread.run_sync(
-                    lambda: client.responses.create(
-                        model=model,
-                        input=[{
-                            "role": "user",
-                            "content": [
-                                {"type": "input_text", "text": prompt},
-                                (
-                                    {
-                                        "type": "input_file",
-                                        "filename": filename,
-                                        "file_data": encoded_data,
-                                    }
-                                    if is_pdf
-                                    else {
-                                        "type": "input_image",
-                                        "image_url": f"data:{mime_type};base64,{encoded_data}",
-                                    }
-                                ),
-                            ],
-                        }],
-                        max_output_tokens=900,
-                    )
-                )
-
         try:
-            try:
-                asyncio.get_running_loop()
-            except RuntimeError:
-                response = anyio.run(_call_with_timeout)
-            else:
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    response = executor.submit(anyio.run, _call_with_timeout).result()
+            response = client.responses.create(
+                model=model,
+                input=[{
+                    "role": "user",
+                    "content": [
+                        {"type": "input_text", "text": prompt},
+                        (
+                            {
+                                "type": "input_file",
+                                "filename": filename,
+                                "file_data": encoded_data,
+                            }
+                            if is_pdf
+                            else {
+                                "type": "input_image",
+                                "image_url": f"data:{mime_type};base64,{encoded_data}",
+                            }
+                        ),
+                    ],
+                }],
+                max_output_tokens=900,
+            )
             usage = getattr(response, "usage", None)
             usage_map: dict[str, int] | None = None
             if usage is not None:
@@ -195,35 +174,17 @@ class OpenAIProvider(UsageTokenMixin, Provider):
     ) -> dict[str, Any]:
         self._set_usage_tokens(None)
 
-        try:
-            from openai import OpenAI
-        except ImportError as exc:  # pragma: no cover - env dependent
-            raise ProviderError("Provider SDK unavailable.") from exc
-
-        _timeout = int(os.getenv("DECISIONDOC_PROVIDER_TIMEOUT", "120"))
-        client = OpenAI(api_key=self.api_key, max_retries=0, timeout=_timeout)
+        client = self._sdk_client()
         model = os.getenv("DECISIONDOC_OPENAI_IMAGE_MODEL", "gpt-image-1")
 
-        async def _call_with_timeout():
-            with anyio.fail_after(_timeout):
-                return await anyio.to_thread.run_sync(
-                    lambda: client.images.generate(
-                        model=model,
-                        prompt=prompt,
-                        size=size,
-                        quality=os.getenv("DECISIONDOC_OPENAI_IMAGE_QUALITY", "auto"),
-                        output_format="png",
-                    )
-                )
-
         try:
-            try:
-                asyncio.get_running_loop()
-            except RuntimeError:
-                response = anyio.run(_call_with_timeout)
-            else:
-                with ThreadPoolExecutor(max_workers=1) as executor:
-                    response = executor.submit(anyio.run, _call_with_timeout).result()
+            response = client.images.generate(
+                model=model,
+                prompt=prompt,
+                size=size,
+                quality=os.getenv("DECISIONDOC_OPENAI_IMAGE_QUALITY", "auto"),
+                output_format="png",
+            )
 
             data = getattr(response, "data", None) or []
             first = data[0] if data else None
@@ -0,0 +1,200 @@
+"""app/providers/rate_limit.py — Process-wide RPM/TPM token buckets for LLM providers.
+
+Each ``(provider, model)`` pair gets two buckets: one for requests per minute
+and one for estimated prompt tokens per minute. ``acquire()`` reserves from
+both and blocks the calling thread until the reservation is covered, so bursts
+queue locally instead of burning the provider timeout on 429 responses.
+
+The wait is capped at the provider timeout: a caller that would queue longer
+gets its reservation back and a ``ProviderRateLimitedError`` (surfaced as the
+usual 503 rate-limit response with ``retry_after_seconds``) instead of holding
+a provider slot and a request thread while it sleeps.
+
+Environment variables:
+    DECISIONDOC_PROVIDER_RATE_LIMITS — comma-separated ``model=rpm:tpm`` entries
+        (e.g. ``gpt-4o-mini=5000:150000,gemini-2.0-flash=1000:1000000``).
+        When set, replaces the defaults; models without an entry are not limited.
+    DECISIONDOC_PROVIDER_TIMEOUT     — also the longest ``acquire()`` will wait (default 120s)
+"""
+from __future__ import annotations
+
+import logging
+import math
+import os
+import threading
+import time
+from typing import Callable
+
+from app.providers.base import ProviderError
+
+_log = logging.getLogger("decisiondoc.provider.rate_limit")
+
+DEFAULT_RATE_LIMITS: dict[str, tuple[int, int]] = {
+    "gpt-4o-mini": (5000, 150_000),
+    "gemini-1.5-flash": (1000, 1_000_000),
+    "gemini-2.0-flash": (1000, 1_000_000),
+}
+
+
+class ProviderRateLimitedError(ProviderError):
+    """The local RPM/TPM budget would make this call wait longer than allowed."""
+
+    # Read by the 429 / Retry-After helpers in app.services.generation.errors.
+    status_code = 429
+
+    def __init__(self, provider_name: str, model: str, wait_seconds: float) -> None:
+        super().__init__(
+            f"Local rate limit reached for {provider_name}/{model}; "
+            f"budget frees up in {wait_seconds:.1f}s."
+        )
+        self.headers = {"retry-after": str(math.ceil(wait_seconds))}
+
+
+def _max_wait_seconds() -> float:
+    try:
+        return max(0.0, float(os.getenv("DECISIONDOC_PROVIDER_TIMEOUT", "120")))
+    except ValueError:
+        return 120.0
+
+
+def estimate_prompt_tokens(prompt: str) -> int:
+    """Rough token estimate (~4 chars per token) used before the provider reports usage."""
+    return max(1, len(prompt) // 4)
+
+
+def parse_rate_limits(raw: str) -> dict[str, tuple[int, int]]:
+    """Parse ``model=rpm:tpm`` entries, skipping malformed or non-positive ones."""
+    limits: dict[str, tuple[int, int]] = {}
+    for entry in raw.split(","):
+        model, sep, budget = entry.strip().partition("=")
+        rpm_raw, sep2, tpm_raw = budget.partition(":")
+        if not (sep and sep2 and model.strip()):
+            continue
+        try:
+            rpm, tpm = int(rpm_raw), int(tpm_raw)
+        except ValueError:
+            _log.warning("Ignoring invalid provider rate limit entry %r", entry)
+            continue
+        if rpm > 0 and tpm > 0:
+            limits[model.strip()] = (rpm, tpm)
+    return limits
+
+
+class TokenBucket:
+    """Thread-safe token bucket refilled continuously from a monotonic clock."""
+
+    def __init__(
+        self,
+        capacity: float,
+        refill_per_second: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.capacity = float(capacity)
+        self.refill_per_second = float(refill_per_second)
+        self._clock = clock
+        self._tokens = float(capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float) -> float:
+        """Take ``amount`` tokens now and return the seconds to wait until they are covered.
+
+        The balance may go negative, which queues later callers behind this one.
+        Requests larger than the bucket are clamped to its capacity.
+        """
+        amount = min(float(amount), self.capacity)
+        with self._lock:
+            now = self._clock()
+            elapsed = max(0.0, now - self._updated)
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+            self._updated = now
+            self._tokens -= amount
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.refill_per_second
+
+    def refund(self, amount: float) -> None:
+        """Give back a reservation that will not be used."""
+        amount = min(float(amount), self.capacity)
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+
+class ProviderRateLimiter:
+    """RPM + TPM buckets keyed by ``(provider_name, model)``."""
+
+    def __init__(
+        self,
+        limits: dict[str, tuple[int, int]] | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        max_wait: float | None = None,
+    ) -> None:
+        self.limits = dict(DEFAULT_RATE_LIMITS if limits is None else limits)
+        self.max_wait = max_wait
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[tuple[str, str], tuple[TokenBucket, TokenBucket]] = {}
+        self._lock = threading.Lock()
+
+    def _buckets_for(self, provider_name: str, model: str) -> tuple[TokenBucket, TokenBucket] | None:
+        limit = self.limits.get(model)
+        if limit is None:
+            return None
+        key = (provider_name, model)
+        with self._lock:
+            buckets = self._buckets.get(key)
+            if buckets is None:
+                rpm, tpm = limit
+                buckets = (
+                    TokenBucket(rpm, rpm / 60.0, clock=self._clock),
+                    TokenBucket(tpm, tpm / 60.0, clock=self._clock),
+                )
+                self._buckets[key] = buckets
+            return buckets
+
+    def acquire(self, provider_name: str, model: str, est_input_tokens: int) -> float:
+        """Block until one request and ``est_input_tokens`` fit the model budget.
+
+        Returns the number of seconds waited (0.0 when unlimited or under budget).
+        Raises ``ProviderRateLimitedError`` without waiting when the wait would
+        exceed ``max_wait`` (default: DECISIONDOC_PROVIDER_TIMEOUT).
+        """
+        buckets = self._buckets_for(provider_name, model)
+        if buckets is None:
+            return 0.0
+        request_bucket, token_bucket = buckets
+        wait = max(request_bucket.reserve(1), token_bucket.reserve(est_input_tokens))
+        max_wait = self.max_wait if self.max_wait is not None else _max_wait_seconds()
+        if wait > max_wait:
+            request_bucket.refund(1)
+            token_bucket.refund(est_input_tokens)
+            _log.warning(
+                "[RateLimit] provider=%s model=%s rejected: %.2fs wait exceeds %.2fs cap",
+                provider_name, model, wait, max_wait,
+            )
+            raise ProviderRateLimitedError(provider_name, model, wait)
+        if wait > 0:
+            _log.info(
+                "[RateLimit] provider=%s model=%s waiting %.2fs for budget",
+                provider_name, model, wait,
+            )
+            self._sleep(wait)
+        return wait
+
+
+_limiter: ProviderRateLimiter | None = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> ProviderRateLimiter:
+    """Return the process-wide limiter, built once from DECISIONDOC_PROVIDER_RATE_LIMITS."""
+    global _limiter
+    if _limiter is None:
+        with _limiter_lock:
+            if _limiter is None:
+                raw = os.getenv("DECISIONDOC_PROVIDER_RATE_LIMITS")
+                _limiter = ProviderRateLimiter(None if raw is None else parse_rate_limits(raw))
+    return _limiter
@@ -1,4 +1,3 @@
-from copy import deepcopy
 from typing import Any
 
 
@@ -47,15 +46,19 @@ def stabilize_bundle(
                    bundle is used, preserving backward compatibility.
     """
     effective = structure if structure is not None else _REQUIRED_STRUCTURE
-    working = deepcopy(bundle) if isinstance(bundle, dict) else {}
+    # Shallow copies only: each patched section is re-bound on ``working`` and
+    # list fields are rebuilt below, so the caller's bundle is never mutated.
+    working = dict(bundle) if isinstance(bundle, dict) else {}
     patched: list[str] = []
 
     for top_key, required_fields in effective.items():
         section = working.get(top_key)
-        if not isinstance(section, dict):
-            working[top_key] = {}
-            section = working[top_key]
+        if isinstance(section, dict):
+            section = dict(section)
+        else:
+            section = {}
             patched.append(f"top_level:{top_key}")
+        working[top_key] = section
 
         for field, default in required_fields.items():
             value = section.get(field)
@@ -85,6 +88,7 @@ def stabilize_bundle(
 
 
 def strip_internal_bundle_fields(bundle: dict[str, Any]) -> dict[str, Any]:
-    clean = deepcopy(bundle)
-    clean.pop(_INTERNAL_MARKER_KEY, None)
-    return clean
+    """Drop the internal marker; a bundle that never got one is returned as-is."""
+    if _INTERNAL_MARKER_KEY not in bundle:
+        return bundle
+    return {k: v for k, v in bundle.items() if k != _INTERNAL_MARKER_KEY}
@@ -59,7 +59,7 @@ def generate(
     payload: GenerateRequest,
     request: Request,
 ) -> GenerateResponse:
-    # Keep sync — providers use anyio.run() internally and require a thread-pool context.
+    # Keep sync — providers make blocking SDK calls and require a thread-pool context.
     return _facade()._run_generate(payload, request)
 
 
@@ -36,7 +36,6 @@ from app.dependencies import require_auth as _require_auth
 from app.maintenance.mode import require_not_maintenance
 from app.middleware.billing import acquire_billing_admission
 from app.observability.logging import log_event
-from app.observability.timing import Timer
 from app.providers.factory import get_provider_for_bundle, get_provider_for_capability
 from app.schemas import (
     EditedExportRequest,
@@ -96,7 +95,7 @@ def generate_export(
     payload: GenerateRequest,
     request: Request,
 ) -> GenerateExportResponse:
-    # Keep sync endpoints to avoid nested event-loop issues because providers use anyio.run internally.
+    # Keep sync endpoints: providers make blocking SDK calls and must run on the thread pool.
     _ensure_procurement_bundle_enabled(payload.bundle_type, request)
     service = request.app.state.service
     storage = request.app.state.storage
@@ -106,27 +105,20 @@ def generate_export(
     ensure_bundle_access(request, payload.bundle_type)
     _ensure_procurement_override_reason_for_downstream(payload, request, tenant_id=tenant_id)
     _mark_procurement_downstream_resolved_context(payload, request, tenant_id=tenant_id)
-    result = service.generate_documents(payload, request_id=request_id, tenant_id=tenant_id)
+    # The service saves the bundle and its exports together after validation.
+    result = service.generate_documents(
+        payload, request_id=request_id, tenant_id=tenant_id, persist_exports=True
+    )
     docs = result["docs"]
     bundle_id = result["metadata"]["bundle_id"]
-    export_timer = Timer()
-    with export_timer.measure("export_ms"):
-        # Pre-compute all file metadata before any writes to keep files/paths consistent
-        planned = [
-            {
-                "doc_type": doc["doc_type"],
-                "markdown": doc["markdown"],
-                "path": storage.get_export_path(bundle_id, doc["doc_type"]),
-            }
-            for doc in docs
-        ]
-        for item in planned:
-            storage.save_export(bundle_id, item["doc_type"], item["markdown"])
-        files = [{"doc_type": item["doc_type"], "path": item["path"]} for item in planned]
-        export_dir = storage.get_export_dir(bundle_id)
+    files = [
+        {"doc_type": doc["doc_type"], "path": storage.get_export_path(bundle_id, doc["doc_type"])}
+        for doc in docs
+    ]
+    export_dir = storage.get_export_dir(bundle_id)
 
     _apply_generate_state(request, result, template_version)
-    request.state.export_ms = export_timer.durations_ms.get("export_ms")
+    request.state.export_ms = result["metadata"].get("timings_ms", {}).get("export_ms")
 
     log_event_data = _build_generate_log_event(request, result, request_id, template_version)
     log_event_data["export_ms"] = request.state.export_ms
@@ -1,9 +1,9 @@
 """Core /generate request/response schemas: DocType, GenerateRequest, feedback, errors."""
 
 from enum import Enum
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, Strict
 
 
 class DocType(str, Enum):
@@ -30,7 +30,11 @@ class GenerateRequest(BaseModel):
     context: str = ""
     constraints: str = ""
     priority: str = "maintainability > security > cost > performance > speed"
-    doc_types: list[DocType] = Field(default_factory=default_doc_types, min_length=1)
+    # Lax only for the enum items so pydantic-core coerces "adr" -> DocType.adr;
+    # the list itself stays strict (no tuples/sets/str).
+    doc_types: list[Annotated[DocType, Strict(False)]] = Field(
+        default_factory=default_doc_types, min_length=1
+    )
     audience: str = "mixed"
     timeline: str = ""        # 예: "3개월", "2025 Q3까지"
     budget_range: str = ""    # 예: "5억 이하", "$500K"
@@ -42,15 +46,6 @@ class GenerateRequest(BaseModel):
     project_id: str | None = None  # optional project linkage
     style_profile_id: str | None = None  # optional style profile chosen in the Web UI
 
-    @field_validator("doc_types", mode="before")
-    @classmethod
-    def parse_doc_types(cls, value):
-        if value is None:
-            return value
-        if not isinstance(value, list):
-            return value
-        return [DocType(item) if isinstance(item, str) else item for item in value]
-
 
 class FreeformRequest(BaseModel):
     """Payload for POST /generate/freeform — unmatched request recording.
@@ -0,0 +1,73 @@
+"""Generate several bundles in one call on a bounded worker pool.
+
+``BatchProcessor.run_batch`` fans a list of ``GenerateRequest`` out over
+``GenerationService.generate_documents``. Every slot is generated on its own,
+so each result carries its own ``request_id``, ``bundle_id`` and usage record;
+repeated requests are left to the exact bundle cache. Provider concurrency
+stays bounded by the service's own provider slots
+(``DECISIONDOC_MAX_CONCURRENT_REQUESTS``).
+"""
+from __future__ import annotations
+
+import concurrent.futures
+from dataclasses import dataclass
+from typing import Any
+
+from app.config import get_max_concurrent_provider_calls
+from app.schemas import GenerateRequest
+
+
+@dataclass
+class BatchItemResult:
+    """Outcome of one batch slot; exactly one of ``result``/``error`` is set."""
+
+    request_id: str
+    result: dict[str, Any] | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BatchProcessor:
+    """Runs many ``generate_documents`` calls against one ``GenerationService``."""
+
+    def __init__(self, service: Any, *, max_workers: int | None = None) -> None:
+        self.service = service
+        self.max_workers = max(1, max_workers or get_max_concurrent_provider_calls())
+
+    def run_batch(
+        self,
+        requests: list[GenerateRequest],
+        *,
+        tenant_id: str,
+        request_id_prefix: str,
+    ) -> list[BatchItemResult]:
+        """Generate every request and return results in input order.
+
+        Failures are captured per slot so one bad request does not sink the batch.
+        """
+        if not requests:
+            return []
+        request_ids = [f"{request_id_prefix}-{idx}" for idx in range(len(requests))]
+        workers = min(self.max_workers, len(requests))
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="batch"
+        ) as pool:
+            futures = [
+                pool.submit(
+                    self.service.generate_documents,
+                    req,
+                    request_id=request_id,
+                    tenant_id=tenant_id,
+                )
+                for req, request_id in zip(requests, request_ids)
+            ]
+            results: list[BatchItemResult] = []
+            for request_id, future in zip(request_ids, futures):
+                try:
+                    results.append(BatchItemResult(request_id, result=future.result()))
+                except Exception as exc:  # noqa: BLE001
+                    results.append(BatchItemResult(request_id, error=exc))
+        return results
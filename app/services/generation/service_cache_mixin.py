@@ -9,11 +9,18 @@ from pathlib import Path
 from typing import Any
 from uuid import uuid4
 
+from app.config import env_is_enabled
+from app.services.semantic_cache import embed_payload, get_semantic_threshold, split_payload
 from app.tenant import require_tenant_id
 
 
 class GenerationCacheMixin:
-    """File-based bundle cache: TTL check, path derivation, atomic read/write, clear."""
+    """File-based bundle cache: TTL check, path derivation, atomic read/write, clear.
+
+    A small in-process LRU (``DECISIONDOC_MEM_CACHE_SIZE``) sits in front of the
+    files and holds the serialized bytes, so repeated requests cost one stat()
+    instead of exists/stat/open/read while every caller still gets its own dict.
+    """
 
     def _is_cache_fresh(self, cache_path: Path) -> bool:
         """Return True if the cache file is within the configured TTL.
@@ -21,12 +28,55 @@ class GenerationCacheMixin:
         TTL is controlled by DECISIONDOC_CACHE_TTL_HOURS (default 24).
         Set to 0 for permanent cache (no expiry).
         """
+        return self._is_cache_time_fresh(cache_path.stat().st_mtime)
+
+    def _is_cache_time_fresh(self, written_at: float) -> bool:
         ttl_hours = int(os.getenv("DECISIONDOC_CACHE_TTL_HOURS", "24"))
         if ttl_hours <= 0:
             return True  # 0 → permanent cache
-        age_hours = (time.time() - cache_path.stat().st_mtime) / 3600
+        age_hours = (time.time() - written_at) / 3600
         return age_hours < ttl_hours
 
+    def _mem_cache_put(self, cache_path: Path, raw: bytes) -> None:
+        if self._mem_cache_size <= 0:
+            return
+        try:
+            st = cache_path.stat()
+        except OSError:
+            return
+        with self._mem_cache_lock:
+            self._mem_cache[cache_path.name] = (st.st_mtime_ns, st.st_size, raw)
+            self._mem_cache.move_to_end(cache_path.name)
+            while len(self._mem_cache) > self._mem_cache_size:
+                self._mem_cache.popitem(last=False)
+
+    def _try_read_memory_cache(self, cache_path: Path) -> dict[str, Any] | None:
+        """Return a fresh copy of the bundle from the in-process LRU, or None.
+
+        A single ``stat()`` confirms the file is unchanged (mtime and size) and
+        still within TTL, so external edits or deletions fall through to disk.
+        """
+        with self._mem_cache_lock:
+            entry = self._mem_cache.get(cache_path.name)
+        if entry is None:
+            return None
+        try:
+            st = cache_path.stat()
+        except OSError:
+            st = None
+        if (
+            st is None
+            or (st.st_mtime_ns, st.st_size) != entry[:2]
+            or not self._is_cache_time_fresh(st.st_mtime)
+        ):
+            with self._mem_cache_lock:
+                self._mem_cache.pop(cache_path.name, None)
+            return None
+        with self._mem_cache_lock:
+            if cache_path.name in self._mem_cache:
+                self._mem_cache.move_to_end(cache_path.name)
+        return json.loads(entry[2])
+
     def _cache_path(
         self,
         provider_name: str,
@@ -37,44 +87,116 @@ class GenerationCacheMixin:
     ) -> Path:
         tenant_id = require_tenant_id(tenant_id)
         canonical = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
-        key = f"{tenant_id}:{provider_name}:{schema_version}:{canonical}"
-        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        # Content-addressed filename, not a security boundary: BLAKE2b is faster
+        # than SHA-256 and 128 bits keeps collisions out of reach for a local cache.
+        # The prefix and payload are fed separately so the (possibly large)
+        # canonical JSON is never copied into a combined key string.
+        hasher = hashlib.blake2b(digest_size=16)
+        hasher.update(f"{tenant_id}:{provider_name}:{schema_version}:".encode("utf-8"))
+        hasher.update(canonical.encode("utf-8"))
+        digest = hasher.hexdigest()
         return self.cache_dir / f"{digest}.json"
 
+    def _semantic_cache_key(
+        self,
+        provider_name: str,
+        schema_version: str,
+        payload: dict[str, Any],
+        *,
+        tenant_id: str,
+    ) -> tuple[str, list[float]] | None:
+        """Return ``(scope, vector)`` for the semantic cache, or None without an embedding model.
+
+        The scope pins tenant, provider, schema, every injected ``_``-prefixed
+        context and all user fields except the free-text ones, so only
+        ``context``/``assumptions`` are matched fuzzily.
+        """
+        tenant_id = require_tenant_id(tenant_id)
+        vec = embed_payload(payload)
+        if vec is None:
+            return None
+        internal = {k: v for k, v in payload.items() if str(k).startswith("_")}
+        exact, _ = split_payload(payload)
+        scope_src = json.dumps(
+            [tenant_id, provider_name, schema_version, internal, exact],
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+        scope = hashlib.sha256(scope_src.encode("utf-8")).hexdigest()
+        return scope, vec
+
+    def _semantic_cache_read(self, scope: str, vec: list[float]) -> dict[str, Any] | None:
+        """Return the nearest fresh cached bundle within the similarity threshold."""
+        match = self._semantic_index.lookup(scope, vec, get_semantic_threshold())
+        if match is None:
+            return None
+        cache_path = self.cache_dir / match[0]
+        if not cache_path.exists() or not self._is_cache_fresh(cache_path):
+            return None
+        return self._try_read_cache(cache_path)
+
+    def _semantic_cache_remember(self, scope: str, vec: list[float], cache_path: Path) -> None:
+        self._semantic_index.add(scope, vec, cache_path.name)
+
     def _try_read_cache(self, cache_path: Path) -> dict[str, Any] | None:
         try:
-            text = cache_path.read_text(encoding="utf-8")
-            parsed = json.loads(text)
+            raw = cache_path.read_bytes()
+            parsed = json.loads(raw)
             if not isinstance(parsed, dict):
                 return None
+            self._mem_cache_put(cache_path, raw)
             return parsed
         except (OSError, ValueError, json.JSONDecodeError):
             return None
 
     def _write_cache_atomic(self, cache_path: Path, bundle: dict[str, Any]) -> None:
-        cache_path.parent.mkdir(parents=True, exist_ok=True)
-        payload = json.dumps(bundle, ensure_ascii=False, indent=2)
+        # Compact separators: cache files are machine-read, indentation only adds bytes.
+        payload = json.dumps(bundle, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
         tmp_path = cache_path.with_name(f"{cache_path.name}.tmp.{uuid4().hex}")
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
         try:
-            with tmp_path.open("w", encoding="utf-8") as f:
-                f.write(payload)
-                f.flush()
-                os.fsync(f.fileno())
+            try:
+                fd = os.open(tmp_path, flags, 0o644)
+            except FileNotFoundError:
+                # __init__ creates cache_dir; only pay for mkdir if it was removed since.
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                fd = os.open(tmp_path, flags, 0o644)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                # The cache is rebuildable, so durability is opt-in.
+                if env_is_enabled("DECISIONDOC_CACHE_FSYNC"):
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
             os.replace(tmp_path, cache_path)
-        finally:
-            if tmp_path.exists():
-                try:
-                    tmp_path.unlink()
-                except OSError:
-                    pass
+        except BaseException:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+            raise
+        self._mem_cache_put(cache_path, payload)
 
     def clear_cache(self) -> int:
         """Delete all cached bundles. Returns the number of files removed."""
+        with self._mem_cache_lock:
+            self._mem_cache.clear()
         count = 0
-        for f in self.cache_dir.glob("*.json"):
+        try:
+            entries = list(os.scandir(self.cache_dir))
+        except OSError:
+            entries = []
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
             try:
-                f.unlink()
+                os.unlink(entry.path)
                 count += 1
             except OSError:
                 pass
+        self._semantic_index.clear()
         return count
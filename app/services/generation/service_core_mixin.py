@@ -1,15 +1,18 @@
 """Core init and top-level ``generate_documents`` orchestration mixin."""
 from __future__ import annotations
 
+import functools
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable
 from uuid import uuid4
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+from jinja2 import Environment, FileSystemLoader, Template, select_autoescape
 
 from app.bundle_catalog.registry import get_bundle_spec
-from app.config import env_is_enabled
+from app.config import env_is_enabled, get_max_concurrent_provider_calls, get_memory_cache_size
 from app.domain.schema import SCHEMA_VERSION
 from app.eval.lints import lint_docs
 from app.observability.timing import Timer
@@ -29,6 +32,7 @@ from app.services.markdown_utils import (
     build_markdown_table,
     build_slide_outline_table,
 )
+from app.services.semantic_cache import SemanticCacheIndex, semantic_cache_enabled
 from app.services.validator import validate_docs
 from app.storage.base import Storage
 from app.tenant import require_tenant_id
@@ -39,6 +43,31 @@ if TYPE_CHECKING:
     from app.storage.state_backend import StateBackend
 
 
+@functools.lru_cache(maxsize=8)
+def _template_env(template_dir: str) -> Environment:
+    """Jinja environment for ``template_dir``, shared by every service built on it.
+
+    Compiled templates live in the environment's own cache, so services
+    constructed per request or per test reuse them instead of re-parsing.
+    """
+    env = Environment(
+        loader=FileSystemLoader(template_dir),
+        autoescape=select_autoescape(
+            enabled_extensions=("html", "htm", "xml"),
+            default_for_string=False,
+            default=False,
+        ),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        # Templates ship with the build; skip the per-render mtime check.
+        auto_reload=False,
+    )
+    env.filters["markdown_table"] = build_markdown_table
+    env.filters["markdown_kv_table"] = build_markdown_kv_table
+    env.filters["slide_outline_table"] = build_slide_outline_table
+    return env
+
+
 class GenerationCoreMixin:
     """``__init__`` plus the ``generate_documents`` pipeline entrypoint."""
 
@@ -72,20 +101,17 @@ class GenerationCoreMixin:
         self.data_dir.mkdir(parents=True, exist_ok=True)
         self.cache_dir = self.data_dir / "cache"
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._semantic_index = SemanticCacheIndex(self.cache_dir / "semantic" / "index.jsonl")
+        self._mem_cache: OrderedDict[str, tuple[int, int, bytes]] = OrderedDict()
+        self._mem_cache_size = get_memory_cache_size()
+        self._mem_cache_lock = threading.Lock()
         self.storage = storage
-        self.env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=select_autoescape(
-                enabled_extensions=("html", "htm", "xml"),
-                default_for_string=False,
-                default=False,
-            ),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        self.env.filters["markdown_table"] = build_markdown_table
-        self.env.filters["markdown_kv_table"] = build_markdown_kv_table
-        self.env.filters["slide_outline_table"] = build_slide_outline_table
+        # Shared across requests so concurrent workers stay within one provider budget.
+        self._provider_slots = threading.BoundedSemaphore(get_max_concurrent_provider_calls())
+        self._provider_cache: tuple[Callable[[], Provider], Provider] | None = None
+        self._provider_lock = threading.Lock()
+        self.env = _template_env(str(template_dir))
+        self._templates: dict[str, Template] = {}
 
     def generate_documents(
         self,
@@ -93,8 +119,13 @@ class GenerationCoreMixin:
         *,
         request_id: str,
         tenant_id: str,
+        persist_exports: bool = False,
     ) -> dict[str, Any]:
-        """Generate one bundle while binding tenant customizations to this call."""
+        """Generate one bundle while binding tenant customizations to this call.
+
+        With ``persist_exports`` the rendered docs are saved next to the bundle in
+        one ``Storage.save_bundle_and_exports`` call once they pass validation.
+        """
         from app.domain.schema import (
             _current_generation_data_dir,
             _current_generation_state_backend,
@@ -114,6 +145,7 @@ class GenerationCoreMixin:
                 requirements,
                 request_id=request_id,
                 tenant_id=tenant_id,
+                persist_exports=persist_exports,
             )
         finally:
             if had_previous_tenant:
@@ -137,6 +169,7 @@ class GenerationCoreMixin:
         *,
         request_id: str,
         tenant_id: str,
+        persist_exports: bool = False,
     ) -> dict[str, Any]:
         bundle_id = str(uuid4())
         payload = requirements.model_dump(mode="json")
@@ -211,8 +244,14 @@ class GenerationCoreMixin:
             payload,
             tenant_id=tenant_id,
         )
+        semantic_key: tuple[str, list[float]] | None = None
         try:
-            if cache_enabled and cache_path.exists() and self._is_cache_fresh(cache_path):
+            memory_cached = self._try_read_memory_cache(cache_path) if cache_enabled else None
+            if memory_cached is not None:
+                bundle = memory_cached
+                cache_hit = True
+                self._validate_bundle_schema(bundle, bundle_spec)
+            elif cache_enabled and cache_path.exists() and self._is_cache_fresh(cache_path):
                 cached = self._try_read_cache(cache_path)
                 if cached is not None:
                     bundle = cached
@@ -235,33 +274,47 @@ class GenerationCoreMixin:
                         usage_totals=usage_totals,
                     )
             else:
-                # Inject web search context if available
-                if self._search_service is not None and self._search_service.is_available():
-                    query_parts = [
-                        str(payload.get("title", "")),
-                        str(payload.get("goal", "")),
-                        str(payload.get("industry", "")),
-                    ]
-                    query = " ".join(p for p in query_parts if p).strip()
-                    if query:
-                        search_results = self._search_service.search(query, num=5)
-                        if search_results:
-                            snippets = "\n".join(
-                                f"{i+1}. [{r.title}] {r.snippet}"
-                                for i, r in enumerate(search_results[:5])
-                            )
-                            payload["_search_context"] = snippets
-
-                provider_attempted = True
-                bundle = self._call_and_prepare_bundle(
-                    provider,
-                    payload,
-                    request_id,
-                    timer,
-                    bundle_spec,
-                    tenant_id=tenant_id,
-                    usage_totals=usage_totals,
+                # Only embedded on an exact miss, and before search context is
+                # injected so lookups and writes agree.
+                if cache_enabled and semantic_cache_enabled():
+                    semantic_key = self._semantic_cache_key(
+                        provider.name, SCHEMA_VERSION, payload, tenant_id=tenant_id
+                    )
+                semantic_cached = (
+                    self._semantic_cache_read(*semantic_key) if semantic_key is not None else None
                 )
+                if semantic_cached is not None:
+                    bundle = semantic_cached
+                    cache_hit = True
+                    self._validate_bundle_schema(bundle, bundle_spec)
+                else:
+                    # Inject web search context if available
+                    if self._search_service is not None and self._search_service.is_available():
+                        query_parts = [
+                            str(payload.get("title", "")),
+                            str(payload.get("goal", "")),
+                            str(payload.get("industry", "")),
+                        ]
+                        query = " ".join(p for p in query_parts if p).strip()
+                        if query:
+                            search_results = self._search_service.search(query, num=5)
+                            if search_results:
+                                snippets = "\n".join(
+                                    f"{i+1}. [{r.title}] {r.snippet}"
+                                    for i, r in enumerate(search_results[:5])
+                                )
+                                payload["_search_context"] = snippets
+
+                    provider_attempted = True
+                    bundle = self._call_and_prepare_bundle(
+                        provider,
+                        payload,
+                        request_id,
+                        timer,
+                        bundle_spec,
+                        tenant_id=tenant_id,
+                        usage_totals=usage_totals,
+                    )
         finally:
             if provider_attempted:
                 _record_usage_sync(
@@ -290,21 +343,30 @@ class GenerationCoreMixin:
             )
         if cache_enabled and not cache_hit:
             self._write_cache_atomic(cache_path, bundle)
+            if semantic_key is not None:
+                self._semantic_cache_remember(*semantic_key, cache_path)
 
-        if self.storage is not None:
+        if self.storage is not None and not persist_exports:
             self.storage.save_bundle(bundle_id, bundle)
-        with timer.measure("render_ms"):
-            docs = self._render_docs(payload, bundle, bundle_spec)
-        with timer.measure("lints_ms"):
-            lint_errors = lint_docs(
-                {doc["doc_type"]: doc["markdown"] for doc in docs},
-                lint_headings_override=bundle_spec.lint_headings_map(),
-                critical_headings_override=bundle_spec.critical_non_empty_headings_map(),
-            )
+        t0 = timer.tic()
+        docs = self._render_docs(payload, bundle, bundle_spec)
+        timer.toc("render_ms", t0)
+        t0 = timer.tic()
+        lint_errors = lint_docs(
+            {doc["doc_type"]: doc["markdown"] for doc in docs},
+            lint_headings_override=bundle_spec.lint_headings_map(),
+            critical_headings_override=bundle_spec.critical_non_empty_headings_map(),
+        )
+        timer.toc("lints_ms", t0)
         if lint_errors:
             raise EvalLintFailedError(lint_errors)
-        with timer.measure("validator_ms"):
-            validate_docs(docs, headings_override=bundle_spec.validator_headings_map())
+        t0 = timer.tic()
+        validate_docs(docs, headings_override=bundle_spec.validator_headings_map())
+        timer.toc("validator_ms", t0)
+        if self.storage is not None and persist_exports:
+            t0 = timer.tic()
+            self.storage.save_bundle_and_exports(bundle_id, bundle, docs)
+            timer.toc("export_ms", t0)
         # ── Capture generation context for fine-tune collection ──────────────
         # system_prompt was captured in thread-local by build_bundle_prompt().
         # Collect it now (before spawning background thread) to avoid data races.
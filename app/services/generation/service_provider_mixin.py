@@ -39,15 +39,16 @@ class GenerationProviderCallMixin:
     ) -> dict[str, Any]:
         """Call the provider, stabilize, strip internal fields, and validate schema."""
         usage_totals = usage_totals if usage_totals is not None else {}
-        with timer.measure("provider_ms"):
-            bundle = self._call_provider_with_retry(
-                provider,
-                payload,
-                request_id,
-                bundle_spec,
-                tenant_id=tenant_id,
-                usage_totals=usage_totals,
-            )
+        t0 = timer.tic()
+        bundle = self._call_provider_with_retry(
+            provider,
+            payload,
+            request_id,
+            bundle_spec,
+            tenant_id=tenant_id,
+            usage_totals=usage_totals,
+        )
+        timer.toc("provider_ms", t0)
         bundle = stabilize_bundle(bundle, structure=bundle_spec.stabilizer_structure())
         bundle = strip_internal_bundle_fields(bundle)
         bundle = _apply_finished_doc_quality_guard(
@@ -96,13 +97,14 @@ class GenerationProviderCallMixin:
         )
         try:
             try:
-                return provider.generate_bundle(
-                    payload,
-                    schema_version=SCHEMA_VERSION,
-                    request_id=request_id,
-                    bundle_spec=bundle_spec,
-                    feedback_hints=feedback_hints,
-                )
+                with self._provider_slots:
+                    return provider.generate_bundle(
+                        payload,
+                        schema_version=SCHEMA_VERSION,
+                        request_id=request_id,
+                        bundle_spec=bundle_spec,
+                        feedback_hints=feedback_hints,
+                    )
             except Exception as exc:
                 raise ProviderFailedError("Provider failed.") from exc
         finally:
@@ -163,7 +165,8 @@ class GenerationProviderCallMixin:
 
         Checks ModelRegistry for an active fine-tuned model first.  If found,
         returns an OpenAI provider using that model_id.  Otherwise falls back to
-        the injected ``provider_factory`` so that tests keep full DI control.
+        the injected ``provider_factory`` so that tests keep full DI control; its
+        result is built once and reused until ``provider_factory`` is replaced.
         """
         tenant_id = require_tenant_id(tenant_id)
         from app.storage.model_registry import get_model_registry
@@ -179,7 +182,18 @@ class GenerationProviderCallMixin:
 
             return get_provider(model_override=active_model["model_id"])
 
-        try:
-            return self.provider_factory()
-        except Exception as exc:
-            raise ProviderFailedError("Provider failed.") from exc
+        factory = self.provider_factory
+        cached = self._provider_cache
+        if cached is not None and cached[0] is factory:
+            return cached[1]
+        with self._provider_lock:
+            cached = self._provider_cache
+            if cached is not None and cached[0] is factory:
+                return cached[1]
+            try:
+                provider = factory()
+            except Exception as exc:
+                raise ProviderFailedError("Provider failed.") from exc
+            # Reused across requests so SDK clients keep their connection pools warm.
+            self._provider_cache = (factory, provider)
+            return provider
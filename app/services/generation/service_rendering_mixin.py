@@ -1,15 +1,33 @@
 """Document rendering (Jinja2) and provider-bundle schema validation mixin."""
 from __future__ import annotations
 
+import concurrent.futures
 from typing import Any
 
+from jinja2 import Template
+
 from app.bundle_catalog.spec import BundleSpec
+from app.config import is_parallel_render_enabled
 from app.services.generation.errors import ProviderFailedError
 
+# Opt-in (DECISIONDOC_PARALLEL_RENDER); Jinja rendering holds the GIL for most of
+# its work, so this only pays off for bundles with many large templates.
+_render_executor: concurrent.futures.ThreadPoolExecutor = (
+    concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="render")
+)
+
 
 class GenerationRenderingMixin:
     """Renders bundle docs to markdown and validates provider bundle shape."""
 
+    def _get_template(self, template_file: str) -> Template:
+        """Return the compiled template, loading it from ``self.env`` only once."""
+        template = self._templates.get(template_file)
+        if template is None:
+            template = self.env.get_template(template_file)
+            self._templates[template_file] = template
+        return template
+
     def _render_docs(
         self,
         payload: dict[str, Any],
@@ -24,32 +42,37 @@ class GenerationRenderingMixin:
         """
         bundle_type = payload.get("bundle_type", "tech_decision") or "tech_decision"
         if bundle_type == "tech_decision":
-            # Honor the legacy doc_types filter.
-            doc_keys = [
-                dt if isinstance(dt, str) else dt.value
-                for dt in payload.get("doc_types", bundle_spec.doc_keys)
-            ]
+            # Honor the legacy doc_types filter. ``payload`` comes from
+            # ``model_dump(mode="json")`` so the entries are already plain strings.
+            doc_keys = payload.get("doc_types", bundle_spec.doc_keys)
         else:
             doc_keys = bundle_spec.doc_keys
 
-        docs: list[dict[str, str]] = []
+        base_context = {
+            "title": payload["title"],
+            "goal": payload["goal"],
+            "context": payload.get("context", ""),
+            "procurement_context": payload.get("_procurement_context", ""),
+            "constraints": payload.get("constraints", ""),
+            "priority": payload.get("priority", ""),
+            "audience": payload.get("audience", ""),
+        }
+        jobs: list[tuple[str, Template, dict[str, Any]]] = []
         for doc_key in doc_keys:
             doc_spec = bundle_spec.get_doc(doc_key)
             if doc_spec is None:
                 continue  # skip unknown keys gracefully
-            context = {
-                "title": payload["title"],
-                "goal": payload["goal"],
-                "context": payload.get("context", ""),
-                "procurement_context": payload.get("_procurement_context", ""),
-                "constraints": payload.get("constraints", ""),
-                "priority": payload.get("priority", ""),
-                "audience": payload.get("audience", ""),
-                **bundle.get(doc_key, {}),
-            }
-            markdown = self.env.get_template(doc_spec.template_file).render(**context).strip() + "\n"
-            docs.append({"doc_type": doc_key, "markdown": markdown})
-        return docs
+            context = {**base_context, **bundle.get(doc_key, {})}
+            jobs.append((doc_key, self._get_template(doc_spec.template_file), context))
+
+        if len(jobs) > 1 and is_parallel_render_enabled():
+            rendered = list(_render_executor.map(lambda job: job[1].render(**job[2]), jobs))
+        else:
+            rendered = [template.render(**context) for _, template, context in jobs]
+        return [
+            {"doc_type": doc_key, "markdown": markdown.strip() + "\n"}
+            for (doc_key, _, _), markdown in zip(jobs, rendered)
+        ]
 
     def _validate_bundle_schema(self, bundle: Any, bundle_spec: BundleSpec) -> None:
         if not isinstance(bundle, dict):
@@ -57,27 +80,22 @@ class GenerationRenderingMixin:
                 f"Provider returned invalid bundle: expected dict, got {type(bundle).__name__}"
             )
 
-        schema = bundle_spec.json_schema
-        required_top = schema["required"]
-        properties = schema["properties"]
-        for key in required_top:
+        for key, checks in bundle_spec.validation_plan:
             if key not in bundle:
                 raise ProviderFailedError(
                     f"Provider returned invalid bundle: missing top-level key '{key}'"
                 )
-            if not isinstance(bundle[key], dict):
+            section = bundle[key]
+            if not isinstance(section, dict):
                 raise ProviderFailedError(
-                    f"Provider returned invalid bundle: '{key}' must be a dict, got {type(bundle[key]).__name__}"
+                    f"Provider returned invalid bundle: '{key}' must be a dict, got {type(section).__name__}"
                 )
-            required_fields = properties[key]["required"]
-            for field in required_fields:
-                if field not in bundle[key]:
+            for field, expected_type, string_items in checks:
+                if field not in section:
                     raise ProviderFailedError(
                         f"Provider returned invalid bundle: missing field '{key}.{field}'"
                     )
-                value = bundle[key][field]
-                field_schema = properties[key]["properties"][field]
-                expected_type = field_schema["type"]
+                value = section[field]
                 if expected_type == "string" and not isinstance(value, str):
                     raise ProviderFailedError(
                         f"Provider returned invalid bundle: '{key}.{field}' must be a string, got {type(value).__name__}"
@@ -91,10 +109,8 @@ class GenerationRenderingMixin:
                         raise ProviderFailedError(
                             f"Provider returned invalid bundle: '{key}.{field}' must be an array, got {type(value).__name__}"
                         )
-                    # Only validate items as strings when the schema declares items.type == "string".
                     # Arrays of objects (e.g. slide_outline) are accepted as-is.
-                    items_type = field_schema.get("items", {}).get("type")
-                    if items_type == "string":
+                    if string_items:
                         for i, item in enumerate(value):
                             if not isinstance(item, str):
                                 raise ProviderFailedError(
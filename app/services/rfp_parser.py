@@ -59,7 +59,7 @@ def parse_rfp_fields(
     """Extract structured fields from RFP/공고문 text via LLM.
 
     This function is **synchronous** — the provider's ``generate_raw`` method
-    is sync (uses anyio internally).
+    is sync (blocking SDK call).
 
     Args:
         attachment_text: Combined text extracted from attached RFP files.
@@ -0,0 +1,197 @@
+"""app/services/semantic_cache.py — Similarity lookup in front of the exact bundle cache.
+
+The exact cache keys on a hash of the canonical payload, so a reworded
+``context`` or reordered ``assumptions`` always miss. This layer embeds that
+free text with a sentence-embedding model and returns the closest cached
+bundle path when the cosine similarity clears the threshold.
+
+Only ``context`` and ``assumptions`` are matched fuzzily. Every other user
+field (title, goal, constraints, budget, doc types, ...) is part of the scope
+after case/whitespace normalization, together with tenant, provider, schema
+and injected ``_`` context, so a request that names a different database or
+budget can never be served another request's bundle.
+
+Embeddings come from ``sentence-transformers`` (optional dependency, see
+requirements-integrations.txt). Without it the layer stays inert and only the
+exact cache is used.
+
+The index is an append-only JSONL file. Each process keeps the entries in
+memory, bucketed by scope, and picks up lines appended by other processes on
+the next lookup.
+
+Environment variables:
+    DECISIONDOC_SEMANTIC_CACHE      — "1" to enable (default off; needs DECISIONDOC_CACHE_ENABLED)
+    DECISIONDOC_SEMANTIC_MODEL      — sentence-transformers model (default all-MiniLM-L6-v2)
+    DECISIONDOC_SEMANTIC_THRESHOLD  — minimum cosine similarity for a hit (default 0.92)
+"""
+from __future__ import annotations
+
+import functools
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from app.config import env_is_enabled
+
+_log = logging.getLogger("decisiondoc.cache.semantic")
+
+_DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+# Free text matched by similarity; every other user field must match exactly.
+_FUZZY_FIELDS = frozenset({"context", "assumptions"})
+
+
+def semantic_cache_enabled() -> bool:
+    return env_is_enabled("DECISIONDOC_SEMANTIC_CACHE")
+
+
+def get_semantic_threshold() -> float:
+    try:
+        value = float(os.getenv("DECISIONDOC_SEMANTIC_THRESHOLD", "0.92"))
+    except ValueError:
+        return 0.92
+    return min(1.0, max(0.0, value))
+
+
+def get_semantic_model_name() -> str:
+    return os.getenv("DECISIONDOC_SEMANTIC_MODEL", "").strip() or _DEFAULT_MODEL
+
+
+@functools.lru_cache(maxsize=4)
+def _load_embedder(model_name: str) -> Callable[[str], list[float]] | None:
+    """Return an L2-normalized text encoder, or None when the model can't be loaded."""
+    try:
+        from sentence_transformers import SentenceTransformer  # type: ignore
+    except ImportError:
+        _log.warning(
+            "DECISIONDOC_SEMANTIC_CACHE is on but sentence-transformers is not installed; "
+            "install requirements-integrations.txt. Using the exact cache only."
+        )
+        return None
+    try:
+        model = SentenceTransformer(model_name)
+    except Exception:  # noqa: BLE001 - download/config errors must not break generation
+        _log.warning("Failed to load semantic cache model %s", model_name, exc_info=True)
+        return None
+
+    def _encode(text: str) -> list[float]:
+        return [float(v) for v in model.encode(text, normalize_embeddings=True)]
+
+    return _encode
+
+
+def _normalize(value: Any) -> Any:
+    if isinstance(value, str):
+        return " ".join(value.lower().split())
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _normalize(item) for key, item in value.items()}
+    return value
+
+
+def split_payload(payload: dict[str, Any]) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Return ``(exact, fuzzy)``: normalized fields a hit must match, and the free text to embed.
+
+    ``_``-prefixed internal keys are in neither; callers scope on them separately.
+    """
+    exact: dict[str, Any] = {}
+    fuzzy: dict[str, Any] = {}
+    for key, value in payload.items():
+        if str(key).startswith("_"):
+            continue
+        if key in _FUZZY_FIELDS:
+            fuzzy[key] = value
+        else:
+            exact[key] = _normalize(value)
+    return exact, fuzzy
+
+
+def _payload_text(value: Any) -> str:
+    if isinstance(value, dict):
+        return "\n".join(_payload_text(item) for _, item in sorted(value.items()))
+    if isinstance(value, (list, tuple)):
+        return "\n".join(_payload_text(item) for item in value)
+    if value is None:
+        return ""
+    return str(value)
+
+
+def embed_payload(payload: dict[str, Any]) -> list[float] | None:
+    """Embed the fuzzy fields of ``payload``; None when no embedding model is available."""
+    embed = _load_embedder(get_semantic_model_name())
+    if embed is None:
+        return None
+    return embed(_payload_text(split_payload(payload)[1]))
+
+
+class SemanticCacheIndex:
+    """Append-only JSONL index of ``(scope, cache file, vector)`` entries."""
+
+    def __init__(self, index_path: Path) -> None:
+        self.index_path = Path(index_path)
+        self._lock = threading.Lock()
+        self._by_scope: dict[str, dict[str, list[float]]] = {}
+        self._offset = 0
+
+    def _sync(self) -> None:
+        """Load lines appended since the last sync, by this or any other process."""
+        try:
+            with open(self.index_path, "rb") as f:
+                if os.fstat(f.fileno()).st_size < self._offset:
+                    # Cleared (and possibly refilled) elsewhere: start over.
+                    self._by_scope, self._offset = {}, 0
+                f.seek(self._offset)
+                chunk = f.read()
+        except FileNotFoundError:
+            self._by_scope, self._offset = {}, 0
+            return
+        except OSError:
+            return
+        # A writer may be mid-append; leave an unterminated last line for next time.
+        complete = chunk.rfind(b"\n") + 1
+        for line in chunk[:complete].splitlines():
+            try:
+                entry = json.loads(line)
+                scope, cache_file, vec = str(entry["scope"]), str(entry["file"]), entry["vec"]
+                self._by_scope.setdefault(scope, {})[cache_file] = [float(v) for v in vec]
+            except (ValueError, KeyError, TypeError):
+                continue
+        self._offset += complete
+
+    def lookup(self, scope: str, vec: list[float], threshold: float) -> tuple[str, float] | None:
+        """Return ``(cache_file_name, score)`` of the best match at or above ``threshold``."""
+        with self._lock:
+            self._sync()
+            candidates = list(self._by_scope.get(scope, {}).items())
+        best: tuple[str, float] | None = None
+        for cache_file, entry_vec in candidates:
+            score = sum(a * b for a, b in zip(vec, entry_vec))
+            if score >= threshold and (best is None or score > best[1]):
+                best = (cache_file, score)
+        return best
+
+    def add(self, scope: str, vec: list[float], cache_file: str) -> None:
+        line = json.dumps(
+            {"scope": scope, "file": cache_file, "vec": [round(v, 6) for v in vec]},
+            separators=(",", ":"),
+        ).encode("utf-8") + b"\n"
+        with self._lock:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            # One O_APPEND write per entry: concurrent writers never overwrite each other.
+            fd = os.open(self.index_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+            self._sync()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_scope, self._offset = {}, 0
+            try:
+                self.index_path.unlink()
+            except OSError:
+                pass
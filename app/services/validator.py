@@ -1,7 +1,14 @@
-from dataclasses import dataclass
+import functools
+import re
+from dataclasses import dataclass, field
 
 from app.domain.headings import VALIDATOR_HEADINGS
 
+# Level-2 markdown heading lines, trailing whitespace excluded.
+_HEADING_RE = re.compile(r"(?m)^(## [^\n]*?)[ \t\r]*$")
+# Non-empty "- " bullet lines, indented or not (same as ``line.strip().startswith("- ")``).
+_BULLET_RE = re.compile(r"(?m)^[^\S\n]*- [^\S\n]*\S")
+
 
 @dataclass
 class DocumentValidationError(Exception):
@@ -9,6 +16,50 @@ class DocumentValidationError(Exception):
     missing: list[str]
 
 
+@dataclass
+class BundleValidationError(DocumentValidationError):
+    """Raised by :func:`validate_docs` when more than one document fails.
+
+    ``doc_type`` is the first failing document, ``missing`` prefixes each entry
+    with its document key, and ``failures`` keeps the per-document errors.
+    """
+
+    failures: list[DocumentValidationError] = field(default_factory=list)
+
+
+def _index_sections(markdown: str) -> dict[str, tuple[int, int]]:
+    """Map each ``## `` heading line to the ``(start, end)`` offsets of its body.
+
+    A body runs to the newline before the next ``## `` heading, matching
+    :func:`_extract_section`; the first occurrence of a repeated heading wins.
+    """
+    matches = list(_HEADING_RE.finditer(markdown))
+    sections: dict[str, tuple[int, int]] = {}
+    for idx, match in enumerate(matches):
+        end = matches[idx + 1].start() - 1 if idx + 1 < len(matches) else len(markdown)
+        sections.setdefault(match.group(1), (match.end(1), end))
+    return sections
+
+
+@functools.lru_cache(maxsize=256)
+def _substring_matcher(headings: tuple[str, ...]) -> re.Pattern[str]:
+    """Zero-width alternation reporting the longest of *headings* at each position."""
+    ordered = sorted(headings, key=len, reverse=True)
+    return re.compile("(?=(" + "|".join(re.escape(h) for h in ordered) + "))")
+
+
+def _present_as_substring(markdown: str, headings: list[str]) -> set[str]:
+    """Return the *headings* that occur anywhere in *markdown*, in one scan.
+
+    A heading hidden by a longer match at the same position is a prefix of that
+    match, so prefix checks against the reported matches recover it.
+    """
+    if not headings:
+        return set()
+    found = {m.group(1) for m in _substring_matcher(tuple(headings)).finditer(markdown)}
+    return {h for h in headings if any(f.startswith(h) for f in found)}
+
+
 def _extract_section(markdown: str, heading: str) -> str:
     start = markdown.find(heading)
     if start == -1:
@@ -36,13 +87,22 @@ def validate_doc(
     effective = headings_override if headings_override is not None else VALIDATOR_HEADINGS
     missing: list[str] = []
     headings = effective.get(doc_type, [])
-    for heading in headings:
-        if heading not in markdown:
+    # One pass indexes the heading lines; a single substring scan covers the
+    # required headings that are not a full heading line of their own.
+    sections = _index_sections(markdown)
+    unmatched = [heading for heading in headings if heading not in sections]
+    present = _present_as_substring(markdown, unmatched)
+    for heading in unmatched:
+        if heading not in present:
             missing.append(f"missing_heading:{heading}")
 
     if doc_type == "adr" and "## Options" in markdown:
-        options_section = _extract_section(markdown, "## Options")
-        options_count = sum(1 for line in options_section.splitlines() if line.strip().startswith("- "))
+        span = sections.get("## Options")
+        if span is not None:
+            options_section = markdown[span[0]:span[1]]
+        else:
+            options_section = _extract_section(markdown, "## Options")
+        options_count = len(_BULLET_RE.findall(options_section))
         if options_count < 2:
             missing.append("adr_options_lt_2")
 
@@ -56,13 +116,30 @@ def validate_docs(
 ) -> None:
     """Validate all rendered documents in a bundle.
 
+    Every document is checked before raising, so one error reports all of the
+    bundle's problems. A single failing document raises its own
+    :class:`DocumentValidationError`; several raise a :class:`BundleValidationError`.
+
     Args:
         docs:              List of ``{"doc_type": ..., "markdown": ...}`` dicts.
         headings_override: Forwarded to each :func:`validate_doc` call.
     """
+    failures: list[DocumentValidationError] = []
     for doc in docs:
-        validate_doc(
-            doc_type=doc["doc_type"],
-            markdown=doc["markdown"],
-            headings_override=headings_override,
+        try:
+            validate_doc(
+                doc_type=doc["doc_type"],
+                markdown=doc["markdown"],
+                headings_override=headings_override,
+            )
+        except DocumentValidationError as exc:
+            failures.append(exc)
+
+    if len(failures) == 1:
+        raise failures[0]
+    if failures:
+        raise BundleValidationError(
+            doc_type=failures[0].doc_type,
+            missing=[f"{f.doc_type}:{item}" for f in failures for item in f.missing],
+            failures=failures,
         )
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 import os
 import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Any
-from uuid import uuid4
+from typing import Any, Callable, TextIO
 
 _log = logging.getLogger("decisiondoc.storage")
 
@@ -16,17 +16,30 @@ class StorageFailedError(Exception):
     pass
 
 
-def atomic_write_text(path: Path, text: str) -> None:
-    """Write *text* to *path* atomically via tmp-file + os.replace.
+_TMP_COUNTER = itertools.count()
 
-    Safe against partial writes / crashes — readers always see a
-    complete file or the previous version.
+
+def temp_path_for(path: Path) -> Path:
+    """Sibling temp path for an atomic write, unique per process, thread and call.
+
+    Built from pid/thread id/counter rather than uuid4 to skip the urandom read.
+    """
+    return path.with_name(
+        f"{path.name}.tmp.{os.getpid()}.{threading.get_ident()}.{next(_TMP_COUNTER)}"
+    )
+
+
+def atomic_write(path: Path, write: Callable[[TextIO], Any]) -> None:
+    """Atomically replace *path* with whatever ``write(fp)`` streams into a temp file.
+
+    The temp file is opened as UTF-8 text with a 1 MiB buffer, fsynced, then
+    moved over *path* with os.replace; on any failure it is removed.
     """
     path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_name(f"{path.name}.tmp.{uuid4().hex[:12]}")
+    tmp = temp_path_for(path)
     try:
-        with tmp.open("w", encoding="utf-8") as f:
-            f.write(text)
+        with open(tmp, "w", encoding="utf-8", buffering=1 << 20) as f:
+            write(f)
             f.flush()
             os.fsync(f.fileno())
         os.replace(tmp, path)
@@ -41,10 +54,19 @@ def atomic_write_text(path: Path, text: str) -> None:
                 pass
 
 
+def atomic_write_text(path: Path, text: str) -> None:
+    """Write *text* to *path* atomically via tmp-file + os.replace.
+
+    Safe against partial writes / crashes — readers always see a
+    complete file or the previous version.
+    """
+    atomic_write(path, lambda f: f.write(text))
+
+
 def atomic_write_bytes(path: Path, raw: bytes) -> None:
     """Write *raw* bytes to *path* atomically via tmp-file + os.replace."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    tmp = path.with_name(f"{path.name}.tmp.{uuid4().hex[:12]}")
+    tmp = temp_path_for(path)
     try:
         with tmp.open("wb") as f:
             f.write(raw)
@@ -116,6 +138,25 @@ class Storage(ABC):
     def save_export(self, bundle_id: str, doc_type: str, markdown: str) -> None:
         raise NotImplementedError
 
+    def save_exports_batch(self, bundle_id: str, docs: list[dict[str, str]]) -> None:
+        """Save every ``{"doc_type": ..., "markdown": ...}`` export of a bundle.
+
+        Backends that can amortize per-file overhead override this; the default
+        saves one export at a time.
+        """
+        for doc in docs:
+            self.save_export(bundle_id, doc["doc_type"], doc["markdown"])
+
+    def save_bundle_and_exports(
+        self, bundle_id: str, bundle: dict[str, Any], docs: list[dict[str, str]]
+    ) -> None:
+        """Persist a bundle together with its exports; the bundle is written last.
+
+        Readers that find the bundle can rely on its exports already existing.
+        """
+        self.save_exports_batch(bundle_id, docs)
+        self.save_bundle(bundle_id, bundle)
+
     @abstractmethod
     def get_export_path(self, bundle_id: str, doc_type: str) -> str:
         raise NotImplementedError
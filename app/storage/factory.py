@@ -3,6 +3,7 @@ from pathlib import Path
 
 from app.storage.base import Storage, StorageFailedError
 from app.storage.local import LocalStorage
+from app.storage.memory import MemoryStorage
 from app.storage.s3 import s3_from_env
 
 
@@ -14,4 +15,6 @@ def get_storage() -> Storage:
         return LocalStorage(data_dir=data_dir, exports_dir=exports_dir)
     if storage_kind == "s3":
         return s3_from_env()
+    if storage_kind == "memory":
+        return MemoryStorage()
     raise StorageFailedError("Storage operation failed.")
@@ -1,15 +1,34 @@
+import functools
 import json
 import logging
+import os
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, TextIO
 
-from app.storage.base import Storage, StorageFailedError, atomic_write_text
+from app.config import is_relaxed_durability
+from app.storage.base import Storage, StorageFailedError, atomic_write, temp_path_for
 
 _log = logging.getLogger("decisiondoc.storage.local")
 
 _MAX_BUNDLE_SIZE_BYTES = 50 * 1024 * 1024  # 50 MB guard-rail
 
 
+def _write_text(f: TextIO, text: str) -> None:
+    f.write(text)
+
+
+def _fsync_dir(path: Path) -> None:
+    """Flush directory entries (renames) to disk; a no-op where directories can't be opened."""
+    flags = getattr(os, "O_DIRECTORY", None)
+    if flags is None:
+        return
+    fd = os.open(path, os.O_RDONLY | flags)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
 class LocalStorage(Storage):
     def __init__(self, data_dir: Path | str, exports_dir: Path | str | None = None) -> None:
         self.data_dir = Path(data_dir)
@@ -33,19 +52,22 @@ class LocalStorage(Storage):
 
     def load_bundle(self, bundle_id: str) -> dict[str, Any] | None:
         path = self._bundle_path(bundle_id)
-        if not path.exists():
-            return None
         try:
-            size = path.stat().st_size
-            if size > _MAX_BUNDLE_SIZE_BYTES:
-                _log.warning(
-                    "Bundle file too large to load (%d MB > %d MB limit): %s",
-                    size // 1_048_576,
-                    _MAX_BUNDLE_SIZE_BYTES // 1_048_576,
-                    path,
-                )
-                return None
-            return json.loads(path.read_text(encoding="utf-8"))
+            # open + fstat on the handle: no separate exists()/stat() path lookups.
+            with open(path, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > _MAX_BUNDLE_SIZE_BYTES:
+                    _log.warning(
+                        "Bundle file too large to load (%d MB > %d MB limit): %s",
+                        size // 1_048_576,
+                        _MAX_BUNDLE_SIZE_BYTES // 1_048_576,
+                        path,
+                    )
+                    return None
+                raw = f.read()
+            return json.loads(raw)
+        except FileNotFoundError:
+            return None
         except (OSError, ValueError, json.JSONDecodeError) as exc:
             _log.warning("Failed to load bundle %s: %s", bundle_id, exc)
             return None
@@ -54,6 +76,68 @@ class LocalStorage(Storage):
         path = self._export_path(bundle_id, doc_type)
         self._atomic_write_text(path, markdown)
 
+    def save_exports_batch(self, bundle_id: str, docs: list[dict[str, str]]) -> None:
+        """Write all exports of a bundle with one directory fsync instead of one per file."""
+        self._write_staged(self._export_writes(bundle_id, docs))
+
+    def save_bundle_and_exports(
+        self, bundle_id: str, bundle: dict[str, Any], docs: list[dict[str, str]]
+    ) -> None:
+        """Write the exports and the bundle JSON as one staged batch, bundle renamed last."""
+        writes = self._export_writes(bundle_id, docs)
+        writes.append(
+            (
+                self._bundle_path(bundle_id),
+                lambda f: json.dump(bundle, f, ensure_ascii=False, indent=2),
+            )
+        )
+        self._write_staged(writes)
+
+    def _export_writes(
+        self, bundle_id: str, docs: list[dict[str, str]]
+    ) -> list[tuple[Path, Callable[[TextIO], Any]]]:
+        return [
+            (self._export_path(bundle_id, doc["doc_type"]), functools.partial(_write_text, text=doc["markdown"]))
+            for doc in docs
+        ]
+
+    def _write_staged(self, writes: list[tuple[Path, Callable[[TextIO], Any]]]) -> None:
+        """Write every target to a temp file, rename them in order, then fsync each directory once.
+
+        Each parent directory is created once. Every temp file is fsynced before
+        any rename so a crash never exposes a truncated file under its final
+        name; ``DECISIONDOC_DURABILITY=relaxed`` skips those per-file fsyncs.
+        """
+        sync_files = not is_relaxed_durability()
+        staged: list[tuple[Path, Path]] = []
+        dirs: list[Path] = []
+        try:
+            for path, write in writes:
+                if path.parent not in dirs:
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    dirs.append(path.parent)
+                tmp = temp_path_for(path)
+                staged.append((tmp, path))
+                with open(tmp, "w", encoding="utf-8", buffering=1 << 20) as f:
+                    write(f)
+                    if sync_files:
+                        f.flush()
+                        os.fsync(f.fileno())
+            for tmp, path in staged:
+                os.replace(tmp, path)
+            for directory in dirs:
+                _fsync_dir(directory)
+        except Exception as exc:
+            _log.warning("Batch write failed for %s", dirs, exc_info=True)
+            raise StorageFailedError("Storage operation failed.") from exc
+        finally:
+            for tmp, _ in staged:
+                if tmp.exists():
+                    try:
+                        tmp.unlink()
+                    except OSError:
+                        pass
+
     def get_export_path(self, bundle_id: str, doc_type: str) -> str:
         return str(self._export_path(bundle_id, doc_type))
 
@@ -61,14 +145,14 @@ class LocalStorage(Storage):
         return str(self.exports_dir / bundle_id)
 
     def _atomic_write_json(self, path: Path, payload: dict[str, Any]) -> None:
-        try:
-            data = json.dumps(payload, ensure_ascii=False, indent=2)
-        except (TypeError, ValueError) as exc:
-            raise StorageFailedError("Storage operation failed.") from exc
-        self._atomic_write_text(path, data)
+        # json.dump streams into the temp file, so no full-document string is built.
+        self._atomic_write(path, lambda f: json.dump(payload, f, ensure_ascii=False, indent=2))
 
     def _atomic_write_text(self, path: Path, text: str) -> None:
+        self._atomic_write(path, lambda f: f.write(text))
+
+    def _atomic_write(self, path: Path, write: Callable[[TextIO], Any]) -> None:
         try:
-            atomic_write_text(path, text)
+            atomic_write(path, write)
         except Exception as exc:
             raise StorageFailedError("Storage operation failed.") from exc
@@ -0,0 +1,47 @@
+import json
+import threading
+from typing import Any
+
+from app.storage.base import Storage
+
+
+class MemoryStorage(Storage):
+    """Process-local bundle/export storage for tests and throwaway runs.
+
+    Bundles are kept as serialized JSON so every ``load_bundle`` returns a fresh
+    copy, matching the isolation callers get from the disk and S3 backends.
+    Nothing survives a restart.
+    """
+
+    def __init__(self) -> None:
+        self._bundles: dict[str, str] = {}
+        self._exports: dict[tuple[str, str], str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def kind(self) -> str:
+        return "memory"
+
+    def save_bundle(self, bundle_id: str, bundle: dict[str, Any]) -> None:
+        raw = json.dumps(bundle, ensure_ascii=False)
+        with self._lock:
+            self._bundles[bundle_id] = raw
+
+    def load_bundle(self, bundle_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            raw = self._bundles.get(bundle_id)
+        return None if raw is None else json.loads(raw)
+
+    def save_export(self, bundle_id: str, doc_type: str, markdown: str) -> None:
+        with self._lock:
+            self._exports[(bundle_id, doc_type)] = markdown
+
+    def load_export(self, bundle_id: str, doc_type: str) -> str | None:
+        with self._lock:
+            return self._exports.get((bundle_id, doc_type))
+
+    def get_export_path(self, bundle_id: str, doc_type: str) -> str:
+        return f"memory://exports/{bundle_id}/{doc_type}.md"
+
+    def get_export_dir(self, bundle_id: str) -> str:
+        return f"memory://exports/{bundle_id}/"
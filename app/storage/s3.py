@@ -1,12 +1,20 @@
+import concurrent.futures
+import io
 import json
 import logging
 import os
+import threading
 from typing import Any
 
 from app.storage.base import Storage, StorageFailedError
 
 _log = logging.getLogger("decisiondoc.storage.s3")
 
+_MAX_POOL_CONNECTIONS = 16
+_MAX_BATCH_WORKERS = 8
+_MULTIPART_THRESHOLD_BYTES = 8 * 1024 * 1024
+_MULTIPART_CONCURRENCY = 8
+
 
 def _describe_storage_exception(exc: Exception) -> str:
     parts = [type(exc).__name__]
@@ -29,6 +37,31 @@ def _describe_storage_exception(exc: Exception) -> str:
     return " ".join(parts)
 
 
+_shared_client: Any | None = None
+_shared_client_lock = threading.Lock()
+
+
+def shared_s3_client() -> Any:
+    """Process-wide boto3 S3 client.
+
+    Building a client loads the botocore service model and its own connection
+    pool, so bundle storage and S3 state storage share one. boto3 clients are
+    thread-safe, but creating them on the default session is not, so the first
+    build happens under a lock. ImportError propagates for the caller to map.
+    """
+    global _shared_client
+    if _shared_client is None:
+        with _shared_client_lock:
+            if _shared_client is None:
+                import boto3  # type: ignore
+                from botocore.config import Config  # type: ignore
+
+                # Enough pooled keep-alive connections for save_exports_batch's parallel puts.
+                config = Config(max_pool_connections=_MAX_POOL_CONNECTIONS, tcp_keepalive=True)
+                _shared_client = boto3.client("s3", config=config)
+    return _shared_client
+
+
 class S3Storage(Storage):
     def __init__(
         self,
@@ -49,10 +82,9 @@ class S3Storage(Storage):
         if self._s3_client is not None:
             return self._s3_client
         try:
-            import boto3  # type: ignore
+            self._s3_client = shared_s3_client()
         except ImportError as exc:
             raise StorageFailedError("Storage operation failed.") from exc
-        self._s3_client = boto3.client("s3")
         return self._s3_client
 
     def _bundle_key(self, bundle_id: str) -> str:
@@ -68,8 +100,7 @@ class S3Storage(Storage):
     def load_bundle(self, bundle_id: str) -> dict[str, Any] | None:
         try:
             obj = self.client.get_object(Bucket=self.bucket, Key=self._bundle_key(bundle_id))
-            raw = obj["Body"].read().decode("utf-8")
-            return json.loads(raw)
+            return json.loads(obj["Body"].read())
         except Exception as exc:
             # boto3 ClientError: NoSuchKey means the bundle doesn't exist yet (cache miss).
             # Any other error (network, permissions, malformed JSON, …) is a real failure.
@@ -85,6 +116,23 @@ class S3Storage(Storage):
         body = markdown.encode("utf-8")
         self._put(self._export_key(bundle_id, doc_type), body, "text/markdown; charset=utf-8")
 
+    def save_exports_batch(self, bundle_id: str, docs: list[dict[str, str]]) -> None:
+        """Upload a bundle's exports in parallel so the puts overlap their round trips."""
+        if len(docs) <= 1:
+            super().save_exports_batch(bundle_id, docs)
+            return
+        _ = self.client  # build the shared client once, before fanning out
+        workers = min(len(docs), _MAX_BATCH_WORKERS)
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="s3-export"
+        ) as pool:
+            futures = [
+                pool.submit(self.save_export, bundle_id, doc["doc_type"], doc["markdown"])
+                for doc in docs
+            ]
+            for future in futures:
+                future.result()
+
     def get_export_path(self, bundle_id: str, doc_type: str) -> str:
         return f"s3://{self.bucket}/{self._export_key(bundle_id, doc_type)}"
 
@@ -104,11 +152,30 @@ class S3Storage(Storage):
             )
             raise StorageFailedError("Storage operation failed.") from exc
 
+    def _upload_multipart(self, key: str, body: bytes, content_type: str) -> None:
+        """Upload a large body as parallel multipart parts via the boto3 transfer manager."""
+        from boto3.s3.transfer import TransferConfig  # type: ignore
+
+        config = TransferConfig(
+            multipart_threshold=_MULTIPART_THRESHOLD_BYTES,
+            max_concurrency=_MULTIPART_CONCURRENCY,
+        )
+        self.client.upload_fileobj(
+            io.BytesIO(body),
+            self.bucket,
+            key,
+            ExtraArgs={"ContentType": content_type},
+            Config=config,
+        )
+
     def _put(self, key: str, body: bytes, content_type: str) -> None:
         try:
             if not self.bucket:
                 raise StorageFailedError("Storage operation failed.")
-            self.client.put_object(Bucket=self.bucket, Key=key, Body=body, ContentType=content_type)
+            if len(body) > _MULTIPART_THRESHOLD_BYTES:
+                self._upload_multipart(key, body, content_type)
+            else:
+                self.client.put_object(Bucket=self.bucket, Key=key, Body=body, ContentType=content_type)
         except Exception as exc:
             _log.warning(
                 "S3 put failed bucket=%s key=%s detail=%s",
@@ -10,6 +10,8 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, Iterator
 
+from app.storage.s3 import shared_s3_client
+
 _log = logging.getLogger("decisiondoc.storage.state")
 _LOCAL_LOCK_DIRECTORY = ".decisiondoc-state-locks"
 
@@ -386,10 +388,9 @@ class S3StateBackend(StateBackend):
         if self._s3_client is not None:
             return self._s3_client
         try:
-            import boto3  # type: ignore
+            self._s3_client = shared_s3_client()
         except ImportError as exc:
             raise StateBackendError("boto3 is required for S3-backed state storage.") from exc
-        self._s3_client = boto3.client("s3")
         return self._s3_client
 
     def _key(self, relative_path: str) -> str:
@@ -10,8 +10,12 @@ import httpx
 
 
 def _json_body(response: httpx.Response) -> dict[str, Any]:
+    content = response.content
+    if not content:
+        return {}
     try:
-        data = response.json()
+        # Parse the raw bytes directly; json.loads detects the UTF encoding itself.
+        data = json.loads(content)
     except ValueError:
         return {}
     return data if isinstance(data, dict) else {}
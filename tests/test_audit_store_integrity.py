@@ -211,6 +211,9 @@ def test_store_rejects_invalid_caller_evidence_before_write(
         json.dumps({**_log("foreign").__dict__, "tenant_id": "beta"}) + "\n",
         json.dumps({**_log("missing-detail").__dict__, "detail": None}) + "\n",
     ],
+    # _log() stamps the current time, so the raw values can't double as ids
+    # (xdist workers must collect identical test ids).
+    ids=["malformed-json", "non-object", "duplicate-key", "foreign-tenant", "missing-detail"],
 )
 def test_untrusted_audit_state_stops_read_and_append_without_replacement(
     tmp_path: Path,
@@ -0,0 +1,82 @@
+"""Tests for BatchProcessor fan-out over GenerationService."""
+
+import threading
+from pathlib import Path
+
+from app.providers.mock_provider import MockProvider
+from app.schemas import GenerateRequest
+from app.services.batch_service import BatchProcessor
+from app.services.generation_service import GenerationService
+
+
+class _CountingProvider(MockProvider):
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def generate_bundle(self, requirements, *, schema_version, request_id, bundle_spec=None, feedback_hints=""):  # noqa: ANN001
+        with self._lock:
+            self.calls += 1
+        if requirements.get("title") == "explode":
+            raise RuntimeError("boom")
+        return super().generate_bundle(
+            requirements,
+            schema_version=schema_version,
+            request_id=request_id,
+            bundle_spec=bundle_spec,
+            feedback_hints=feedback_hints,
+        )
+
+
+def _make_service(tmp_path, monkeypatch, provider):
+    monkeypatch.setenv("DECISIONDOC_CACHE_ENABLED", "0")
+    monkeypatch.setenv("DECISIONDOC_TEMPLATE_VERSION", "v1")
+    return GenerationService(
+        provider_factory=lambda: provider,
+        template_dir=Path("app/templates/v1"),
+        data_dir=tmp_path,
+    )
+
+
+def test_run_batch_preserves_order_and_keeps_duplicate_slots_distinct(tmp_path, monkeypatch):
+    provider = _CountingProvider()
+    service = _make_service(tmp_path, monkeypatch, provider)
+    requests = [
+        GenerateRequest(title="batch a", goal="g"),
+        GenerateRequest(title="batch b", goal="g"),
+        GenerateRequest(title="batch a", goal="g"),
+    ]
+
+    results = BatchProcessor(service, max_workers=2).run_batch(
+        requests, tenant_id="system", request_id_prefix="batch"
+    )
+
+    assert [r.request_id for r in results] == ["batch-0", "batch-1", "batch-2"]
+    assert all(r.ok for r in results)
+    assert provider.calls == 3
+    metadata = [r.result["metadata"] for r in results]
+    assert [m["request_id"] for m in metadata] == ["batch-0", "batch-1", "batch-2"]
+    assert metadata[2]["bundle_id"] != metadata[0]["bundle_id"]
+    assert results[2].result["docs"] == results[0].result["docs"]
+
+
+def test_run_batch_captures_failures_per_slot(tmp_path, monkeypatch):
+    provider = _CountingProvider()
+    service = _make_service(tmp_path, monkeypatch, provider)
+    requests = [
+        GenerateRequest(title="explode", goal="g"),
+        GenerateRequest(title="fine", goal="g"),
+    ]
+
+    results = BatchProcessor(service).run_batch(requests, tenant_id="system", request_id_prefix="b")
+
+    assert not results[0].ok
+    assert results[0].result is None
+    assert results[1].ok
+    assert results[1].result["metadata"]["request_id"] == "b-1"
+
+
+def test_run_batch_handles_empty_input(tmp_path, monkeypatch):
+    service = _make_service(tmp_path, monkeypatch, _CountingProvider())
+    assert BatchProcessor(service).run_batch([], tenant_id="system", request_id_prefix="x") == []
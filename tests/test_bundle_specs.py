@@ -51,6 +51,33 @@ def test_bundle_doc_keys_consistent(bundle_id):
     assert spec.doc_keys == [d.key for d in spec.docs]
 
 
+@pytest.mark.parametrize("bundle_id", ALL_BUNDLE_IDS)
+def test_bundle_validation_plan_matches_schema(bundle_id):
+    """validation_plan must cover every required field and be built once per spec."""
+    spec = BUNDLE_REGISTRY[bundle_id]
+    plan = spec.validation_plan
+    assert plan is spec.validation_plan
+    assert [key for key, _ in plan] == spec.doc_keys
+    schema = spec.json_schema
+    for key, checks in plan:
+        assert [field for field, _, _ in checks] == schema["properties"][key]["required"]
+
+
+@pytest.mark.parametrize("bundle_id", ALL_BUNDLE_IDS)
+def test_bundle_prompt_strings_are_serialized_once(bundle_id):
+    """Schema JSON and checklist are constant per spec and must be memoized."""
+    import json
+
+    spec = BUNDLE_REGISTRY[bundle_id]
+    schema_str = spec.build_json_schema_str()
+    assert schema_str is spec.build_json_schema_str()
+    assert json.loads(schema_str) == spec.json_schema
+    assert spec.stability_checklist is spec.stability_checklist
+    structure = spec.stabilizer_structure()
+    assert structure is spec.stabilizer_structure()
+    assert list(structure) == [d.key for d in spec.docs]
+
+
 def test_bundle_registry_has_seventeen_builtins():
     """Registry must contain exactly 17 built-in bundles including bid_decision_kr."""
     # Auto bundles may be loaded at import time — filter to built-in only
@@ -94,3 +121,16 @@ def test_generate_request_doc_tone_field():
     assert req.doc_tone == "concise"
     req_default = GenerateRequest(title="t", goal="g")
     assert req_default.doc_tone == "formal"
+
+
+def test_generate_request_doc_types_coerces_strings_but_keeps_list_strict():
+    """doc_types items accept enum values as strings; the container must be a list."""
+    from pydantic import ValidationError
+
+    from app.schemas import DocType, GenerateRequest
+
+    req = GenerateRequest(title="t", goal="g", doc_types=["adr", DocType.onepager])
+    assert req.doc_types == [DocType.adr, DocType.onepager]
+    for bad in (["unknown"], "adr", ("adr",), []):
+        with pytest.raises(ValidationError):
+            GenerateRequest(title="t", goal="g", doc_types=bad)
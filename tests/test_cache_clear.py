@@ -1,6 +1,7 @@
 """Tests for GenerationService.clear_cache() and POST /ops/cache/clear."""
 
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -57,6 +58,50 @@ def test_clear_cache_on_empty_returns_zero(tmp_path, monkeypatch):
     assert service.clear_cache() == 0
 
 
+def test_repeat_request_is_served_from_memory_layer(tmp_path, monkeypatch):
+    """A warm entry is served without touching the cache file again."""
+    service = _make_service(tmp_path, monkeypatch)
+    payload = GenerateRequest(title="memory layer", goal="skip disk reads")
+    first = service.generate_documents(payload, request_id="mem-1", tenant_id="system")
+
+    def _no_disk(*_args, **_kwargs):
+        raise AssertionError("disk cache should not be read")
+
+    monkeypatch.setattr(service, "_try_read_cache", _no_disk)
+    second = service.generate_documents(payload, request_id="mem-2", tenant_id="system")
+
+    assert first["metadata"]["cache_hit"] is False
+    assert second["metadata"]["cache_hit"] is True
+    assert second["raw_bundle"] == first["raw_bundle"]
+    assert second["raw_bundle"] is not first["raw_bundle"]
+
+
+def test_memory_layer_is_bounded_and_cleared(tmp_path, monkeypatch):
+    monkeypatch.setenv("DECISIONDOC_MEM_CACHE_SIZE", "1")
+    service = _make_service(tmp_path, monkeypatch)
+    service.generate_documents(GenerateRequest(title="m1", goal="g"), request_id="mb-1", tenant_id="system")
+    service.generate_documents(GenerateRequest(title="m2", goal="g"), request_id="mb-2", tenant_id="system")
+    assert len(service._mem_cache) == 1
+
+    service.clear_cache()
+    assert len(service._mem_cache) == 0
+
+
+def test_memory_layer_falls_through_when_file_changes_or_expires(tmp_path, monkeypatch):
+    service = _make_service(tmp_path, monkeypatch)
+    cache_path = service.cache_dir / "ttl.json"
+    service._write_cache_atomic(cache_path, {"adr": {}})
+    assert service._try_read_memory_cache(cache_path) == {"adr": {}}
+
+    old = cache_path.stat().st_mtime - 48 * 3600
+    os.utime(cache_path, (old, old))
+    assert service._try_read_memory_cache(cache_path) is None
+
+    service._write_cache_atomic(cache_path, {"adr": {}})
+    cache_path.write_text("{corrupted", encoding="utf-8")
+    assert service._try_read_memory_cache(cache_path) is None
+
+
 # ── Integration tests: POST /ops/cache/clear ─────────────────────
 
 
@@ -92,3 +137,17 @@ def test_cache_clear_endpoint_returns_cleared_count(tmp_path, monkeypatch):
     body = response.json()
     assert body["cleared"] is True
     assert isinstance(body["files_removed"], int)
+
+
+def test_cache_write_recreates_removed_cache_dir(tmp_path, monkeypatch):
+    """A cache dir deleted after startup is recreated on the next cache write."""
+    import shutil
+
+    service = _make_service(tmp_path, monkeypatch)
+    shutil.rmtree(service.cache_dir)
+
+    service.generate_documents(
+        GenerateRequest(title="recreate", goal="cache dir"), request_id="cc-rm", tenant_id="system"
+    )
+
+    assert len(list(service.cache_dir.glob("*.json"))) == 1
@@ -1,162 +1,183 @@
+import functools
 import re
 
 import pytest
 from fastapi.testclient import TestClient
 
+import app.main as main_module
+from app.providers.mock_provider import MockProvider
 
-REQUEST_ID_RE = re.compile(r"^[A-Za-z0-9._-]{8,64}$")
 
+REQUEST_ID_RE = re.compile(r"[A-Za-z0-9._-]{8,64}")
 
-def _create_client(tmp_path, monkeypatch, provider="mock"):
+
+_LEAKED_ENV = (
+    # app/main.py defines a module-level `app = create_app()` (uvicorn target),
+    # so importing app.main anywhere runs load_dotenv BEFORE a test can patch
+    # it — a developer .env may already sit in os.environ. Remove the vars that
+    # would reroute the provider factory around test monkeypatches.
+    "DECISIONDOC_PROVIDER_GENERATION",
+    "DECISIONDOC_PROVIDER_ATTACHMENT",
+    "DECISIONDOC_PROVIDER_VISUAL",
+    "DECISIONDOC_CACHE_ENABLED",
+)
+
+
+_BASE_ENV = {
+    "DECISIONDOC_PROVIDER": "mock",
+    "DECISIONDOC_TEMPLATE_VERSION": "v1",
+    "DECISIONDOC_ENV": "dev",
+    "DECISIONDOC_MAINTENANCE": "0",
+}
+_UNSET_ENV = ("DECISIONDOC_API_KEY", "DECISIONDOC_API_KEYS", *_LEAKED_ENV)
+
+
+def _apply_base_env(monkeypatch, data_dir, **overrides: str) -> None:
+    """Apply the baseline env in one pass; ``overrides`` replace or add single vars."""
     # Patch load_dotenv so a developer's local .env cannot leak into the app
-    # under test — same pattern as test_provider_failed_error_contract below.
+    # under test.
     monkeypatch.setattr("app.main.load_dotenv", lambda *a, **kw: None)
-    monkeypatch.setenv("DECISIONDOC_PROVIDER", provider)
-    monkeypatch.setenv("DATA_DIR", str(tmp_path))
-    monkeypatch.setenv("DECISIONDOC_TEMPLATE_VERSION", "v1")
-    monkeypatch.setenv("DECISIONDOC_ENV", "dev")
-    monkeypatch.setenv("DECISIONDOC_MAINTENANCE", "0")
-    monkeypatch.delenv("DECISIONDOC_API_KEY", raising=False)
-    monkeypatch.delenv("DECISIONDOC_API_KEYS", raising=False)
-    # app/main.py defines a module-level `app = create_app()` (uvicorn target),
-    # so importing app.main anywhere runs load_dotenv BEFORE this fixture can
-    # patch it — a developer .env may already sit in os.environ. Remove the
-    # vars that would reroute the provider factory around test monkeypatches.
-    for leaked in (
-        "DECISIONDOC_PROVIDER_GENERATION",
-        "DECISIONDOC_PROVIDER_ATTACHMENT",
-        "DECISIONDOC_PROVIDER_VISUAL",
-        "DECISIONDOC_CACHE_ENABLED",
-    ):
-        monkeypatch.delenv(leaked, raising=False)
-    from app.main import create_app
+    for name, value in {**_BASE_ENV, "DATA_DIR": str(data_dir), **overrides}.items():
+        monkeypatch.setenv(name, value)
+    for name in _UNSET_ENV:
+        if name not in overrides:
+            monkeypatch.delenv(name, raising=False)
+
+
+@pytest.fixture(scope="module")
+def base_app(tmp_path_factory):
+    """One app for the module: route, schema and middleware setup is paid once.
+
+    Env that varies per test (API key, maintenance) is read per request, and
+    the generation provider is rebuilt per test by the ``client`` fixture.
+    """
+    data_dir = tmp_path_factory.mktemp("error_contract")
+    with pytest.MonkeyPatch.context() as mp:
+        _apply_base_env(mp, data_dir)
+        from app.main import create_app
+
+        app = create_app()
+    app.state.error_contract_data_dir = data_dir
+    return app
+
 
-    return TestClient(create_app())
+@pytest.fixture
+def client(base_app, monkeypatch):
+    _apply_base_env(monkeypatch, base_app.state.error_contract_data_dir)
+    # Drop the memoized provider so a test's get_provider patch takes effect;
+    # monkeypatch restores the shared one afterwards.
+    monkeypatch.setattr(base_app.state.service, "_provider_cache", None)
+    return TestClient(base_app)
 
 
-def test_request_id_generated_header_present(tmp_path, monkeypatch):
-    client = _create_client(tmp_path, monkeypatch)
+def test_request_id_generated_header_present(client):
     response = client.get("/health")
     assert response.status_code == 200
     request_id = response.headers.get("X-Request-Id", "")
     assert REQUEST_ID_RE.fullmatch(request_id)
 
 
-def test_request_id_passthrough(tmp_path, monkeypatch):
-    client = _create_client(tmp_path, monkeypatch)
+def test_request_id_passthrough(client):
     request_id = "test-req-1234"
     response = client.get("/health", headers={"X-Request-Id": request_id})
     assert response.status_code == 200
     assert response.headers.get("X-Request-Id") == request_id
 
 
-def test_provider_failed_error_contract(tmp_path, monkeypatch):
-    # Startup fail-fast: missing API key is now caught before the app accepts traffic.
-    # Patch load_dotenv to prevent the real .env file from overwriting monkeypatched vars.
-    monkeypatch.setattr("app.main.load_dotenv", lambda *a, **kw: None)
-    monkeypatch.setenv("DECISIONDOC_PROVIDER", "openai")
-    monkeypatch.setenv("DATA_DIR", str(tmp_path))
-    monkeypatch.setenv("DECISIONDOC_TEMPLATE_VERSION", "v1")
-    monkeypatch.setenv("DECISIONDOC_ENV", "dev")
-    monkeypatch.delenv("OPENAI_API_KEY", raising=False)
+@pytest.mark.parametrize(
+    "env,missing,message",
+    [
+        ({"DECISIONDOC_PROVIDER": "openai"}, "OPENAI_API_KEY", "OPENAI_API_KEY is required"),
+        (
+            {"DECISIONDOC_PROVIDER": "mock", "DECISIONDOC_STORAGE": "s3"},
+            "DECISIONDOC_S3_BUCKET",
+            "DECISIONDOC_S3_BUCKET is required",
+        ),
+    ],
+    ids=["provider_failed", "storage_failed"],
+)
+def test_startup_fail_fast_error_contract(tmp_path, monkeypatch, env, missing, message):
+    # Startup fail-fast: missing provider keys / S3 bucket are caught before the
+    # app accepts traffic, so these cases need their own create_app() call.
+    _apply_base_env(monkeypatch, tmp_path, **env)
+    monkeypatch.delenv(missing, raising=False)
     from app.main import create_app
 
-    with pytest.raises(RuntimeError, match="OPENAI_API_KEY is required"):
+    with pytest.raises(RuntimeError, match=message):
         create_app()
 
 
-def test_storage_failed_error_contract(tmp_path, monkeypatch):
-    # Startup fail-fast: missing S3 bucket is now caught before the app accepts traffic.
-    monkeypatch.setenv("DECISIONDOC_PROVIDER", "mock")
-    monkeypatch.setenv("DECISIONDOC_STORAGE", "s3")
-    monkeypatch.setenv("DATA_DIR", str(tmp_path))
-    monkeypatch.setenv("DECISIONDOC_TEMPLATE_VERSION", "v1")
-    monkeypatch.setenv("DECISIONDOC_ENV", "dev")
-    monkeypatch.delenv("DECISIONDOC_S3_BUCKET", raising=False)
-    from app.main import create_app
-
-    with pytest.raises(RuntimeError, match="DECISIONDOC_S3_BUCKET is required"):
-        create_app()
-
-
-def test_doc_validation_failed_error_contract(tmp_path, monkeypatch):
-    import app.main as main_module
-    from app.providers.mock_provider import MockProvider
-
-    class BrokenMockProvider(MockProvider):
-        def generate_bundle(self, requirements, *, schema_version, request_id, bundle_spec=None, feedback_hints=""):  # noqa: ANN001
-            bundle = super().generate_bundle(requirements, schema_version=schema_version, request_id=request_id, bundle_spec=bundle_spec, feedback_hints=feedback_hints)
-            bundle["adr"]["options"] = ["only one option"]
-            return bundle
-
-    monkeypatch.setattr(main_module, "get_provider", lambda: BrokenMockProvider())
-    client = _create_client(tmp_path, monkeypatch)
-    response = client.post("/generate", json={"title": "x", "goal": "y"})
-    assert response.status_code == 500
-    body = response.json()
-    assert body["code"] == "DOC_VALIDATION_FAILED"
-    assert body["request_id"] == response.headers.get("X-Request-Id")
-    assert "errors" in body
-    assert isinstance(body["errors"], list)
-    assert any("adr_options_lt_2" in err for err in body["errors"])
-
-
-def test_eval_lint_failed_error_contract(tmp_path, monkeypatch):
-    import app.main as main_module
-    from app.providers.mock_provider import MockProvider
-
-    class LintFailMockProvider(MockProvider):
-        def generate_bundle(self, requirements, *, schema_version, request_id, bundle_spec=None, feedback_hints=""):  # noqa: ANN001
-            bundle = super().generate_bundle(requirements, schema_version=schema_version, request_id=request_id, bundle_spec=bundle_spec, feedback_hints=feedback_hints)
-            bundle["onepager"]["problem"] = "TODO improve this section"
-            return bundle
-
-    monkeypatch.setattr(main_module, "get_provider", lambda: LintFailMockProvider())
-    client = _create_client(tmp_path, monkeypatch)
-    response = client.post("/generate", json={"title": "x", "goal": "y"})
-    assert response.status_code == 500
-    body = response.json()
-    assert body["code"] == "EVAL_LINT_FAILED"
-    assert body["request_id"] == response.headers.get("X-Request-Id")
-    assert "errors" in body
-    assert isinstance(body["errors"], list)
-    assert any("banned_token" in err for err in body["errors"])
-
-
-def test_request_validation_422_error_contract(tmp_path, monkeypatch):
-    client = _create_client(tmp_path, monkeypatch)
-    response = client.post("/generate", json={"title": "only-title"})
-    assert response.status_code == 422
-    body = response.json()
-    assert body["code"] == "REQUEST_VALIDATION_FAILED"
-    assert body["request_id"] == response.headers.get("X-Request-Id")
-    assert "errors" in body
-    assert isinstance(body["errors"], list)
-    assert any("goal" in err for err in body["errors"])
-
-
-def test_unauthorized_401_error_contract(tmp_path, monkeypatch):
-    client = _create_client(tmp_path, monkeypatch)
-    monkeypatch.setenv("DECISIONDOC_API_KEY", "test-api-key")
-    response = client.post("/generate", json={"title": "x", "goal": "y"})
-    assert response.status_code == 401
-    body = response.json()
-    assert set(body.keys()) == {"code", "message", "request_id"}
-    assert body["code"] == "UNAUTHORIZED"
-    assert body["request_id"] == response.headers.get("X-Request-Id")
-
-
-def test_maintenance_mode_503_error_contract(tmp_path, monkeypatch):
-    client = _create_client(tmp_path, monkeypatch)
-    monkeypatch.setenv("DECISIONDOC_MAINTENANCE", "1")
-    monkeypatch.setenv("DECISIONDOC_API_KEY", "test-api-key")
-    response = client.post(
-        "/generate",
-        headers={"X-DecisionDoc-Api-Key": "test-api-key"},
-        json={"title": "x", "goal": "y"},
-    )
-    assert response.status_code == 503
+class _MutatingMockProvider(MockProvider):
+    """MockProvider whose bundles pass through ``mutate`` before rendering."""
+
+    def __init__(self, mutate) -> None:  # noqa: ANN001
+        self._mutate = mutate
+
+    def generate_bundle(self, *args, **kwargs):  # noqa: ANN002, ANN003
+        bundle = super().generate_bundle(*args, **kwargs)
+        self._mutate(bundle)
+        return bundle
+
+
+def _single_adr_option(bundle) -> None:  # noqa: ANN001
+    bundle["adr"]["options"] = ["only one option"]
+
+
+def _banned_token_in_problem(bundle) -> None:  # noqa: ANN001
+    bundle["onepager"]["problem"] = "TODO improve this section"
+
+
+_API_KEY_HEADERS = {"X-DecisionDoc-Api-Key": "test-api-key"}
+
+# (env, bundle mutator, headers, payload, status, code, expected error substring).
+# A None substring means the body must be exactly {code, message, request_id}.
+_HTTP_ERROR_CASES = {
+    "doc_validation_failed": (
+        {}, _single_adr_option, {}, {"title": "x", "goal": "y"},
+        500, "DOC_VALIDATION_FAILED", "adr_options_lt_2",
+    ),
+    "eval_lint_failed": (
+        {}, _banned_token_in_problem, {}, {"title": "x", "goal": "y"},
+        500, "EVAL_LINT_FAILED", "banned_token",
+    ),
+    "request_validation_422": (
+        {}, None, {}, {"title": "only-title"},
+        422, "REQUEST_VALIDATION_FAILED", "goal",
+    ),
+    "unauthorized_401": (
+        {"DECISIONDOC_API_KEY": "test-api-key"}, None, {}, {"title": "x", "goal": "y"},
+        401, "UNAUTHORIZED", None,
+    ),
+    "maintenance_mode_503": (
+        {"DECISIONDOC_MAINTENANCE": "1", "DECISIONDOC_API_KEY": "test-api-key"}, None, _API_KEY_HEADERS,
+        {"title": "x", "goal": "y"},
+        503, "MAINTENANCE_MODE", None,
+    ),
+}
+
+
+@pytest.mark.parametrize(
+    "env,mutate,headers,payload,status,code,error_substring",
+    list(_HTTP_ERROR_CASES.values()),
+    ids=list(_HTTP_ERROR_CASES),
+)
+def test_http_error_contract(
+    client, monkeypatch, env, mutate, headers, payload, status, code, error_substring
+):
+    # The client fixture applied the baseline; only this case's deltas are set here.
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    if mutate is not None:
+        monkeypatch.setattr(main_module, "get_provider", functools.partial(_MutatingMockProvider, mutate))
+
+    response = client.post("/generate", headers=headers, json=payload)
+
+    assert response.status_code == status
     body = response.json()
-    assert set(body.keys()) == {"code", "message", "request_id"}
-    assert body["code"] == "MAINTENANCE_MODE"
+    assert body["code"] == code
     assert body["request_id"] == response.headers.get("X-Request-Id")
+    if error_substring is None:
+        assert set(body.keys()) == {"code", "message", "request_id"}
+    else:
+        assert isinstance(body["errors"], list)
+        assert any(error_substring in err for err in body["errors"])
@@ -37,7 +37,7 @@ def test_eval_runner_generates_reports_for_subset(tmp_path, monkeypatch):
     assert (out_dir / "eval_report.json").exists()
     assert (out_dir / "eval_report.md").exists()
 
-    saved_json = json.loads((out_dir / "eval_report.json").read_text(encoding="utf-8"))
+    saved_json = json.loads((out_dir / "eval_report.json").read_bytes())
     assert {"eval_version", "template_version", "provider", "summary", "results"} <= set(saved_json.keys())
 
     serialized = (out_dir / "eval_report.json").read_text(encoding="utf-8") + "\n" + (
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+import app.providers.gemini_provider as gemini_provider
+from app.providers.base import ProviderError
+from app.providers.gemini_provider import GeminiProvider
+
+
+def _install_fake_genai(monkeypatch, generate_content):
+    captured: dict = {"clients": 0}
+
+    class FakeModels:
+        def generate_content(self, **kwargs):
+            captured.update(kwargs)
+            return generate_content(**kwargs)
+
+    class FakeClient:
+        def __init__(self, **kwargs):
+            captured["clients"] += 1
+            captured["client_kwargs"] = kwargs
+            self.models = FakeModels()
+
+    class FakeGenerateContentConfig:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    class FakeHttpOptions:
+        def __init__(self, **kwargs):
+            self.kwargs = kwargs
+
+    fake_types = types.SimpleNamespace(
+        GenerateContentConfig=FakeGenerateContentConfig,
+        HttpOptions=FakeHttpOptions,
+    )
+    fake_genai = types.SimpleNamespace(Client=FakeClient, types=fake_types)
+    fake_google = types.SimpleNamespace(genai=fake_genai)
+    monkeypatch.setitem(sys.modules, "google", fake_google)
+    monkeypatch.setitem(sys.modules, "google.genai", fake_genai)
+    monkeypatch.setitem(sys.modules, "google.genai.types", fake_types)
+    return captured
+
+
+def test_gemini_generate_raw_parses_text_and_usage(monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "gemini-test-key")
+    monkeypatch.setenv("DECISIONDOC_GEMINI_MODEL", "gemini-test-model")
+    usage = types.SimpleNamespace(prompt_token_count=11, candidates_token_count=7, total_token_count=18)
+    captured = _install_fake_genai(
+        monkeypatch,
+        lambda **_: types.SimpleNamespace(text='{"ok": true}', usage_metadata=usage),
+    )
+
+    provider = GeminiProvider()
+    raw = provider.generate_raw("prompt", request_id="req-gemini", max_output_tokens=256)
+
+    assert raw == '{"ok": true}'
+    assert captured["model"] == "gemini-test-model"
+    assert captured["config"].kwargs == {"response_mime_type": "application/json", "max_output_tokens": 256}
+    assert provider.consume_usage_tokens() == {"prompt_tokens": 11, "output_tokens": 7, "total_tokens": 18}
+
+
+def test_gemini_sdk_client_enforces_the_provider_timeout(monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "gemini-test-key")
+    monkeypatch.setenv("DECISIONDOC_PROVIDER_TIMEOUT", "45")
+    captured = _install_fake_genai(
+        monkeypatch,
+        lambda **_: types.SimpleNamespace(text="{}", usage_metadata=None),
+    )
+
+    provider = GeminiProvider()
+    provider.generate_raw("first", request_id="req-1")
+
+    assert captured["client_kwargs"]["api_key"] == "gemini-test-key"
+    assert captured["client_kwargs"]["http_options"].kwargs == {"timeout": 45_000}
+
+
+def test_gemini_backstop_times_out_and_counts_the_abandoned_call(monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "gemini-test-key")
+    monkeypatch.setenv("DECISIONDOC_PROVIDER_TIMEOUT", "0")
+    monkeypatch.setattr(gemini_provider, "_BACKSTOP_GRACE_SECONDS", 0.05)
+    started = threading.Event()
+    release = threading.Event()
+
+    def _hang(**_):
+        started.set()
+        release.wait(5)
+        return types.SimpleNamespace(text="{}", usage_metadata=None)
+
+    _install_fake_genai(monkeypatch, _hang)
+
+    provider = GeminiProvider()
+    before = gemini_provider.abandoned_call_count()
+    try:
+        with pytest.raises(ProviderError, match="Provider request failed."):
+            provider.generate_raw("prompt", request_id="req-timeout")
+        assert started.is_set()
+        assert gemini_provider.abandoned_call_count() == before + 1
+    finally:
+        release.set()
+    # Once the SDK call finally returns, its worker is no longer counted.
+    for _ in range(100):
+        if gemini_provider.abandoned_call_count() == before:
+            break
+        time.sleep(0.01)
+    assert gemini_provider.abandoned_call_count() == before
+
+
+def test_gemini_client_is_built_once_per_provider(monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "gemini-test-key")
+    monkeypatch.delenv("DECISIONDOC_PROVIDER_TIMEOUT", raising=False)
+    captured = _install_fake_genai(
+        monkeypatch,
+        lambda **_: types.SimpleNamespace(text="{}", usage_metadata=None),
+    )
+
+    provider = GeminiProvider()
+    assert captured["clients"] == 0
+    provider.generate_raw("first", request_id="req-1")
+    provider.generate_raw("second", request_id="req-2")
+
+    assert captured["clients"] == 1
+    assert captured["client_kwargs"]["api_key"] == "gemini-test-key"
+    assert captured["client_kwargs"]["http_options"].kwargs == {"timeout": 120_000}
+
+
+def test_gemini_calls_run_on_shared_provider_pool(monkeypatch):
+    monkeypatch.setenv("GEMINI_API_KEY", "gemini-test-key")
+    threads: list[str] = []
+
+    def _record(**_):
+        threads.append(threading.current_thread().name)
+        return types.SimpleNamespace(text="{}", usage_metadata=None)
+
+    _install_fake_genai(monkeypatch, _record)
+
+    provider = GeminiProvider()
+    provider.generate_raw("first", request_id="req-1")
+    provider.generate_raw("second", request_id="req-2")
+
+    assert len(threads) == 2
+    assert all(name.startswith("prov") for name in threads)
+
+
+def test_provider_pool_size_reads_env(monkeypatch):
+    from app.config import get_provider_pool_size
+
+    monkeypatch.delenv("DECISIONDOC_PROVIDER_POOL", raising=False)
+    assert get_provider_pool_size() == 16
+    monkeypatch.setenv("DECISIONDOC_PROVIDER_POOL", "0")
+    assert get_provider_pool_size() == 1
+    monkeypatch.setenv("DECISIONDOC_PROVIDER_POOL", "nope")
+    assert get_provider_pool_size() == 16
@@ -1,10 +1,12 @@
 from copy import deepcopy
+import functools
 import json
 from pathlib import Path
 
 from fastapi.testclient import TestClient
 import pytest
 
+import app.main as main_module
 from app.providers.base import ProviderError
 from app.providers.factory import get_provider
 from app.providers.mock_provider import MockProvider
@@ -12,10 +14,18 @@ from app.services.auth_service import create_access_token
 from app.services.generation_service import _apply_finished_doc_quality_guard
 from app.services.validator import validate_docs
 
+FIXTURE_PATHS = sorted((Path(__file__).parent / "fixtures").glob("*.json"))
 
-def _create_client(tmp_path, monkeypatch, provider="mock"):
+
+@functools.lru_cache(maxsize=None)
+def _load_fixture(path: str) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def _apply_env(monkeypatch, data_dir, provider="mock", storage="local") -> None:
     monkeypatch.setenv("DECISIONDOC_PROVIDER", provider)
-    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    monkeypatch.setenv("DECISIONDOC_STORAGE", storage)
+    monkeypatch.setenv("DATA_DIR", str(data_dir))
     monkeypatch.setenv("DECISIONDOC_ENV", "dev")
     monkeypatch.setenv("DECISIONDOC_MAINTENANCE", "0")
     monkeypatch.delenv("DECISIONDOC_API_KEY", raising=False)
@@ -24,12 +34,39 @@ def _create_client(tmp_path, monkeypatch, provider="mock"):
     monkeypatch.setenv("DECISIONDOC_PROVIDER_ATTACHMENT", "")
     monkeypatch.setenv("DECISIONDOC_PROVIDER_VISUAL", "")
 
+
+def _create_client(tmp_path, monkeypatch, provider="mock", storage="local"):
+    _apply_env(monkeypatch, tmp_path, provider=provider, storage=storage)
+
     from app.main import create_app
 
     app = create_app()
     return TestClient(app)
 
 
+@pytest.fixture(scope="module")
+def memory_app(tmp_path_factory):
+    """One mock-provider, memory-storage app shared by tests that only read responses.
+
+    Building the app (routes, pydantic schemas, stores) dominates these tests,
+    so it is paid once per module instead of once per test.
+    """
+    data_dir = tmp_path_factory.mktemp("generate_memory")
+    with pytest.MonkeyPatch.context() as mp:
+        _apply_env(mp, data_dir, storage="memory")
+        from app.main import create_app
+
+        app = create_app()
+    app.state.shared_data_dir = data_dir
+    return app
+
+
+@pytest.fixture
+def memory_client(memory_app, monkeypatch):
+    _apply_env(monkeypatch, memory_app.state.shared_data_dir, storage="memory")
+    return TestClient(memory_app)
+
+
 def _auth_headers(user_id: str = "testuser") -> dict[str, str]:
     token = create_access_token(
         user_id=user_id,
@@ -59,9 +96,12 @@ def test_generate_minimal_payload_returns_all_docs(tmp_path, monkeypatch):
     assert body["schema_version"] == "v1"
     assert len(body["docs"]) == 4
 
-    for doc in body["docs"]:
-        assert isinstance(doc["markdown"], str)
-        assert doc["markdown"].strip()
+    empty_docs = [
+        doc["doc_type"]
+        for doc in body["docs"]
+        if not (isinstance(doc["markdown"], str) and doc["markdown"].strip())
+    ]
+    assert not empty_docs
 
     saved = Path(tmp_path) / f"{body['bundle_id']}.json"
     assert saved.exists()
@@ -69,9 +109,8 @@ def test_generate_minimal_payload_returns_all_docs(tmp_path, monkeypatch):
     assert {"adr", "onepager", "eval_plan", "ops_checklist"} <= set(saved_body.keys())
 
 
-def test_generate_with_mock_provider_ok(tmp_path, monkeypatch):
-    client = _create_client(tmp_path, monkeypatch, provider="mock")
-    response = client.post("/generate", json={"title": "mock ok", "goal": "smoke"})
+def test_generate_with_mock_provider_ok(memory_client):
+    response = memory_client.post("/generate", json={"title": "mock ok", "goal": "smoke"})
     assert response.status_code == 200
     body = response.json()
     assert body["provider"] == "mock"
@@ -229,9 +268,6 @@ def test_extremely_long_title_is_accepted(tmp_path, monkeypatch):
 
 
 def test_doc_validation_failure_returns_stable_500_payload(tmp_path, monkeypatch):
-    import app.main as main_module
-    from app.providers.mock_provider import MockProvider
-
     class BrokenMockProvider(MockProvider):
         def generate_bundle(self, requirements, *, schema_version, request_id, bundle_spec=None, feedback_hints=""):  # noqa: ANN001
             bundle = super().generate_bundle(requirements, schema_version=schema_version, request_id=request_id, bundle_spec=bundle_spec, feedback_hints=feedback_hints)
@@ -309,9 +345,6 @@ def test_visual_provider_missing_key_raises_at_startup(tmp_path, monkeypatch):
 
 
 def test_bundle_schema_validation_missing_required_key_returns_provider_failed(tmp_path, monkeypatch):
-    import app.main as main_module
-    from app.providers.mock_provider import MockProvider
-
     class InvalidTypedProvider(MockProvider):
         def generate_bundle(self, requirements, *, schema_version, request_id, bundle_spec=None, feedback_hints=""):  # noqa: ANN001
             raise RuntimeError("provider internal error")
@@ -327,8 +360,6 @@ def test_bundle_schema_validation_missing_required_key_returns_provider_failed(t
 
 
 def test_provider_rate_limit_returns_503_with_retry_guidance(tmp_path, monkeypatch):
-    import app.main as main_module
-
     class FakeRateLimitError(Exception):
         status_code = 429
 
@@ -359,8 +390,6 @@ def test_provider_rate_limit_returns_503_with_retry_guidance(tmp_path, monkeypat
 
 
 def test_provider_quota_exhausted_returns_503_with_quota_guidance(tmp_path, monkeypatch):
-    import app.main as main_module
-
     class FakeQuotaError(Exception):
         status_code = 429
 
@@ -557,11 +586,10 @@ def test_proposal_quality_guard_keeps_dense_non_attachment_fields():
     assert impact["roi_estimate"] == "3년 ROI 180%"
 
 
-@pytest.mark.parametrize("fixture_path", sorted(Path(__file__).parent.joinpath("fixtures").glob("*.json")))
-def test_regression_fixtures_generate_valid_docs(tmp_path, monkeypatch, fixture_path):
-    client = _create_client(tmp_path, monkeypatch)
-    payload = json.loads(fixture_path.read_text(encoding="utf-8"))
-    response = client.post("/generate", json=payload)
+@pytest.mark.parametrize("fixture_path", FIXTURE_PATHS, ids=[p.name for p in FIXTURE_PATHS])
+def test_regression_fixtures_generate_valid_docs(memory_client, fixture_path):
+    payload = _load_fixture(str(fixture_path))
+    response = memory_client.post("/generate", json=payload)
 
     assert response.status_code == 200, fixture_path.name
     body = response.json()
@@ -617,16 +645,16 @@ def test_generate_export_returns_files_and_writes_markdown(tmp_path, monkeypatch
     assert export_dir.exists()
     assert export_dir.is_dir()
 
-    for item in body["files"]:
-        md_path = Path(item["path"])
-        assert md_path.exists()
-        assert md_path.suffix == ".md"
-        assert md_path.read_text(encoding="utf-8").strip()
+    md_paths = [Path(item["path"]) for item in body["files"]]
+    bad_paths = [
+        path
+        for path in md_paths
+        if not (path.suffix == ".md" and path.is_file() and path.read_text(encoding="utf-8").strip())
+    ]
+    assert not bad_paths
 
 
 def test_generate_injects_ranked_knowledge_context(tmp_path, monkeypatch):
-    import app.main as main_module
-    from app.providers.mock_provider import MockProvider
     from app.storage.knowledge_store import KnowledgeStore
 
     captured: dict[str, object] = {}
@@ -780,9 +808,6 @@ def test_generate_fails_closed_when_tenant_eval_store_is_unavailable(
 
 
 def test_generate_export_validation_failure_returns_500_and_no_export_dir(tmp_path, monkeypatch):
-    import app.main as main_module
-    from app.providers.mock_provider import MockProvider
-
     class BrokenMockProvider(MockProvider):
         def generate_bundle(self, requirements, *, schema_version, request_id, bundle_spec=None, feedback_hints=""):  # noqa: ANN001
             bundle = super().generate_bundle(requirements, schema_version=schema_version, request_id=request_id, bundle_spec=bundle_spec, feedback_hints=feedback_hints)
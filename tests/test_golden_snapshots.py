@@ -1,12 +1,16 @@
 import difflib
+import functools
 import json
 import os
 import re
 from pathlib import Path
 from uuid import uuid4
 
+import pytest
 from fastapi.testclient import TestClient
 
+from app.config import env_is_enabled
+
 GOLDEN_FIXTURES = [
     "01_normal_default_all.json",
     "04_underspecified_short_goal.json",
@@ -17,71 +21,105 @@ GOLDEN_FIXTURES = [
 DOC_ORDER = ["adr", "onepager", "eval_plan", "ops_checklist"]
 
 
+_UUID_RE = re.compile(
+    r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"
+)
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+GOLDEN_ROOT = Path(__file__).parent / "golden" / "v1"
+
+
 def _normalize(text: str) -> str:
     text = text.replace("\r\n", "\n").replace("\r", "\n")
-    text = re.sub(
-        r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b",
-        "<uuid>",
-        text,
-    )
+    text = _UUID_RE.sub("<uuid>", text)
     lines = [line.rstrip() for line in text.split("\n")]
     return "\n".join(lines).strip() + "\n"
 
 
+@functools.lru_cache(maxsize=None)
+def _load_expected(path: str) -> str:
+    return _normalize(Path(path).read_text(encoding="utf-8"))
+
+
 def _atomic_write_text(path: Path, content: str) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_name(f"{path.name}.tmp.{uuid4().hex}")
     with tmp.open("w", encoding="utf-8", newline="\n") as f:
         f.write(content)
-        f.flush()
-        os.fsync(f.fileno())
+        if env_is_enabled("DECISIONDOC_GOLDEN_FSYNC"):
+            f.flush()
+            os.fsync(f.fileno())
     os.replace(tmp, path)
 
 
-def _create_client(tmp_path, monkeypatch):
+def _apply_env(monkeypatch, data_dir) -> None:
     monkeypatch.setenv("DECISIONDOC_PROVIDER", "mock")
     monkeypatch.setenv("DECISIONDOC_TEMPLATE_VERSION", "v1")
-    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    monkeypatch.setenv("DATA_DIR", str(data_dir))
     monkeypatch.setenv("DECISIONDOC_ENV", "dev")
     monkeypatch.setenv("DECISIONDOC_MAINTENANCE", "0")
     monkeypatch.delenv("DECISIONDOC_API_KEY", raising=False)
     monkeypatch.delenv("DECISIONDOC_API_KEYS", raising=False)
-    from app.main import create_app
 
-    return TestClient(create_app())
 
+@pytest.fixture(scope="module")
+def golden_app(tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp("golden")
+    with pytest.MonkeyPatch.context() as mp:
+        _apply_env(mp, data_dir)
+        from app.main import create_app
 
-def test_golden_snapshots_v1(tmp_path, monkeypatch, request):
-    update = bool(request.config.getoption("--update-golden"))
-    client = _create_client(tmp_path, monkeypatch)
-    fixtures_dir = Path(__file__).parent / "fixtures"
-    golden_root = Path(__file__).parent / "golden" / "v1"
+        app = create_app()
+    app.state.golden_data_dir = data_dir
+    return app
+
+
+@pytest.fixture(scope="module")
+def rendered_cache() -> dict[str, dict[str, str]]:
+    """Normalized docs per fixture, so each fixture is generated once for all doc types."""
+    return {}
 
-    for fixture_name in GOLDEN_FIXTURES:
-        payload = json.loads((fixtures_dir / fixture_name).read_text(encoding="utf-8"))
+
+@pytest.fixture
+def client(golden_app, monkeypatch):
+    _apply_env(monkeypatch, golden_app.state.golden_data_dir)
+    return TestClient(golden_app)
+
+
+def _rendered(client, cache: dict[str, dict[str, str]], fixture_name: str) -> dict[str, str]:
+    if fixture_name not in cache:
+        payload = json.loads((FIXTURES_DIR / fixture_name).read_bytes())
         response = client.post("/generate", json=payload)
         assert response.status_code == 200, fixture_name
-        body = response.json()
-        rendered = {doc["doc_type"]: _normalize(doc["markdown"]) for doc in body["docs"]}
-
-        fixture_base = fixture_name.replace(".json", "")
-        for doc_type in DOC_ORDER:
-            if doc_type not in rendered:
-                continue
-            golden_path = golden_root / fixture_base / f"{doc_type}.md"
-            if update:
-                _atomic_write_text(golden_path, rendered[doc_type])
-                continue
-
-            assert golden_path.exists(), f"Missing golden snapshot: {golden_path}"
-            expected = _normalize(golden_path.read_text(encoding="utf-8"))
-            if rendered[doc_type] != expected:
-                diff = "".join(
-                    difflib.unified_diff(
-                        expected.splitlines(keepends=True),
-                        rendered[doc_type].splitlines(keepends=True),
-                        fromfile=f"{golden_path} (expected)",
-                        tofile=f"{fixture_name}:{doc_type} (actual)",
-                    )
-                )
-                raise AssertionError(f"Golden mismatch for {fixture_name}/{doc_type}\n{diff}")
+        cache[fixture_name] = {
+            doc["doc_type"]: _normalize(doc["markdown"]) for doc in response.json()["docs"]
+        }
+    return cache[fixture_name]
+
+
+@pytest.mark.parametrize(
+    "fixture_name,doc_type",
+    [(fixture_name, doc_type) for fixture_name in GOLDEN_FIXTURES for doc_type in DOC_ORDER],
+)
+def test_golden_snapshots_v1(client, rendered_cache, request, fixture_name, doc_type):
+    update = bool(request.config.getoption("--update-golden"))
+    rendered = _rendered(client, rendered_cache, fixture_name)
+    if doc_type not in rendered:
+        pytest.skip(f"{fixture_name} does not render {doc_type}")
+
+    golden_path = GOLDEN_ROOT / fixture_name.replace(".json", "") / f"{doc_type}.md"
+    if update:
+        _atomic_write_text(golden_path, rendered[doc_type])
+        return
+
+    assert golden_path.exists(), f"Missing golden snapshot: {golden_path}"
+    expected = _load_expected(str(golden_path))
+    if rendered[doc_type] != expected:
+        diff = "".join(
+            difflib.unified_diff(
+                expected.splitlines(keepends=True),
+                rendered[doc_type].splitlines(keepends=True),
+                fromfile=f"{golden_path} (expected)",
+                tofile=f"{fixture_name}:{doc_type} (actual)",
+            )
+        )
+        raise AssertionError(f"Golden mismatch for {fixture_name}/{doc_type}\n{diff}")
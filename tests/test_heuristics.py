@@ -1,4 +1,4 @@
-from app.eval.heuristics import compute_heuristic_score
+from app.eval.heuristics import _has_repeated_lines, compute_heuristic_score
 
 
 def test_heuristic_score_is_deterministic_and_bounded():
@@ -36,3 +36,9 @@ def test_heuristic_penalties_trigger():
     assert 0 <= result["score"] <= 100
     assert result["score"] < 100
     assert result["reasons"]
+
+
+def test_repeated_line_check_ignores_blanks_and_surrounding_whitespace():
+    assert _has_repeated_lines("a\n  a\na  \n")
+    assert not _has_repeated_lines("a\n\n\n\na\nb\n")
+    assert not _has_repeated_lines("")
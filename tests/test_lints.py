@@ -0,0 +1,28 @@
+from app.eval.lints import lint_docs
+
+
+def test_lint_docs_reports_banned_tokens_in_declared_order():
+    errors = lint_docs(
+        {"adr": "FIXME first, then TODO and TODO again"},
+        lint_headings_override={},
+        critical_headings_override={},
+    )
+    assert errors == ["adr:banned_token:TODO", "adr:banned_token:FIXME"]
+
+
+def test_lint_docs_banned_tokens_respect_word_boundaries():
+    errors = lint_docs(
+        {"adr": "TODOS and XTBD and FIXMEs are fine"},
+        lint_headings_override={},
+        critical_headings_override={},
+    )
+    assert errors == []
+
+
+def test_lint_docs_reports_missing_and_empty_headings():
+    errors = lint_docs(
+        {"adr": "## Decision\n\n## Options\n- a\n"},
+        lint_headings_override={"adr": ["## Decision", "## Risks"]},
+        critical_headings_override={"adr": ["## Decision", "## Options"]},
+    )
+    assert errors == ["adr:missing:## Risks", "adr:empty_section:## Decision"]
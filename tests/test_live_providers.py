@@ -7,6 +7,15 @@ from fastapi.testclient import TestClient
 
 pytestmark = pytest.mark.live
 
+# Resolved once at import: find_spec walks sys.path, and the live env is fixed
+# for the whole run.
+_PROVIDER = os.getenv("DECISIONDOC_PROVIDER")
+_HAS_OPENAI_SDK = find_spec("openai") is not None
+_HAS_GENAI_SDK = find_spec("google") is not None and find_spec("google.genai") is not None
+
+_requires_openai_sdk = pytest.mark.skipif(not _HAS_OPENAI_SDK, reason="openai SDK is not installed.")
+_requires_genai_sdk = pytest.mark.skipif(not _HAS_GENAI_SDK, reason="google-genai SDK is not installed.")
+
 
 def _resolve_live_api_key() -> str:
     raw_keys = os.getenv("DECISIONDOC_API_KEYS")
@@ -26,12 +35,12 @@ def _live_client(monkeypatch, provider: str):
     return TestClient(create_app())
 
 
+@_requires_openai_sdk
+@pytest.mark.skipif(
+    _PROVIDER != "openai" or not os.getenv("OPENAI_API_KEY"),
+    reason="Set DECISIONDOC_PROVIDER=openai and OPENAI_API_KEY to run live OpenAI test.",
+)
 def test_live_openai_generate_ok(monkeypatch):
-    if os.getenv("DECISIONDOC_PROVIDER") != "openai" or not os.getenv("OPENAI_API_KEY"):
-        pytest.skip("Set DECISIONDOC_PROVIDER=openai and OPENAI_API_KEY to run live OpenAI test.")
-    if find_spec("openai") is None:
-        pytest.skip("openai SDK is not installed.")
-
     client = _live_client(monkeypatch, "openai")
     headers = {}
     api_key = _resolve_live_api_key()
@@ -44,12 +53,12 @@ def test_live_openai_generate_ok(monkeypatch):
     assert len(body["docs"]) == 4
 
 
+@_requires_genai_sdk
+@pytest.mark.skipif(
+    _PROVIDER != "gemini" or not os.getenv("GEMINI_API_KEY"),
+    reason="Set DECISIONDOC_PROVIDER=gemini and GEMINI_API_KEY to run live Gemini test.",
+)
 def test_live_gemini_generate_ok(monkeypatch):
-    if os.getenv("DECISIONDOC_PROVIDER") != "gemini" or not os.getenv("GEMINI_API_KEY"):
-        pytest.skip("Set DECISIONDOC_PROVIDER=gemini and GEMINI_API_KEY to run live Gemini test.")
-    if find_spec("google.genai") is None:
-        pytest.skip("google-genai SDK is not installed.")
-
     client = _live_client(monkeypatch, "gemini")
     headers = {}
     api_key = _resolve_live_api_key()
@@ -62,10 +71,11 @@ def test_live_gemini_generate_ok(monkeypatch):
     assert len(body["docs"]) == 4
 
 
+@pytest.mark.skipif(
+    _PROVIDER != "claude" or not os.getenv("ANTHROPIC_API_KEY"),
+    reason="Set DECISIONDOC_PROVIDER=claude and ANTHROPIC_API_KEY to run live Claude test.",
+)
 def test_live_claude_generate_ok(monkeypatch):
-    if os.getenv("DECISIONDOC_PROVIDER") != "claude" or not os.getenv("ANTHROPIC_API_KEY"):
-        pytest.skip("Set DECISIONDOC_PROVIDER=claude and ANTHROPIC_API_KEY to run live Claude test.")
-
     client = _live_client(monkeypatch, "claude")
     headers = {}
     api_key = _resolve_live_api_key()
@@ -78,18 +88,19 @@ def test_live_claude_generate_ok(monkeypatch):
     assert len(body["docs"]) == 4
 
 
+# Skip markers are evaluated closest-to-the-function first.
+@_requires_genai_sdk
+@_requires_openai_sdk
+@pytest.mark.skipif(not os.getenv("GEMINI_API_KEY"), reason="Set GEMINI_API_KEY to run live fallback test.")
+@pytest.mark.skipif(
+    os.getenv("DECISIONDOC_LIVE_FALLBACK_FORCE_OPENAI_FAILURE") != "1",
+    reason="Set DECISIONDOC_LIVE_FALLBACK_FORCE_OPENAI_FAILURE=1 to prove first-provider failure.",
+)
+@pytest.mark.skipif(
+    _PROVIDER != "openai,gemini",
+    reason="Set DECISIONDOC_PROVIDER=openai,gemini to run live fallback test.",
+)
 def test_live_openai_gemini_fallback_chain_ok(monkeypatch):
-    if os.getenv("DECISIONDOC_PROVIDER") != "openai,gemini":
-        pytest.skip("Set DECISIONDOC_PROVIDER=openai,gemini to run live fallback test.")
-    if os.getenv("DECISIONDOC_LIVE_FALLBACK_FORCE_OPENAI_FAILURE") != "1":
-        pytest.skip("Set DECISIONDOC_LIVE_FALLBACK_FORCE_OPENAI_FAILURE=1 to prove first-provider failure.")
-    if not os.getenv("GEMINI_API_KEY"):
-        pytest.skip("Set GEMINI_API_KEY to run live fallback test.")
-    if find_spec("openai") is None:
-        pytest.skip("openai SDK is not installed.")
-    if find_spec("google.genai") is None:
-        pytest.skip("google-genai SDK is not installed.")
-
     monkeypatch.setenv("OPENAI_API_KEY", "invalid-openai-key-for-fallback-proof")
     client = _live_client(monkeypatch, "openai,gemini")
     headers = {}
@@ -1,5 +1,8 @@
+import pytest
 from fastapi.testclient import TestClient
 
+from app.main import create_app
+
 
 def _create_client(tmp_path, monkeypatch):
     monkeypatch.setenv("DECISIONDOC_PROVIDER", "mock")
@@ -9,35 +12,20 @@ def _create_client(tmp_path, monkeypatch):
     monkeypatch.setenv("DECISIONDOC_MAINTENANCE", "0")
     monkeypatch.delenv("DECISIONDOC_API_KEY", raising=False)
     monkeypatch.delenv("DECISIONDOC_API_KEYS", raising=False)
-    from app.main import create_app
-
     return TestClient(create_app())
 
 
-def test_maintenance_blocks_generate(tmp_path, monkeypatch):
-    client = _create_client(tmp_path, monkeypatch)
-    monkeypatch.setenv("DECISIONDOC_MAINTENANCE", "1")
-    monkeypatch.setenv("DECISIONDOC_API_KEY", "expected-key")
-
-    response = client.post(
-        "/generate",
-        headers={"X-DecisionDoc-Api-Key": "expected-key"},
-        json={"title": "t", "goal": "g"},
-    )
-    assert response.status_code == 503
-    body = response.json()
-    assert body["code"] == "MAINTENANCE_MODE"
-    assert body["message"] == "Service temporarily unavailable."
-    assert body["request_id"] == response.headers.get("X-Request-Id")
-
-
-def test_maintenance_blocks_generate_export(tmp_path, monkeypatch):
+@pytest.mark.parametrize(
+    ("path", "flag"),
+    [("/generate", "1"), ("/generate/export", "true")],
+)
+def test_maintenance_blocks_generate(path, flag, tmp_path, monkeypatch):
     client = _create_client(tmp_path, monkeypatch)
-    monkeypatch.setenv("DECISIONDOC_MAINTENANCE", "true")
+    monkeypatch.setenv("DECISIONDOC_MAINTENANCE", flag)
     monkeypatch.setenv("DECISIONDOC_API_KEY", "expected-key")
 
     response = client.post(
-        "/generate/export",
+        path,
         headers={"X-DecisionDoc-Api-Key": "expected-key"},
         json={"title": "t", "goal": "g"},
     )
@@ -24,6 +24,15 @@ from app.main import app
 client = TestClient(app)
 
 
+def _isolated_client(tmp_path, monkeypatch) -> TestClient:
+    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    monkeypatch.setenv("DECISIONDOC_PROVIDER", "mock")
+    monkeypatch.setenv("DECISIONDOC_ENV", "dev")
+    from app.main import create_app
+
+    return TestClient(create_app())
+
+
 # ── Eval endpoints ───────────────────────────────────────────────────────────
 
 def test_eval_report_requires_auth():
@@ -141,7 +150,7 @@ def test_billing_cancel_requires_auth():
 
 # ── Approved document immutability ───────────────────────────────────────────
 
-def test_approved_doc_cannot_be_modified():
+def test_approved_doc_cannot_be_modified(tmp_path, monkeypatch):
     """PUT /approvals/{id}/docs must not succeed when document is already approved.
 
     Uses the system tenant to bypass tenant-middleware registration checks.
@@ -150,9 +159,10 @@ def test_approved_doc_cannot_be_modified():
     import os
     from app.storage.approval_store import ApprovalStore, ApprovalStatus
 
+    isolated_client = _isolated_client(tmp_path, monkeypatch)
     # Use system tenant — always registered
     tenant_id = os.getenv("SYSTEM_TENANT_ID", "system")
-    store = ApprovalStore(base_dir="data")
+    store = ApprovalStore(base_dir=str(tmp_path))
 
     rec = store.create(
         tenant_id=tenant_id,
@@ -166,7 +176,7 @@ def test_approved_doc_cannot_be_modified():
     store._set_status_direct(rec.approval_id, ApprovalStatus.APPROVED,
                              tenant_id=tenant_id)
 
-    res = client.put(
+    res = isolated_client.put(
         f"/approvals/{rec.approval_id}/docs",
         json={"username": "tester",
               "docs": [{"doc_type": "test", "markdown": "# Modified"}]},
@@ -181,13 +191,14 @@ def test_approved_doc_cannot_be_modified():
         assert "수정" in res.json().get("detail", "")
 
 
-def test_rejected_doc_cannot_be_modified():
+def test_rejected_doc_cannot_be_modified(tmp_path, monkeypatch):
     """PUT /approvals/{id}/docs must not succeed when document is rejected."""
     import os
     from app.storage.approval_store import ApprovalStore, ApprovalStatus
 
+    isolated_client = _isolated_client(tmp_path, monkeypatch)
     tenant_id = os.getenv("SYSTEM_TENANT_ID", "system")
-    store = ApprovalStore(base_dir="data")
+    store = ApprovalStore(base_dir=str(tmp_path))
 
     rec = store.create(
         tenant_id=tenant_id,
@@ -200,7 +211,7 @@ def test_rejected_doc_cannot_be_modified():
     store._set_status_direct(rec.approval_id, ApprovalStatus.REJECTED,
                              tenant_id=tenant_id)
 
-    res = client.put(
+    res = isolated_client.put(
         f"/approvals/{rec.approval_id}/docs",
         json={"username": "tester", "docs": []},
         headers={"X-Tenant-ID": tenant_id},
@@ -210,7 +221,7 @@ def test_rejected_doc_cannot_be_modified():
 
 # ── Withdraw wrong password ──────────────────────────────────────────────────
 
-def test_withdraw_wrong_password():
+def test_withdraw_wrong_password(tmp_path, monkeypatch):
     """DELETE /auth/withdraw with wrong password should return 400.
 
     Creates a fresh persisted user in the app-selected store, attempts
@@ -218,11 +229,12 @@ def test_withdraw_wrong_password():
     """
     from app.storage.user_store import get_user_store
 
+    isolated_client = _isolated_client(tmp_path, monkeypatch)
     username = f"wdtest_{uuid.uuid4().hex[:8]}"
     get_user_store(
         "system",
-        data_dir=client.app.state.data_dir,
-        backend=client.app.state.state_backend,
+        data_dir=isolated_client.app.state.data_dir,
+        backend=isolated_client.app.state.state_backend,
     ).create(
         username=username,
         display_name="Withdraw Test",
@@ -232,7 +244,7 @@ def test_withdraw_wrong_password():
     )
 
     # Login
-    login = client.post("/auth/login", json={
+    login = isolated_client.post("/auth/login", json={
         "username": username,
         "password": "ValidPass123!",
     })
@@ -245,7 +257,7 @@ def test_withdraw_wrong_password():
         "Content-Type": "application/json",
     }
 
-    res = client.request(
+    res = isolated_client.request(
         "DELETE",
         "/auth/withdraw",
         content=json.dumps({"password": "WrongPassword999!"}),
@@ -261,7 +273,7 @@ def test_withdraw_wrong_password():
 
 # ── Concurrent approval submit (race condition guard) ────────────────────────
 
-def test_concurrent_approval_submit_race_condition():
+def test_concurrent_approval_submit_race_condition(tmp_path):
     """Concurrent submits on the same approval must not corrupt the state.
 
     At most one submit should succeed; the rest should raise a ValueError
@@ -270,7 +282,7 @@ def test_concurrent_approval_submit_race_condition():
     from app.storage.approval_store import ApprovalStore
 
     tenant_id = f"test-race-{uuid.uuid4().hex[:6]}"
-    store = ApprovalStore(base_dir="data")
+    store = ApprovalStore(base_dir=str(tmp_path))
     rec = store.create(
         tenant_id=tenant_id,
         request_id=str(uuid.uuid4()),
@@ -308,9 +320,22 @@ def test_concurrent_approval_submit_race_condition():
 
 # ── Auto-bundle admin endpoints ──────────────────────────────────────────────
 
-def test_auto_bundles_list_requires_auth():
-    """GET /admin/auto-bundles requires admin auth."""
-    res = client.get("/admin/auto-bundles")
+def test_auto_bundles_list_requires_auth(tmp_path, monkeypatch):
+    """GET /admin/auto-bundles requires admin auth once the install has users."""
+    monkeypatch.setenv("JWT_SECRET_KEY", "auto-bundles-test-secret-at-least-32-bytes")
+    isolated_client = _isolated_client(tmp_path, monkeypatch)
+    registered = isolated_client.post(
+        "/auth/register",
+        json={
+            "username": "admin",
+            "display_name": "Admin",
+            "email": "admin@example.com",
+            "password": "AdminPass1!",
+        },
+    )
+    assert registered.status_code == 200
+
+    res = isolated_client.get("/admin/auto-bundles")
     assert res.status_code in (401, 403)
 
 
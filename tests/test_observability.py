@@ -1,11 +1,14 @@
 import logging
 import json
 import sys
+from collections.abc import Iterator
 from unittest.mock import AsyncMock, patch
 
 import httpx
+import pytest
 from fastapi.testclient import TestClient
 
+from app.main import create_app
 from app.observability.logging import JsonLineFormatter
 from app.services.meeting_recording_service import (
     MeetingRecordingService,
@@ -13,9 +16,9 @@ from app.services.meeting_recording_service import (
 )
 
 
-def _create_client(tmp_path, monkeypatch, provider="mock", procurement_enabled=False):
+def _apply_env(monkeypatch, data_dir, provider="mock", procurement_enabled=False) -> None:
     monkeypatch.setenv("DECISIONDOC_PROVIDER", provider)
-    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    monkeypatch.setenv("DATA_DIR", str(data_dir))
     monkeypatch.setenv("DECISIONDOC_TEMPLATE_VERSION", "v1")
     monkeypatch.setenv("DECISIONDOC_ENV", "dev")
     monkeypatch.setenv("DECISIONDOC_MAINTENANCE", "0")
@@ -25,40 +28,67 @@ def _create_client(tmp_path, monkeypatch, provider="mock", procurement_enabled=F
     )
     monkeypatch.delenv("DECISIONDOC_API_KEY", raising=False)
     monkeypatch.delenv("DECISIONDOC_API_KEYS", raising=False)
-    from app.main import create_app
 
+
+def _create_client(tmp_path, monkeypatch, provider="mock", procurement_enabled=False):
+    _apply_env(monkeypatch, tmp_path, provider=provider, procurement_enabled=procurement_enabled)
     return TestClient(create_app())
 
 
-def _captured_events(caplog, capsys) -> list[dict]:
-    events = []
+@pytest.fixture(scope="module")
+def generate_app(tmp_path_factory):
+    """One mock app for the tests that only call /generate and inspect logs.
+
+    Tests that register users or create projects keep their own app so their
+    state cannot collide.
+    """
+    data_dir = tmp_path_factory.mktemp("observability")
+    with pytest.MonkeyPatch.context() as mp:
+        _apply_env(mp, data_dir)
+        app = create_app()
+    app.state.shared_data_dir = data_dir
+    return app
+
+
+@pytest.fixture
+def generate_client(generate_app, monkeypatch):
+    _apply_env(monkeypatch, generate_app.state.shared_data_dir)
+    return TestClient(generate_app)
+
+
+def _parse_json_object(text: str) -> dict | None:
+    if not text.startswith("{"):
+        return None
+    try:
+        parsed = json.loads(text)
+    except ValueError:
+        return None
+    return parsed if isinstance(parsed, dict) else None
+
+
+def _iter_events(caplog, capsys) -> Iterator[dict]:
+    """Yield JSON log events from caplog, falling back to stderr when caplog has none."""
+    found = False
     for record in caplog.records:
         if isinstance(record.msg, dict):
-            events.append(record.msg)
-            continue
-        text = record.getMessage()
-        if isinstance(text, str) and text.startswith("{"):
-            try:
-                parsed = json.loads(text)
-            except ValueError:
-                continue
-            if isinstance(parsed, dict):
-                events.append(parsed)
-    if events:
-        return events
-
-    stderr_output = capsys.readouterr().err
-    for line in stderr_output.splitlines():
-        line = line.strip()
-        if not line.startswith("{"):
-            continue
-        try:
-            parsed = json.loads(line)
-        except ValueError:
-            continue
-        if isinstance(parsed, dict):
-            events.append(parsed)
-    return events
+            event = record.msg
+        else:
+            text = record.getMessage()
+            event = _parse_json_object(text) if isinstance(text, str) else None
+        if event is not None:
+            found = True
+            yield event
+    if found:
+        return
+
+    for line in capsys.readouterr().err.splitlines():
+        event = _parse_json_object(line.strip())
+        if event is not None:
+            yield event
+
+
+def _captured_events(caplog, capsys) -> list[dict]:
+    return list(_iter_events(caplog, capsys))
 
 
 def _create_project(client: TestClient) -> str:
@@ -131,19 +161,24 @@ def _install_transcription_failure_transport(
     )
 
 
-def test_logs_emitted_for_generate(tmp_path, monkeypatch, caplog, capsys):
+def test_logs_emitted_for_generate(generate_client, caplog, capsys):
     caplog.set_level(logging.INFO)
-    client = _create_client(tmp_path, monkeypatch)
 
-    response = client.post("/generate", json={"title": "obs", "goal": "capture logs"})
+    response = generate_client.post("/generate", json={"title": "obs", "goal": "capture logs"})
     assert response.status_code == 200
 
-    events = _captured_events(caplog, capsys)
-    assert any(e.get("event") == "request.completed" for e in events)
-    generate_events = [e for e in events if e.get("event") == "generate.completed"]
-    assert generate_events
+    # One pass: remember whether the request completed and keep only the last generate event.
+    request_completed = False
+    evt = None
+    for event in _iter_events(caplog, capsys):
+        name = event.get("event")
+        if name == "request.completed":
+            request_completed = True
+        elif name == "generate.completed":
+            evt = event
+    assert request_completed
+    assert evt is not None
 
-    evt = generate_events[-1]
     assert isinstance(evt.get("request_id"), str)
     assert evt.get("status_code") == 200
     for key in ["provider_ms", "render_ms", "lints_ms", "validator_ms"]:
@@ -151,12 +186,11 @@ def test_logs_emitted_for_generate(tmp_path, monkeypatch, caplog, capsys):
         assert evt.get(key) >= 0
 
 
-def test_logs_do_not_contain_sensitive_tokens(tmp_path, monkeypatch, caplog):
+def test_logs_do_not_contain_sensitive_tokens(generate_client, caplog):
     caplog.set_level(logging.INFO)
-    client = _create_client(tmp_path, monkeypatch)
 
     sentinel = "SUPER_SECRET_DO_NOT_LOG"
-    response = client.post(
+    response = generate_client.post(
         "/generate",
         json={
             "title": "sensitive",
@@ -168,10 +202,27 @@ def test_logs_do_not_contain_sensitive_tokens(tmp_path, monkeypatch, caplog):
     )
     assert response.status_code == 200
 
-    all_logs = "\n".join([caplog.text] + [str(r.msg) for r in caplog.records])
-    assert sentinel not in all_logs
-    assert "OPENAI_API_KEY" not in all_logs
-    assert "GEMINI_API_KEY" not in all_logs
+    forbidden = (sentinel, "OPENAI_API_KEY", "GEMINI_API_KEY")
+    # handler.format() renders each record as caplog.text does (message, dict
+    # payloads and tracebacks), one record at a time instead of one joined blob.
+    for record in caplog.records:
+        text = caplog.handler.format(record)
+        leaked = [token for token in forbidden if token in text]
+        assert not leaked, f"{leaked} leaked in log record: {text[:200]}"
+
+
+def test_timer_tic_toc_records_rounded_milliseconds(monkeypatch):
+    from app.observability import timing
+    from app.observability.timing import Timer
+
+    clock = iter([1_000_000, 3_600_000])
+    monkeypatch.setattr(timing.time, "perf_counter_ns", lambda: next(clock))
+    timer = Timer()
+
+    start = timer.tic()
+    timer.toc("render_ms", start)
+
+    assert timer.durations_ms == {"render_ms": 3}
 
 
 def test_json_formatter_includes_traceback_for_exception_records():
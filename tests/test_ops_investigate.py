@@ -1,11 +1,15 @@
+import gzip
 import hashlib
 import io
 import json
 import logging
+import re
+import threading
 from datetime import UTC, datetime, timedelta
 
 from fastapi.testclient import TestClient
 
+import app.main as main_module
 from app.ops.service import OpsInvestigationService
 
 
@@ -19,8 +23,6 @@ def _create_client(tmp_path, monkeypatch, ops_service):
     monkeypatch.delenv("DECISIONDOC_API_KEY", raising=False)
     monkeypatch.delenv("DECISIONDOC_API_KEYS", raising=False)
 
-    import app.main as main_module
-
     monkeypatch.setattr(main_module, "get_ops_service", lambda: ops_service)
     return TestClient(main_module.create_app())
 
@@ -160,6 +162,31 @@ class _QueryAwareCloudWatchClient:
         }
 
 
+# Serialized once at import; filter_log_events hands out fresh event dicts.
+_FAKE_LOG_MESSAGES = (
+    json.dumps(
+        {
+            "event": "request.failed",
+            "error_code": "PROVIDER_FAILED",
+            "request_id": "req-1",
+            "raw": "SUPER_SECRET_DO_NOT_STORE",
+            "llm_prompt_tokens": 100,
+            "llm_output_tokens": 50,
+            "llm_total_tokens": 150,
+        }
+    ),
+    json.dumps(
+        {
+            "event": "request.completed",
+            "request_id": "req-2",
+            "llm_prompt_tokens": 80,
+            "llm_output_tokens": 40,
+            "llm_total_tokens": 120,
+        }
+    ),
+)
+
+
 class _FakeLogsClient:
     def __init__(self):
         self.calls = 0
@@ -167,50 +194,22 @@ class _FakeLogsClient:
     def filter_log_events(self, **kwargs):  # noqa: ANN003
         self.calls += 1
         _ = kwargs
-        sentinel = "SUPER_SECRET_DO_NOT_STORE"
-        return {
-            "events": [
-                {
-                    "message": json.dumps(
-                        {
-                            "event": "request.failed",
-                            "error_code": "PROVIDER_FAILED",
-                            "request_id": "req-1",
-                            "raw": sentinel,
-                            "llm_prompt_tokens": 100,
-                            "llm_output_tokens": 50,
-                            "llm_total_tokens": 150,
-                        }
-                    )
-                },
-                {
-                    "message": json.dumps(
-                        {
-                            "event": "request.completed",
-                            "request_id": "req-2",
-                            "llm_prompt_tokens": 80,
-                            "llm_output_tokens": 40,
-                            "llm_total_tokens": 120,
-                        }
-                    )
-                },
-            ]
-        }
+        return {"events": [{"message": message} for message in _FAKE_LOG_MESSAGES]}
 
 
 class _FakeS3Client:
     def __init__(self):
-        self.objects: dict[str, str] = {}
+        self.objects: dict[str, bytes] = {}
 
     def put_object(self, *, Bucket, Key, Body, ContentType):  # noqa: N803
         _ = Bucket, ContentType
-        self.objects[Key] = Body.decode("utf-8")
+        self.objects[Key] = Body
 
     def get_object(self, *, Bucket, Key):  # noqa: N803
         _ = Bucket
         if Key not in self.objects:
             raise KeyError(Key)
-        return {"Body": io.BytesIO(self.objects[Key].encode("utf-8"))}
+        return {"Body": io.BytesIO(self.objects[Key])}
 
 
 class _FakeStatuspageClient:
@@ -240,6 +239,37 @@ def _iso_utc(dt: datetime) -> str:
     return dt.astimezone(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
 
 
+# Fixed clock shared by the service tests, plus the index timestamps they preseed.
+_NOW = datetime(2026, 2, 20, 12, 34, 56, tzinfo=UTC)
+_TS_30S_AGO = _iso_utc(_NOW - timedelta(seconds=30))
+_TS_60S_AGO = _iso_utc(_NOW - timedelta(seconds=60))
+_TS_301S_AGO = _iso_utc(_NOW - timedelta(seconds=301))
+
+
+def _index_blob(
+    incident_key: str,
+    *,
+    reason: str,
+    updated_at: str,
+    statuspage: dict,
+    lambda_errors: int | None = None,
+) -> bytes:
+    """Encoded dedup index entry as the service stores it, pointing at a fixed prior run."""
+    entry = {
+        "incident_key": incident_key,
+        "stage": "prod",
+        "window_minutes": 30,
+        "reason": reason,
+        "updated_at": updated_at,
+        "ttl_seconds": 300,
+        "latest_report_prefix": f"decisiondoc-ai/reports/incidents/{incident_key}/20260220-120000-abcd/",
+    }
+    if lambda_errors is not None:
+        entry["summary"] = {"counts": {"lambda_errors": lambda_errors}}
+    entry["statuspage"] = statuspage
+    return json.dumps(entry).encode()
+
+
 def _incident_key(*, stage: str, window_minutes: int, bucket_seconds: int, now: datetime, reason: str) -> str:
     reason_norm = reason.replace("\r", " ").replace("\n", " ").strip().lower()
     reason_norm = " ".join(reason_norm.split())[:80]
@@ -249,6 +279,12 @@ def _incident_key(*, stage: str, window_minutes: int, bucket_seconds: int, now:
     return f"inc-{digest}"
 
 
+# The incident most service tests investigate, keyed at _NOW.
+_INCIDENT_KEY = _incident_key(stage="prod", window_minutes=30, bucket_seconds=300, now=_NOW, reason="Elevated 5xx")
+_INDEX_KEY = f"decisiondoc-ai/reports/incidents/index/{_INCIDENT_KEY}.json"
+_LATEST_PREFIX = f"decisiondoc-ai/reports/incidents/{_INCIDENT_KEY}/20260220-120000-abcd/"
+
+
 def _ops_service(monkeypatch, *, now, fake_s3, fake_cw, fake_logs, fake_statuspage):
     monkeypatch.setenv("DECISIONDOC_S3_BUCKET", "ops-bucket")
     monkeypatch.setenv("DECISIONDOC_S3_PREFIX", "decisiondoc-ai/")
@@ -268,7 +304,7 @@ def _ops_service(monkeypatch, *, now, fake_s3, fake_cw, fake_logs, fake_statuspa
 
 
 def test_investigate_deduped_returns_cached_without_collectors(monkeypatch):
-    now = datetime(2026, 2, 20, 12, 34, 56, tzinfo=UTC)
+    now = _NOW
     fake_s3 = _FakeS3Client()
     fake_cw = _FakeCloudWatchClient()
     fake_logs = _FakeLogsClient()
@@ -282,26 +318,20 @@ def test_investigate_deduped_returns_cached_without_collectors(monkeypatch):
         fake_statuspage=fake_status,
     )
 
-    incident_key = _incident_key(stage="prod", window_minutes=30, bucket_seconds=300, now=now, reason="Elevated 5xx")
-    index_key = f"decisiondoc-ai/reports/incidents/index/{incident_key}.json"
-    latest_report_prefix = f"decisiondoc-ai/reports/incidents/{incident_key}/20260220-120000-abcd/"
-    fake_s3.objects[index_key] = json.dumps(
-        {
-            "incident_key": incident_key,
-            "stage": "prod",
-            "window_minutes": 30,
-            "reason": "elevated 5xx",
-            "updated_at": _iso_utc(now - timedelta(seconds=60)),
-            "ttl_seconds": 300,
-            "latest_report_prefix": latest_report_prefix,
-            "summary": {"counts": {"lambda_errors": 99}},
-            "statuspage": {
-                "incident_id": "status-inc-1",
-                "incident_url": "https://status.example/incidents/1",
-                "last_state": "investigating",
-                "last_update_at": _iso_utc(now - timedelta(seconds=60)),
-            },
-        }
+    incident_key = _INCIDENT_KEY
+    index_key = _INDEX_KEY
+    latest_report_prefix = _LATEST_PREFIX
+    fake_s3.objects[index_key] = _index_blob(
+        incident_key,
+        reason="elevated 5xx",
+        updated_at=_TS_60S_AGO,
+        lambda_errors=99,
+        statuspage={
+            "incident_id": "status-inc-1",
+            "incident_url": "https://status.example/incidents/1",
+            "last_state": "investigating",
+            "last_update_at": _TS_60S_AGO,
+        },
     )
 
     result = service.investigate(
@@ -323,7 +353,7 @@ def test_investigate_deduped_returns_cached_without_collectors(monkeypatch):
 
 
 def test_collect_metrics_without_api_id_skips_api_gateway_queries(monkeypatch):
-    now = datetime(2026, 2, 20, 12, 34, 56, tzinfo=UTC)
+    now = _NOW
     fake_s3 = _FakeS3Client()
     fake_cw = _QueryAwareCloudWatchClient()
     fake_logs = _FakeLogsClient()
@@ -357,8 +387,17 @@ def test_collect_metrics_without_api_id_skips_api_gateway_queries(monkeypatch):
     }
 
 
+def test_p95_metric_interpolates_across_datapoints():
+    service = OpsInvestigationService(statuspage_client=_FakeStatuspageClient())
+
+    assert service._p95_metric({"Values": list(range(1, 101))}) == 95
+    assert service._p95_metric({"Values": [245.4]}) == 245
+    assert service._p95_metric({"Values": [10, 20, True, "x"]}) == 20
+    assert service._p95_metric({"Values": ["x"]}) is None
+
+
 def test_investigate_force_bypasses_dedupe_and_writes_new_report(monkeypatch):
-    now = datetime(2026, 2, 20, 12, 34, 56, tzinfo=UTC)
+    now = _NOW
     fake_s3 = _FakeS3Client()
     fake_cw = _FakeCloudWatchClient()
     fake_logs = _FakeLogsClient()
@@ -372,23 +411,17 @@ def test_investigate_force_bypasses_dedupe_and_writes_new_report(monkeypatch):
         fake_statuspage=fake_status,
     )
 
-    incident_key = _incident_key(stage="prod", window_minutes=30, bucket_seconds=300, now=now, reason="Elevated 5xx")
-    index_key = f"decisiondoc-ai/reports/incidents/index/{incident_key}.json"
-    fake_s3.objects[index_key] = json.dumps(
-        {
-            "incident_key": incident_key,
-            "stage": "prod",
-            "window_minutes": 30,
-            "reason": "elevated 5xx",
-            "updated_at": _iso_utc(now - timedelta(seconds=60)),
-            "ttl_seconds": 300,
-            "latest_report_prefix": f"decisiondoc-ai/reports/incidents/{incident_key}/20260220-120000-abcd/",
-            "statuspage": {
-                "incident_id": "status-inc-1",
-                "incident_url": "https://status.example/incidents/1",
-                "last_state": "investigating",
-            },
-        }
+    incident_key = _INCIDENT_KEY
+    index_key = _INDEX_KEY
+    fake_s3.objects[index_key] = _index_blob(
+        incident_key,
+        reason="elevated 5xx",
+        updated_at=_TS_60S_AGO,
+        statuspage={
+            "incident_id": "status-inc-1",
+            "incident_url": "https://status.example/incidents/1",
+            "last_state": "investigating",
+        },
     )
 
     result = service.investigate(
@@ -409,7 +442,7 @@ def test_investigate_force_bypasses_dedupe_and_writes_new_report(monkeypatch):
 
 
 def test_statuspage_incident_reused_not_recreated(monkeypatch):
-    now = datetime(2026, 2, 20, 12, 34, 56, tzinfo=UTC)
+    now = _NOW
     fake_s3 = _FakeS3Client()
     fake_cw = _FakeCloudWatchClient()
     fake_logs = _FakeLogsClient()
@@ -423,23 +456,17 @@ def test_statuspage_incident_reused_not_recreated(monkeypatch):
         fake_statuspage=fake_status,
     )
 
-    incident_key = _incident_key(stage="prod", window_minutes=30, bucket_seconds=300, now=now, reason="Elevated 5xx")
-    index_key = f"decisiondoc-ai/reports/incidents/index/{incident_key}.json"
-    fake_s3.objects[index_key] = json.dumps(
-        {
-            "incident_key": incident_key,
-            "stage": "prod",
-            "window_minutes": 30,
-            "reason": "elevated 5xx",
-            "updated_at": _iso_utc(now - timedelta(seconds=301)),
-            "ttl_seconds": 300,
-            "latest_report_prefix": f"decisiondoc-ai/reports/incidents/{incident_key}/20260220-120000-abcd/",
-            "statuspage": {
-                "incident_id": "status-inc-1",
-                "incident_url": "https://status.example/incidents/1",
-                "last_state": "investigating",
-            },
-        }
+    incident_key = _INCIDENT_KEY
+    index_key = _INDEX_KEY
+    fake_s3.objects[index_key] = _index_blob(
+        incident_key,
+        reason="elevated 5xx",
+        updated_at=_TS_301S_AGO,
+        statuspage={
+            "incident_id": "status-inc-1",
+            "incident_url": "https://status.example/incidents/1",
+            "last_state": "investigating",
+        },
     )
 
     result = service.investigate(
@@ -457,7 +484,7 @@ def test_statuspage_incident_reused_not_recreated(monkeypatch):
 
 
 def test_statuspage_failure_soft_does_not_fail_investigation_by_default(monkeypatch):
-    now = datetime(2026, 2, 20, 12, 34, 56, tzinfo=UTC)
+    now = _NOW
     fake_s3 = _FakeS3Client()
     fake_cw = _FakeCloudWatchClient()
     fake_logs = _FakeLogsClient()
@@ -488,7 +515,7 @@ def test_statuspage_failure_soft_does_not_fail_investigation_by_default(monkeypa
 
 
 def test_ops_investigate_notify_false_skips_statuspage(monkeypatch):
-    now = datetime(2026, 2, 20, 12, 34, 56, tzinfo=UTC)
+    now = _NOW
     fake_s3 = _FakeS3Client()
     fake_cw = _FakeCloudWatchClient()
     fake_logs = _FakeLogsClient()
@@ -520,7 +547,7 @@ def test_ops_investigate_notify_false_skips_statuspage(monkeypatch):
 
 
 def test_ops_investigate_emits_kpi_log_fields(monkeypatch, caplog):
-    now = datetime(2026, 2, 20, 12, 34, 56, tzinfo=UTC)
+    now = _NOW
     fake_s3 = _FakeS3Client()
     fake_cw = _FakeCloudWatchClient()
     fake_logs = _FakeLogsClient()
@@ -571,13 +598,15 @@ def test_ops_investigate_emits_kpi_log_fields(monkeypatch, caplog):
         assert event[key] >= 0
     assert event["statuspage_posted"] is False
 
-    all_logs = "\n".join([caplog.text] + [str(record.msg) for record in caplog.records])
-    assert sentinel not in all_logs
-    assert "VERY_SECRET_OPS_KEY_VALUE" not in all_logs
+    forbidden = (sentinel, "VERY_SECRET_OPS_KEY_VALUE")
+    for record in caplog.records:
+        text = caplog.handler.format(record)
+        leaked = [token for token in forbidden if token in text]
+        assert not leaked, f"{leaked} leaked in log record: {text[:200]}"
 
 
 def test_ops_report_contains_no_sensitive_strings(monkeypatch):
-    now = datetime(2026, 2, 20, 12, 34, 56, tzinfo=UTC)
+    now = _NOW
     sentinel = "SUPER_SECRET_DO_NOT_STORE"
     sentinel_api_key = "VERY_SECRET_OPS_KEY_VALUE"
     monkeypatch.setenv("DECISIONDOC_OPS_KEY", sentinel_api_key)
@@ -606,15 +635,15 @@ def test_ops_report_contains_no_sensitive_strings(monkeypatch):
     assert result["report_s3_key"].endswith("/report.json")
     assert result["statuspage_incident_url"] == "https://status.example/incidents/abc"
 
-    stored_blob = "\n".join(fake_s3.objects.values())
-    assert sentinel not in stored_blob
-    assert sentinel_api_key not in stored_blob
-    assert "requirements=" not in stored_blob
-    assert "output_text" not in stored_blob
+    forbidden = (sentinel.encode(), sentinel_api_key.encode(), b"requirements=", b"output_text")
+    forbidden_re = re.compile(b"|".join(map(re.escape, forbidden)))
+    for key, body in fake_s3.objects.items():
+        leaked = forbidden_re.search(body)
+        assert leaked is None, f"{leaked.group()!r} stored in {key}"
 
 
 def test_investigate_response_includes_report_md_key(monkeypatch):
-    now = datetime(2026, 2, 20, 12, 34, 56, tzinfo=UTC)
+    now = _NOW
     fake_s3 = _FakeS3Client()
     fake_cw = _FakeCloudWatchClient()
     fake_logs = _FakeLogsClient()
@@ -648,7 +677,7 @@ def test_investigate_response_includes_report_md_key(monkeypatch):
 
 
 def test_investigate_deduped_response_includes_report_md_key(monkeypatch):
-    now = datetime(2026, 2, 20, 12, 34, 56, tzinfo=UTC)
+    now = _NOW
     fake_s3 = _FakeS3Client()
     fake_cw = _FakeCloudWatchClient()
     fake_logs = _FakeLogsClient()
@@ -665,23 +694,17 @@ def test_investigate_deduped_response_includes_report_md_key(monkeypatch):
     incident_key = _incident_key(stage="prod", window_minutes=30, bucket_seconds=300, now=now, reason="cache test")
     index_key = f"decisiondoc-ai/reports/incidents/index/{incident_key}.json"
     latest_prefix = f"decisiondoc-ai/reports/incidents/{incident_key}/20260220-120000-abcd/"
-    fake_s3.objects[index_key] = json.dumps(
-        {
-            "incident_key": incident_key,
-            "stage": "prod",
-            "window_minutes": 30,
-            "reason": "cache test",
-            "updated_at": _iso_utc(now - timedelta(seconds=30)),
-            "ttl_seconds": 300,
-            "latest_report_prefix": latest_prefix,
-            "summary": {"counts": {"lambda_errors": 5}},
-            "statuspage": {
-                "incident_id": "",
-                "incident_url": "",
-                "last_state": "investigating",
-                "last_update_at": _iso_utc(now - timedelta(seconds=30)),
-            },
-        }
+    fake_s3.objects[index_key] = _index_blob(
+        incident_key,
+        reason="cache test",
+        updated_at=_TS_30S_AGO,
+        lambda_errors=5,
+        statuspage={
+            "incident_id": "",
+            "incident_url": "",
+            "last_state": "investigating",
+            "last_update_at": _TS_30S_AGO,
+        },
     )
 
     result = service.investigate(
@@ -698,3 +721,113 @@ def test_investigate_deduped_response_includes_report_md_key(monkeypatch):
     assert result["report_md_key"] is not None
     assert result["report_md_key"] == f"{latest_prefix}report.md"
     assert result["report_s3_key"] == f"{latest_prefix}report.json"
+
+
+class _RecordingS3Client(_FakeS3Client):
+    def __init__(self):
+        super().__init__()
+        self.put_kwargs: dict[str, dict] = {}
+
+    def put_object(self, *, Bucket, Key, Body, ContentType, **kwargs):  # noqa: N803
+        _ = Bucket, ContentType
+        self.put_kwargs[Key] = kwargs
+        if kwargs.get("ContentEncoding") == "gzip":
+            Body = gzip.decompress(Body)
+        self.objects[Key] = Body
+
+
+def test_investigate_gzip_flag_compresses_report_json(monkeypatch):
+    now = _NOW
+    fake_s3 = _RecordingS3Client()
+    service = _ops_service(
+        monkeypatch,
+        now=now,
+        fake_s3=fake_s3,
+        fake_cw=_FakeCloudWatchClient(),
+        fake_logs=_FakeLogsClient(),
+        fake_statuspage=_FakeStatuspageClient(),
+    )
+    monkeypatch.setenv("DECISIONDOC_S3_GZIP", "1")
+
+    result = service.investigate(
+        window_minutes=30,
+        reason="gzip report",
+        stage="prod",
+        request_id="gzip-req-1",
+        notify=False,
+    )
+
+    json_key = result["report_json_key"]
+    assert fake_s3.put_kwargs[json_key] == {"ContentEncoding": "gzip"}
+    assert fake_s3.put_kwargs[result["report_md_key"]] == {}
+    assert json.loads(fake_s3.objects[json_key])["request_id"] == "gzip-req-1"
+
+
+def test_investigate_collects_metrics_and_logs_concurrently(monkeypatch):
+    now = _NOW
+    barrier = threading.Barrier(2, timeout=5)
+
+    class _BarrierCloudWatchClient(_FakeCloudWatchClient):
+        def get_metric_data(self, **kwargs):  # noqa: ANN003
+            barrier.wait()
+            return super().get_metric_data(**kwargs)
+
+    class _BarrierLogsClient(_FakeLogsClient):
+        def filter_log_events(self, **kwargs):  # noqa: ANN003
+            barrier.wait()
+            return super().filter_log_events(**kwargs)
+
+    fake_s3 = _FakeS3Client()
+    service = _ops_service(
+        monkeypatch,
+        now=now,
+        fake_s3=fake_s3,
+        fake_cw=_BarrierCloudWatchClient(),
+        fake_logs=_BarrierLogsClient(),
+        fake_statuspage=_FakeStatuspageClient(),
+    )
+
+    result = service.investigate(
+        window_minutes=30,
+        reason="parallel collect",
+        stage="prod",
+        request_id="parallel-req-1",
+        notify=False,
+    )
+
+    counts = result["summary"]["counts"]
+    assert counts["lambda_errors"] == 3
+    assert counts["failed_events"] == 1
+
+
+def test_investigate_builds_aws_clients_before_fanning_out(monkeypatch):
+    import boto3
+
+    built_on: list[tuple[str, str]] = []
+    fakes = {"cloudwatch": _FakeCloudWatchClient(), "logs": _FakeLogsClient()}
+
+    def _client(name, *args, **kwargs):  # noqa: ANN002, ANN003
+        built_on.append((name, threading.current_thread().name))
+        return fakes[name]
+
+    monkeypatch.setattr(boto3, "client", _client)
+    service = _ops_service(
+        monkeypatch,
+        now=_NOW,
+        fake_s3=_FakeS3Client(),
+        fake_cw=None,
+        fake_logs=None,
+        fake_statuspage=_FakeStatuspageClient(),
+    )
+
+    result = service.investigate(
+        window_minutes=30,
+        reason="cold clients",
+        stage="prod",
+        request_id="cold-req-1",
+        notify=False,
+    )
+
+    caller = threading.current_thread().name
+    assert built_on == [("cloudwatch", caller), ("logs", caller)]
+    assert result["summary"]["counts"]["lambda_errors"] == 3
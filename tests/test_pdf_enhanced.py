@@ -222,6 +222,25 @@ def test_pdf_source_in_prompt():
     assert "This is the PDF raw text content" in prompt
 
 
+def test_prompt_keeps_static_schema_prefix_ahead_of_request_fields():
+    """Per-request tone and requirements must follow the bundle-static schema prefix."""
+    from app.bundle_catalog.registry import get_bundle_spec
+    from app.domain.schema import build_bundle_prompt
+
+    spec = get_bundle_spec("tech_decision")
+    formal = build_bundle_prompt(
+        {"title": "A", "goal": "first", "doc_tone": "formal"}, schema_version="v1", bundle_spec=spec
+    )
+    concise = build_bundle_prompt(
+        {"title": "B", "goal": "second", "doc_tone": "concise"}, schema_version="v1", bundle_spec=spec
+    )
+
+    prefix_end = formal.index("\n", formal.index("schema={")) + 1
+    assert concise[:prefix_end] == formal[:prefix_end]
+    assert formal.index("[문서 톤 지시]") > formal.index("schema={")
+    assert formal.index("[문서 톤 지시]") < formal.index("requirements=")
+
+
 def test_quality_prompt_forbids_ungrounded_specifics():
     from app.domain.schema import build_bundle_prompt
 
@@ -169,14 +169,14 @@ def test_zip_cache_missing_returns_none():
 # ── Feature 2: G2B deadline alerts ───────────────────────────────────────────
 
 
-def test_g2b_bookmark_deadline_stored():
+def test_g2b_bookmark_deadline_stored(tmp_path):
     """Bookmarks with imminent deadlines should be retrievable."""
     import uuid
     from app.storage.bookmark_store import BookmarkStore
     from datetime import datetime, timedelta
 
     tenant = f"test-deadline-{uuid.uuid4().hex[:8]}"
-    store = BookmarkStore(tenant_id=tenant)
+    store = BookmarkStore(base_dir=str(tmp_path), tenant_id=tenant)
     tomorrow = (datetime.now() + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S")
     bid = f"URGENT-{uuid.uuid4().hex[:6]}"
     store.add(
@@ -194,14 +194,14 @@ def test_g2b_bookmark_deadline_stored():
     assert urgent[0]["deadline"] == tomorrow
 
 
-def test_g2b_bookmark_past_deadline():
+def test_g2b_bookmark_past_deadline(tmp_path):
     """Past-deadline bookmarks should be stored but not 'urgent'."""
     import uuid
     from app.storage.bookmark_store import BookmarkStore
     from datetime import datetime, timedelta
 
     tenant = f"test-past-{uuid.uuid4().hex[:8]}"
-    store = BookmarkStore(tenant_id=tenant)
+    store = BookmarkStore(base_dir=str(tmp_path), tenant_id=tenant)
     past = (datetime.now() - timedelta(days=5)).strftime("%Y-%m-%d %H:%M:%S")
     bid = f"PAST-{uuid.uuid4().hex[:6]}"
     store.add(
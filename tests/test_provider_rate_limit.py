@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import pytest
+
+import app.providers.rate_limit as rate_limit
+from app.providers.rate_limit import (
+    ProviderRateLimitedError,
+    ProviderRateLimiter,
+    TokenBucket,
+    estimate_prompt_tokens,
+    parse_rate_limits,
+)
+from app.services.generation.errors import (
+    ProviderFailedError,
+    is_provider_rate_limited,
+    provider_failure_retry_after_seconds,
+)
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_reserves_until_empty_then_reports_wait():
+    clock = _FakeClock()
+    bucket = TokenBucket(2, 1.0, clock=clock)
+
+    assert bucket.reserve(1) == 0.0
+    assert bucket.reserve(1) == 0.0
+    assert bucket.reserve(1) == 1.0
+
+    clock.now += 3.0
+    assert bucket.reserve(1) == 0.0
+
+
+def test_token_bucket_clamps_oversized_requests_to_capacity():
+    clock = _FakeClock()
+    bucket = TokenBucket(10, 5.0, clock=clock)
+
+    assert bucket.reserve(1_000) == 0.0
+    assert bucket.reserve(5) == 1.0
+
+
+def test_rate_limiter_blocks_on_rpm_budget_per_provider_and_model():
+    clock = _FakeClock()
+    limiter = ProviderRateLimiter({"model-a": (60, 1_000_000)}, clock=clock, sleep=clock.sleep)
+
+    for _ in range(60):
+        assert limiter.acquire("openai", "model-a", 10) == 0.0
+    assert limiter.acquire("openai", "model-a", 10) == 1.0
+    assert clock.sleeps == [1.0]
+    # Same model under another provider keeps its own buckets.
+    assert limiter.acquire("gemini", "model-a", 10) == 0.0
+
+
+def test_rate_limiter_blocks_on_tpm_budget():
+    clock = _FakeClock()
+    limiter = ProviderRateLimiter({"model-a": (1_000, 600)}, clock=clock, sleep=clock.sleep)
+
+    assert limiter.acquire("openai", "model-a", 600) == 0.0
+    assert limiter.acquire("openai", "model-a", 30) == 3.0
+
+
+def test_rate_limiter_rejects_waits_past_the_cap_and_refunds_the_reservation():
+    clock = _FakeClock()
+    limiter = ProviderRateLimiter(
+        {"model-a": (60, 1_000_000)}, clock=clock, sleep=clock.sleeps.append, max_wait=1.5
+    )
+
+    for _ in range(61):
+        limiter.acquire("openai", "model-a", 10)
+    with pytest.raises(ProviderRateLimitedError) as excinfo:
+        limiter.acquire("openai", "model-a", 10)
+    assert clock.sleeps == [1.0]
+
+    # Surfaces through the generation layer as the usual 503 rate-limit guidance.
+    try:
+        raise ProviderFailedError("Provider failed.") from excinfo.value
+    except ProviderFailedError as wrapped:
+        assert is_provider_rate_limited(wrapped)
+        assert provider_failure_retry_after_seconds(wrapped) == 2
+
+    # The rejected call gave its slot back, so the queue is only one request deep.
+    clock.now += 1.0
+    assert limiter.acquire("openai", "model-a", 10) == 1.0
+
+
+def test_rate_limiter_caps_waits_at_the_provider_timeout(monkeypatch):
+    monkeypatch.setenv("DECISIONDOC_PROVIDER_TIMEOUT", "2")
+    clock = _FakeClock()
+    limiter = ProviderRateLimiter({"model-a": (1_000, 600)}, clock=clock, sleep=clock.sleep)
+
+    assert limiter.acquire("openai", "model-a", 600) == 0.0
+    assert limiter.acquire("openai", "model-a", 20) == 2.0
+    with pytest.raises(ProviderRateLimitedError):
+        limiter.acquire("openai", "model-a", 30)
+
+
+def test_rate_limiter_skips_models_without_limits():
+    clock = _FakeClock()
+    limiter = ProviderRateLimiter({}, clock=clock, sleep=clock.sleep)
+
+    for _ in range(10):
+        assert limiter.acquire("openai", "unknown-model", 10_000_000) == 0.0
+    assert clock.sleeps == []
+
+
+def test_parse_rate_limits_skips_invalid_entries():
+    assert parse_rate_limits("gpt-4o-mini=10:2000, bad, x=1:y, z=0:5,gemini-2.0-flash = 5:100") == {
+        "gpt-4o-mini": (10, 2000),
+        "gemini-2.0-flash": (5, 100),
+    }
+    assert parse_rate_limits("none") == {}
+
+
+def test_get_rate_limiter_reads_env_override(monkeypatch):
+    monkeypatch.setattr(rate_limit, "_limiter", None)
+    monkeypatch.setenv("DECISIONDOC_PROVIDER_RATE_LIMITS", "custom-model=7:700")
+
+    limiter = rate_limit.get_rate_limiter()
+
+    assert limiter.limits == {"custom-model": (7, 700)}
+    assert rate_limit.get_rate_limiter() is limiter
+
+
+def test_estimate_prompt_tokens_uses_four_chars_per_token():
+    assert estimate_prompt_tokens("") == 1
+    assert estimate_prompt_tokens("x" * 400) == 100
@@ -1,6 +1,8 @@
+import asyncio
 import base64
 import json
 import sys
+import threading
 import types
 from pathlib import Path
 
@@ -46,6 +48,70 @@ def test_generation_service_autoescape_is_html_only(tmp_path, monkeypatch):
     assert service.env.autoescape("sample.html") is True
 
 
+def test_generation_service_loads_each_template_once(tmp_path, monkeypatch):
+    monkeypatch.setenv("DECISIONDOC_PROVIDER", "mock")
+    monkeypatch.setenv("DECISIONDOC_TEMPLATE_VERSION", "v1")
+    monkeypatch.setenv("DECISIONDOC_CACHE_ENABLED", "0")
+    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    from app.providers.factory import get_provider
+
+    service = GenerationService(
+        provider_factory=get_provider,
+        template_dir=Path("app/templates/v1"),
+        data_dir=Path(tmp_path),
+    )
+    loaded: list[str] = []
+    original_get_template = service.env.get_template
+
+    def _counting_get_template(name, *args, **kwargs):
+        loaded.append(name)
+        return original_get_template(name, *args, **kwargs)
+
+    monkeypatch.setattr(service.env, "get_template", _counting_get_template)
+    for idx in range(2):
+        payload = GenerateRequest(title=f"template cache {idx}", goal="render twice")
+        service.generate_documents(payload, request_id=f"tpl-{idx}", tenant_id="system")
+
+    assert len(loaded) == 4
+    assert len(set(loaded)) == 4
+
+
+def test_generation_services_share_template_environment(tmp_path):
+    from app.providers.factory import get_provider
+
+    first, second = (
+        GenerationService(
+            provider_factory=get_provider,
+            template_dir=Path("app/templates/v1"),
+            data_dir=tmp_path / name,
+        )
+        for name in ("a", "b")
+    )
+
+    assert first.env is second.env
+    assert first.env.filters["markdown_table"] is not None
+
+
+def test_parallel_render_matches_sequential_output(tmp_path, monkeypatch):
+    monkeypatch.setenv("DECISIONDOC_PROVIDER", "mock")
+    monkeypatch.setenv("DECISIONDOC_CACHE_ENABLED", "0")
+    from app.providers.factory import get_provider
+
+    service = GenerationService(
+        provider_factory=get_provider,
+        template_dir=Path("app/templates/v1"),
+        data_dir=Path(tmp_path),
+    )
+    payload = GenerateRequest(title="parallel render", goal="same markdown either way")
+
+    monkeypatch.setenv("DECISIONDOC_PARALLEL_RENDER", "0")
+    sequential = service.generate_documents(payload, request_id="render-seq", tenant_id="system")
+    monkeypatch.setenv("DECISIONDOC_PARALLEL_RENDER", "1")
+    parallel = service.generate_documents(payload, request_id="render-par", tenant_id="system")
+
+    assert parallel["docs"] == sequential["docs"]
+
+
 def test_cache_corruption_is_cache_miss(tmp_path, monkeypatch):
     monkeypatch.setenv("DECISIONDOC_PROVIDER", "mock")
     monkeypatch.setenv("DECISIONDOC_CACHE_ENABLED", "1")
@@ -71,6 +137,66 @@ def test_cache_corruption_is_cache_miss(tmp_path, monkeypatch):
     assert "adr" in repaired
 
 
+def test_cache_round_trips_compact_utf8_json(tmp_path, monkeypatch):
+    monkeypatch.setenv("DECISIONDOC_PROVIDER", "mock")
+    from app.providers.factory import get_provider
+
+    service = GenerationService(
+        provider_factory=get_provider,
+        template_dir=Path("app/templates/v1"),
+        data_dir=Path(tmp_path),
+    )
+    cache_path = service.cache_dir / "roundtrip.json"
+    bundle = {"adr": {"decision": "캐시 결정", "options": ["a", "b"]}}
+
+    service._write_cache_atomic(cache_path, bundle)
+
+    raw = cache_path.read_bytes()
+    assert b"\n" not in raw
+    assert "캐시 결정".encode("utf-8") in raw
+    assert service._try_read_cache(cache_path) == bundle
+    cache_path.write_bytes(b"\xff\xfe")
+    assert service._try_read_cache(cache_path) is None
+
+
+def test_cache_write_fsync_is_opt_in(tmp_path, monkeypatch):
+    monkeypatch.setenv("DECISIONDOC_PROVIDER", "mock")
+    from app.providers.factory import get_provider
+    import app.services.generation.service_cache_mixin as cache_mixin
+
+    service = GenerationService(
+        provider_factory=get_provider,
+        template_dir=Path("app/templates/v1"),
+        data_dir=Path(tmp_path),
+    )
+    synced: list[int] = []
+    monkeypatch.setattr(cache_mixin.os, "fsync", lambda fd: synced.append(fd))
+
+    service._write_cache_atomic(service.cache_dir / "a.json", {"adr": {}})
+    assert synced == []
+    monkeypatch.setenv("DECISIONDOC_CACHE_FSYNC", "1")
+    service._write_cache_atomic(service.cache_dir / "b.json", {"adr": {}})
+    assert len(synced) == 1
+    assert sorted(p.name for p in service.cache_dir.iterdir() if p.is_file()) == ["a.json", "b.json"]
+
+
+def test_cache_path_is_short_content_addressed_digest(tmp_path, monkeypatch):
+    monkeypatch.setenv("DECISIONDOC_PROVIDER", "mock")
+    from app.providers.factory import get_provider
+
+    service = GenerationService(
+        provider_factory=get_provider,
+        template_dir=Path("app/templates/v1"),
+        data_dir=Path(tmp_path),
+    )
+    payload = {"title": "digest", "goal": "stable"}
+    path = service._cache_path("mock", "v1", payload, tenant_id="system")
+
+    assert len(path.stem) == 32
+    assert path == service._cache_path("mock", "v1", dict(reversed(payload.items())), tenant_id="system")
+    assert path != service._cache_path("mock", "v1", payload, tenant_id="tenant-b")
+
+
 def test_generation_cache_isolated_by_tenant(tmp_path, monkeypatch):
     monkeypatch.setenv("DECISIONDOC_CACHE_ENABLED", "1")
     monkeypatch.setenv("DECISIONDOC_TEMPLATE_VERSION", "v1")
@@ -247,6 +373,58 @@ def test_openai_retries_disabled(monkeypatch):
     assert "adr" in bundle
 
 
+def test_openai_generate_raw_uses_sdk_timeout_inside_running_loop(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("DECISIONDOC_PROVIDER_TIMEOUT", "17")
+    captured = {}
+
+    class FakeResponses:
+        def create(self, **kwargs):
+            captured["create_thread"] = threading.get_ident()
+            return types.SimpleNamespace(output_text="{}", usage=None)
+
+    class FakeOpenAI:
+        def __init__(self, **kwargs):
+            captured.update(kwargs)
+            self.responses = FakeResponses()
+
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=FakeOpenAI))
+
+    async def _call():
+        return OpenAIProvider().generate_raw("prompt", request_id="req-loop"), threading.get_ident()
+
+    raw, caller_thread = asyncio.run(_call())
+    assert raw == "{}"
+    assert captured["timeout"] == 17
+    assert captured["create_thread"] == caller_thread
+
+
+def test_openai_client_is_reused_until_timeout_changes(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setenv("DECISIONDOC_PROVIDER_TIMEOUT", "30")
+    built: list[dict] = []
+
+    class FakeResponses:
+        def create(self, **kwargs):
+            return types.SimpleNamespace(output_text="{}", usage=None)
+
+    class FakeOpenAI:
+        def __init__(self, **kwargs):
+            built.append(kwargs)
+            self.responses = FakeResponses()
+
+    monkeypatch.setitem(sys.modules, "openai", types.SimpleNamespace(OpenAI=FakeOpenAI))
+
+    provider = OpenAIProvider()
+    provider.generate_raw("one", request_id="req-1")
+    provider.generate_raw("two", request_id="req-2")
+    assert len(built) == 1
+
+    monkeypatch.setenv("DECISIONDOC_PROVIDER_TIMEOUT", "45")
+    provider.generate_raw("three", request_id="req-3")
+    assert [kwargs["timeout"] for kwargs in built] == [30, 45]
+
+
 def test_openai_visual_asset_request_uses_gpt_image_compatible_params(monkeypatch):
     monkeypatch.setenv("OPENAI_API_KEY", "test-key")
     monkeypatch.setenv("DECISIONDOC_OPENAI_IMAGE_MODEL", "gpt-image-1")
@@ -282,3 +460,20 @@ def test_openai_visual_asset_request_uses_gpt_image_compatible_params(monkeypatc
     assert "style" not in captured
     assert asset["media_type"] == "image/png"
     assert asset["data"] == b"fake-png-bytes"
+
+
+def test_mock_tech_decision_bundle_returns_independent_lists():
+    provider = MockProvider()
+    first = provider.generate_bundle({"assumptions": ["A1"]}, schema_version="v1", request_id="req-1")
+    first["adr"]["options"].append("mutated")
+    first["onepager"]["checks"].clear()
+
+    second = provider.generate_bundle({}, schema_version="v1", request_id="req-2")
+
+    assert first["adr"]["assumptions"] == ["A1"]
+    assert second["adr"]["options"] == [
+        "Option A: Keep mock provider default and add adapters.",
+        "Option B: Immediate full LLM dependency (deferred).",
+    ]
+    assert len(second["onepager"]["checks"]) == 2
+    assert second["adr"]["assumptions"][0] == "Current requirements are stable for this MVP."
@@ -0,0 +1,185 @@
+"""Tests for the semantic (near-duplicate) bundle cache."""
+
+import math
+import re
+import sys
+import zlib
+from pathlib import Path
+
+import pytest
+
+from app.providers.factory import get_provider
+from app.schemas import GenerateRequest
+from app.services import semantic_cache
+from app.services.generation_service import GenerationService
+from app.services.semantic_cache import SemanticCacheIndex, embed_payload, split_payload
+
+
+def _bag_of_words(text: str) -> list[float]:
+    """Deterministic stand-in for the sentence-transformers encoder."""
+    vec = [0.0] * 64
+    for token in re.findall(r"\w+", text.lower()):
+        vec[zlib.crc32(token.encode("utf-8")) % 64] += 1.0
+    norm = math.sqrt(sum(v * v for v in vec)) or 1.0
+    return [v / norm for v in vec]
+
+
+@pytest.fixture
+def fake_embedder(monkeypatch):
+    monkeypatch.setattr(semantic_cache, "_load_embedder", lambda model_name: _bag_of_words)
+
+
+def _make_service(tmp_path, monkeypatch, *, semantic: str = "1"):
+    monkeypatch.setenv("DECISIONDOC_PROVIDER", "mock")
+    monkeypatch.setenv("DECISIONDOC_CACHE_ENABLED", "1")
+    monkeypatch.setenv("DECISIONDOC_SEMANTIC_CACHE", semantic)
+    monkeypatch.setenv("DECISIONDOC_TEMPLATE_VERSION", "v1")
+    return GenerationService(
+        provider_factory=get_provider,
+        template_dir=Path("app/templates/v1"),
+        data_dir=tmp_path,
+    )
+
+
+def test_split_payload_embeds_only_free_text_and_normalizes_the_rest():
+    exact, fuzzy = split_payload(
+        {
+            "title": "Cache  Layer",
+            "constraints": "$5k/month; SOC2",
+            "context": "Some Context",
+            "assumptions": ["a1"],
+            "_search_context": "x",
+        }
+    )
+    assert exact == {"title": "cache layer", "constraints": "$5k/month; soc2"}
+    assert fuzzy == {"context": "Some Context", "assumptions": ["a1"]}
+
+
+def test_embed_payload_is_none_without_sentence_transformers(monkeypatch):
+    monkeypatch.setitem(sys.modules, "sentence_transformers", None)
+    semantic_cache._load_embedder.cache_clear()
+    try:
+        assert embed_payload({"title": "t", "context": "c"}) is None
+    finally:
+        semantic_cache._load_embedder.cache_clear()
+
+
+def test_index_lookup_respects_scope_and_threshold(tmp_path):
+    index = SemanticCacheIndex(tmp_path / "index.jsonl")
+    vec = _bag_of_words("semantic cache reuse bundles")
+    index.add("scope-a", vec, "a.json")
+
+    assert index.lookup("scope-a", vec, 0.92)[0] == "a.json"
+    assert index.lookup("scope-b", vec, 0.92) is None
+    assert index.lookup("scope-a", _bag_of_words("unrelated different words"), 0.92) is None
+
+    reloaded = SemanticCacheIndex(tmp_path / "index.jsonl")
+    assert reloaded.lookup("scope-a", vec, 0.92)[0] == "a.json"
+
+
+def test_index_is_append_only_and_shared_between_writers(tmp_path):
+    path = tmp_path / "index.jsonl"
+    first, second = SemanticCacheIndex(path), SemanticCacheIndex(path)
+    vec_a, vec_b = _bag_of_words("alpha"), _bag_of_words("beta")
+
+    first.add("scope", vec_a, "a.json")
+    second.add("scope", vec_b, "b.json")
+    with open(path, "ab") as f:
+        f.write(b'{"scope":"scope","file":"partial.json","vec":[')  # writer mid-append
+
+    assert len(path.read_bytes().splitlines()) == 3
+    assert first.lookup("scope", vec_b, 0.99)[0] == "b.json"
+    assert second.lookup("scope", vec_a, 0.99)[0] == "a.json"
+
+
+def test_near_duplicate_request_hits_semantic_cache(tmp_path, monkeypatch, fake_embedder):
+    service = _make_service(tmp_path, monkeypatch)
+    first = service.generate_documents(
+        GenerateRequest(title="Semantic cache test", goal="reuse cached bundles", assumptions=["a1", "a2"]),
+        request_id="sem-1",
+        tenant_id="system",
+    )
+    second = service.generate_documents(
+        GenerateRequest(title="semantic cache  test", goal="Reuse cached bundles", assumptions=["a2", "a1"]),
+        request_id="sem-2",
+        tenant_id="system",
+    )
+    assert first["metadata"]["cache_hit"] is False
+    assert second["metadata"]["cache_hit"] is True
+
+
+@pytest.mark.parametrize(
+    "changed",
+    [
+        {"title": "Adopt MongoDB for billing"},
+        {"constraints": "$50k/month; no SOC2"},
+    ],
+    ids=["title", "constraints"],
+)
+def test_decision_fields_must_match_exactly(tmp_path, monkeypatch, changed):
+    # Every vector is identical, so only the scope can keep these apart.
+    monkeypatch.setattr(semantic_cache, "_load_embedder", lambda model_name: lambda text: [1.0])
+    service = _make_service(tmp_path, monkeypatch)
+    base = {"title": "Adopt PostgreSQL for billing", "goal": "pick a database", "constraints": "$5k/month; SOC2"}
+    service.generate_documents(GenerateRequest(**base), request_id="sem-x1", tenant_id="system")
+
+    other = service.generate_documents(
+        GenerateRequest(**{**base, **changed}), request_id="sem-x2", tenant_id="system"
+    )
+    assert other["metadata"]["cache_hit"] is False
+
+
+def test_semantic_cache_is_inert_without_an_embedding_model(tmp_path, monkeypatch):
+    monkeypatch.setattr(semantic_cache, "_load_embedder", lambda model_name: None)
+    service = _make_service(tmp_path, monkeypatch)
+    service.generate_documents(
+        GenerateRequest(title="No model", goal="exact only", assumptions=["a1", "a2"]),
+        request_id="sem-n1",
+        tenant_id="system",
+    )
+    again = service.generate_documents(
+        GenerateRequest(title="No model", goal="exact only", assumptions=["a2", "a1"]),
+        request_id="sem-n2",
+        tenant_id="system",
+    )
+    assert again["metadata"]["cache_hit"] is False
+    assert not (service.cache_dir / "semantic" / "index.jsonl").exists()
+
+
+def test_semantic_cache_is_tenant_scoped_and_off_by_default(tmp_path, monkeypatch, fake_embedder):
+    service = _make_service(tmp_path, monkeypatch)
+    service.generate_documents(
+        GenerateRequest(title="Tenant scoped", goal="no cross tenant reuse"),
+        request_id="sem-t1",
+        tenant_id="system",
+    )
+    other_tenant = service.generate_documents(
+        GenerateRequest(title="tenant scoped", goal="No cross tenant reuse"),
+        request_id="sem-t2",
+        tenant_id="tenant-b",
+    )
+    assert other_tenant["metadata"]["cache_hit"] is False
+
+    monkeypatch.setenv("DECISIONDOC_SEMANTIC_CACHE", "0")
+    disabled = service.generate_documents(
+        GenerateRequest(title="TENANT scoped", goal="no cross tenant reuse"),
+        request_id="sem-t3",
+        tenant_id="system",
+    )
+    assert disabled["metadata"]["cache_hit"] is False
+
+
+def test_clear_cache_also_clears_semantic_index(tmp_path, monkeypatch, fake_embedder):
+    service = _make_service(tmp_path, monkeypatch)
+    service.generate_documents(
+        GenerateRequest(title="clear me", goal="index cleared"), request_id="sem-c1", tenant_id="system"
+    )
+    assert (service.cache_dir / "semantic" / "index.jsonl").exists()
+
+    service.clear_cache()
+
+    assert not (service.cache_dir / "semantic" / "index.jsonl").exists()
+    again = service.generate_documents(
+        GenerateRequest(title="Clear me", goal="index cleared"), request_id="sem-c2", tenant_id="system"
+    )
+    assert again["metadata"]["cache_hit"] is False
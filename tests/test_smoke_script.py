@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import importlib.util
+import threading
 from datetime import datetime
 from pathlib import Path
 
@@ -170,6 +171,51 @@ def test_run_document_upload_smoke_validates_auth_and_success_paths(capsys):
     assert seen_api_key_headers == ["", "api-key"]
 
 
+def test_build_client_uses_keepalive_pool():
+    smoke = _load_smoke_module()
+    with smoke._build_client(5.0) as client:
+        assert isinstance(client, httpx.Client)
+        assert client.timeout.read == 5.0
+
+
+def test_main_overlaps_authenticated_generate_and_export(monkeypatch, capsys):
+    smoke = _load_smoke_module()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/health":
+            return httpx.Response(200, json={"ok": True})
+        if request.headers.get("x-decisiondoc-api-key") != "api-key":
+            return httpx.Response(401, json={"code": "UNAUTHORIZED", "request_id": "req-no-auth"})
+        barrier.wait()  # both authenticated POSTs must be in flight together
+        if request.url.path == "/generate":
+            return httpx.Response(200, json={"request_id": "req-gen", "bundle_id": "bundle-gen"})
+        if request.url.path == "/generate/export":
+            return httpx.Response(
+                200,
+                json={"request_id": "req-exp", "bundle_id": "bundle-exp", "files": [{"doc_type": "adr"}]},
+            )
+        raise AssertionError(f"Unhandled request: {request.method} {request.url}")
+
+    monkeypatch.setenv("SMOKE_BASE_URL", "https://example.com")
+    monkeypatch.setenv("SMOKE_API_KEY", "api-key")
+    monkeypatch.setattr(
+        smoke, "_build_client", lambda timeout_sec: httpx.Client(transport=httpx.MockTransport(handler))
+    )
+    for name in (
+        "_run_export_edited_pdf_smoke",
+        "_run_export_edited_hwpx_smoke",
+        "_run_attachment_generation_smoke",
+        "_run_document_upload_smoke",
+    ):
+        monkeypatch.setattr(smoke, name, lambda *args, **kwargs: None)
+
+    assert smoke.main() == 0
+
+    out = capsys.readouterr().out
+    assert out.index("POST /generate (auth) -> 200") < out.index("POST /generate/export (auth) -> 200")
+
+
 def test_run_attachment_generation_smoke_validates_auth_and_success_paths(capsys):
     smoke = _load_smoke_module()
     seen_api_key_headers: list[str] = []
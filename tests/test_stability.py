@@ -286,6 +286,105 @@ def test_retry_uses_retry_after_when_provider_is_rate_limited(tmp_path: Path, mo
     assert delays == [4]
 
 
+def test_max_concurrent_requests_invalid_env(monkeypatch) -> None:
+    """잘못된 DECISIONDOC_MAX_CONCURRENT_REQUESTS → safe default 8, 0 이하는 1로 보정."""
+    from app.config import get_max_concurrent_provider_calls
+
+    monkeypatch.setenv("DECISIONDOC_MAX_CONCURRENT_REQUESTS", "many")
+    assert get_max_concurrent_provider_calls() == 8
+    monkeypatch.setenv("DECISIONDOC_MAX_CONCURRENT_REQUESTS", "0")
+    assert get_max_concurrent_provider_calls() == 1
+
+
+def test_provider_calls_are_bounded_by_concurrency_limit(tmp_path: Path, monkeypatch) -> None:
+    """DECISIONDOC_MAX_CONCURRENT_REQUESTS=1 → provider 호출이 동시에 1건만 진행."""
+    import threading
+    import time
+
+    from app.bundle_catalog.spec import BundleSpec
+
+    monkeypatch.setenv("DECISIONDOC_MAX_CONCURRENT_REQUESTS", "1")
+    svc, provider = _make_generation_service(tmp_path)
+    svc._build_feedback_hints = lambda *args, **kwargs: ""  # type: ignore[method-assign]
+    lock = threading.Lock()
+    in_flight = 0
+    peak = 0
+
+    def generate_bundle(*args, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.05)
+        with lock:
+            in_flight -= 1
+        return {"result": "ok"}
+
+    provider.generate_bundle.side_effect = generate_bundle
+    provider.consume_usage_tokens.return_value = None
+    bundle_spec = MagicMock(spec=BundleSpec)
+    bundle_spec.id = "tech_decision"
+
+    threads = [
+        threading.Thread(
+            target=svc._call_provider_once,
+            args=(provider, {}, f"req-{i}", bundle_spec),
+            kwargs={"tenant_id": "system"},
+        )
+        for i in range(3)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert provider.generate_bundle.call_count == 3
+    assert peak == 1
+
+
+def test_default_provider_is_built_once_until_factory_changes(tmp_path: Path) -> None:
+    """provider_factory 결과를 재사용하고, factory 교체 시에만 새로 생성."""
+    from app.services.generation_service import GenerationService
+
+    built: list[object] = []
+
+    def factory():
+        built.append(object())
+        return built[-1]
+
+    svc = GenerationService(provider_factory=factory, template_dir=tmp_path, data_dir=tmp_path)
+    first = svc._safe_get_provider(tenant_id="system")
+    assert svc._safe_get_provider(tenant_id="system") is first
+    assert len(built) == 1
+
+    replacement = object()
+    svc.provider_factory = lambda: replacement
+    assert svc._safe_get_provider(tenant_id="system") is replacement
+
+
+def test_shared_provider_keeps_usage_tokens_per_thread() -> None:
+    """공유 provider 인스턴스에서도 usage 토큰은 호출 스레드별로 분리."""
+    import threading
+
+    from app.providers.base import UsageTokenMixin
+
+    provider = UsageTokenMixin()
+    provider._set_usage_tokens({"prompt_tokens": 1})
+    seen: list[object] = []
+
+    def other_thread() -> None:
+        seen.append(provider.consume_usage_tokens())
+        provider._set_usage_tokens({"prompt_tokens": 2})
+
+    thread = threading.Thread(target=other_thread)
+    thread.start()
+    thread.join()
+
+    assert seen == [None]
+    assert provider.consume_usage_tokens() == {"prompt_tokens": 1}
+    assert provider.consume_usage_tokens() is None
+
+
 # ─── H-1: /health readiness probe ────────────────────────────────────────────
 
 def _make_health_client(tmp_path: Path, monkeypatch):
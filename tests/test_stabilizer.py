@@ -2,7 +2,7 @@ import json
 from pathlib import Path
 
 from app.providers.mock_provider import MockProvider
-from app.providers.stabilizer import stabilize_bundle
+from app.providers.stabilizer import stabilize_bundle, strip_internal_bundle_fields
 from app.schemas import GenerateRequest
 from app.services.generation_service import GenerationService
 
@@ -27,6 +27,28 @@ def test_stabilizer_coerces_wrong_section_types():
     assert isinstance(stabilized["ops_checklist"], dict)
 
 
+def test_stabilizer_does_not_mutate_input_bundle():
+    bundle = {"adr": {"decision": "x", "options": [1, "b"]}, "onepager": None}
+    snapshot = json.loads(json.dumps(bundle))
+
+    stabilized = stabilize_bundle(bundle)
+
+    assert bundle == snapshot
+    assert stabilized["adr"]["options"] == ["1", "b"]
+    assert stabilized["adr"]["risks"] == []
+
+
+def test_strip_internal_fields_only_copies_marked_bundles():
+    clean = {"adr": {"decision": "d"}}
+    assert strip_internal_bundle_fields(clean) is clean
+
+    marked = stabilize_bundle({})
+    stripped = strip_internal_bundle_fields(marked)
+    assert "_stabilized" in marked
+    assert "_stabilized" not in stripped
+    assert stripped["adr"] is marked["adr"]
+
+
 def test_internal_marker_does_not_leak_to_cache_or_render(tmp_path, monkeypatch):
     monkeypatch.setenv("DECISIONDOC_CACHE_ENABLED", "1")
 
@@ -1,10 +1,14 @@
 import json
+import os
+import threading
+import time
 from pathlib import Path
 
 import pytest
 
 from app.storage.base import StorageFailedError
 from app.storage.local import LocalStorage
+from app.storage.memory import MemoryStorage
 from app.storage.s3 import S3Storage
 
 
@@ -28,6 +32,43 @@ def test_local_storage_save_export_atomic_and_exists(tmp_path):
     assert md_path.read_text(encoding="utf-8").startswith("# ADR")
 
 
+@pytest.mark.parametrize(("durability", "file_fsyncs"), [("strict", 2), ("relaxed", 0)])
+def test_local_storage_save_exports_batch_writes_all_docs_without_temp_files(
+    tmp_path, monkeypatch, durability, file_fsyncs
+):
+    monkeypatch.setenv("DECISIONDOC_DURABILITY", durability)
+    storage = LocalStorage(data_dir=tmp_path / "data", exports_dir=tmp_path / "exports")
+    events = []
+    real_fsync, real_replace = os.fsync, os.replace
+    monkeypatch.setattr(os, "fsync", lambda fd: events.append("fsync") or real_fsync(fd))
+    monkeypatch.setattr(os, "replace", lambda src, dst: events.append("replace") or real_replace(src, dst))
+    docs = [
+        {"doc_type": "adr", "markdown": "# ADR\n결정\n"},
+        {"doc_type": "onepager", "markdown": "# Onepager\n"},
+    ]
+
+    storage.save_exports_batch("bundle-3", docs)
+
+    export_dir = Path(storage.get_export_dir("bundle-3"))
+    assert sorted(p.name for p in export_dir.iterdir()) == ["adr.md", "onepager.md"]
+    assert Path(storage.get_export_path("bundle-3", "adr")).read_text(encoding="utf-8") == "# ADR\n결정\n"
+    # File contents are synced before any rename; the directory is synced once after.
+    assert events == ["fsync"] * file_fsyncs + ["replace", "replace", "fsync"]
+
+
+def test_s3_storage_save_exports_batch_puts_each_doc():
+    fake = FakeS3Client()
+    storage = S3Storage(bucket="unit-bucket", prefix="decisiondoc-ai/", s3_client=fake)
+    storage.save_exports_batch(
+        "bundle-4",
+        [{"doc_type": "adr", "markdown": "# ADR"}, {"doc_type": "onepager", "markdown": "# One"}],
+    )
+    assert sorted(call["Key"] for call in fake.calls) == [
+        "decisiondoc-ai/exports/bundle-4/adr.md",
+        "decisiondoc-ai/exports/bundle-4/onepager.md",
+    ]
+
+
 def test_local_storage_corrupted_json_load_returns_none(tmp_path):
     storage = LocalStorage(data_dir=tmp_path / "data", exports_dir=tmp_path / "exports")
     broken = tmp_path / "data" / "bad.json"
@@ -114,3 +155,212 @@ def test_atomic_write_json_raises_storage_failed_on_non_serializable(tmp_path):
 
     with pytest.raises(StorageFailedError):
         storage._atomic_write_json(path, {"ts": datetime(2026, 1, 1)})
+
+
+def test_storage_key_and_path_builders(tmp_path):
+    local = LocalStorage(data_dir=tmp_path / "data", exports_dir=tmp_path / "exports")
+    assert local._export_path("b-1", "adr") == tmp_path / "exports" / "b-1" / "adr.md"
+    assert local._bundle_path("b-1") == tmp_path / "data" / "b-1.json"
+
+    other = LocalStorage(data_dir=tmp_path / "data2", exports_dir=tmp_path / "exports2")
+    assert other._export_path("b-1", "adr") == tmp_path / "exports2" / "b-1" / "adr.md"
+
+    s3 = S3Storage(bucket="unit-bucket", prefix="p", s3_client=FakeS3Client())
+    assert s3._export_key("b-1", "adr") == "p/exports/b-1/adr.md"
+    assert s3._bundle_key("b-1") == "p/bundles/b-1.json"
+
+
+def test_s3_storage_save_exports_batch_uploads_in_parallel():
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+
+    class BarrierS3Client(FakeS3Client):
+        def put_object(self, **kwargs):
+            barrier.wait()  # both puts must be in flight at once
+            super().put_object(**kwargs)
+
+    fake = BarrierS3Client()
+    storage = S3Storage(bucket="unit-bucket", prefix="decisiondoc-ai/", s3_client=fake)
+    storage.save_exports_batch(
+        "bundle-5",
+        [{"doc_type": "adr", "markdown": "# ADR"}, {"doc_type": "onepager", "markdown": "# One"}],
+    )
+
+    assert sorted(call["Key"] for call in fake.calls) == [
+        "decisiondoc-ai/exports/bundle-5/adr.md",
+        "decisiondoc-ai/exports/bundle-5/onepager.md",
+    ]
+
+
+def test_s3_storage_save_exports_batch_raises_storage_failed_on_put_error():
+    class FailingS3Client(FakeS3Client):
+        def put_object(self, **kwargs):
+            raise RuntimeError("boom")
+
+    storage = S3Storage(bucket="unit-bucket", prefix="decisiondoc-ai/", s3_client=FailingS3Client())
+    with pytest.raises(StorageFailedError):
+        storage.save_exports_batch(
+            "bundle-6",
+            [{"doc_type": "adr", "markdown": "# ADR"}, {"doc_type": "onepager", "markdown": "# One"}],
+        )
+
+
+def test_local_storage_load_bundle_missing_returns_none_without_warning(tmp_path, caplog):
+    storage = LocalStorage(data_dir=tmp_path / "data", exports_dir=tmp_path / "exports")
+    with caplog.at_level("WARNING", logger="decisiondoc.storage.local"):
+        assert storage.load_bundle("missing") is None
+    assert caplog.records == []
+
+
+def test_local_storage_load_bundle_rejects_oversized_file(tmp_path, monkeypatch):
+    storage = LocalStorage(data_dir=tmp_path / "data", exports_dir=tmp_path / "exports")
+    storage.save_bundle("big", {"adr": {}})
+    monkeypatch.setattr("app.storage.local._MAX_BUNDLE_SIZE_BYTES", 4)
+    assert storage.load_bundle("big") is None
+
+
+def test_temp_path_for_is_unique_sibling(tmp_path):
+    from app.storage.base import temp_path_for
+
+    target = tmp_path / "bundle.json"
+    first, second = temp_path_for(target), temp_path_for(target)
+
+    assert first != second
+    assert first.parent == target.parent
+    assert first.name.startswith("bundle.json.tmp.")
+
+
+def test_s3_storage_large_body_uses_multipart_upload(monkeypatch):
+    class TransferS3Client(FakeS3Client):
+        def __init__(self) -> None:
+            super().__init__()
+            self.uploads = []
+
+        def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None, Config=None):
+            self.uploads.append((fileobj.read(), bucket, key, ExtraArgs, Config))
+
+    monkeypatch.setattr("app.storage.s3._MULTIPART_THRESHOLD_BYTES", 16)
+    fake = TransferS3Client()
+    storage = S3Storage(bucket="unit-bucket", prefix="decisiondoc-ai/", s3_client=fake)
+
+    storage.save_export("bundle-7", "adr", "# small")
+    storage.save_export("bundle-7", "onepager", "# a markdown body over the limit")
+
+    assert [call["Key"] for call in fake.calls] == ["decisiondoc-ai/exports/bundle-7/adr.md"]
+    body, bucket, key, extra, config = fake.uploads[0]
+    assert body == b"# a markdown body over the limit"
+    assert (bucket, key) == ("unit-bucket", "decisiondoc-ai/exports/bundle-7/onepager.md")
+    assert extra == {"ContentType": "text/markdown; charset=utf-8"}
+    assert config.max_concurrency == 8
+
+
+def test_local_storage_save_bundle_and_exports_writes_everything(tmp_path):
+    storage = LocalStorage(data_dir=tmp_path / "data", exports_dir=tmp_path / "exports")
+    bundle = {"adr": {"decision": "결정"}}
+
+    storage.save_bundle_and_exports(
+        "bundle-8",
+        bundle,
+        [{"doc_type": "adr", "markdown": "# ADR"}, {"doc_type": "onepager", "markdown": "# One"}],
+    )
+
+    assert storage.load_bundle("bundle-8") == bundle
+    assert Path(storage.get_export_path("bundle-8", "onepager")).read_text(encoding="utf-8") == "# One"
+    assert not list((tmp_path / "data").glob("*.tmp.*"))
+
+
+def test_local_storage_save_bundle_and_exports_syncs_bundle_before_rename(tmp_path, monkeypatch):
+    monkeypatch.delenv("DECISIONDOC_DURABILITY", raising=False)
+    storage = LocalStorage(data_dir=tmp_path / "data", exports_dir=tmp_path / "exports")
+    events = []
+    real_fsync, real_replace = os.fsync, os.replace
+    monkeypatch.setattr(os, "fsync", lambda fd: events.append("fsync") or real_fsync(fd))
+    monkeypatch.setattr(os, "replace", lambda src, dst: events.append(Path(dst).name) or real_replace(src, dst))
+
+    storage.save_bundle_and_exports(
+        "bundle-10",
+        {"adr": {"decision": "d"}},
+        [{"doc_type": "adr", "markdown": "# ADR"}, {"doc_type": "onepager", "markdown": "# One"}],
+    )
+
+    # Exports and bundle are all synced before the first rename, and the bundle is renamed last.
+    renames = [e for e in events if e != "fsync"]
+    assert renames == ["adr.md", "onepager.md", "bundle-10.json"]
+    assert events[:3] == ["fsync"] * 3
+
+
+def test_local_storage_save_bundle_and_exports_leaves_nothing_on_failure(tmp_path):
+    from datetime import datetime
+
+    storage = LocalStorage(data_dir=tmp_path / "data", exports_dir=tmp_path / "exports")
+    with pytest.raises(StorageFailedError):
+        storage.save_bundle_and_exports(
+            "bundle-9", {"ts": datetime(2026, 1, 1)}, [{"doc_type": "adr", "markdown": "# ADR"}]
+        )
+
+    assert storage.load_bundle("bundle-9") is None
+    assert not Path(storage.get_export_path("bundle-9", "adr")).exists()
+
+
+def test_memory_storage_round_trips_copies_and_is_selected_by_env(monkeypatch):
+    from app.storage.factory import get_storage
+
+    storage = MemoryStorage()
+    bundle = {"adr": {"title": "t"}}
+    storage.save_bundle_and_exports("b1", bundle, [{"doc_type": "adr", "markdown": "# ADR"}])
+
+    loaded = storage.load_bundle("b1")
+    assert loaded == bundle
+    loaded["adr"]["title"] = "mutated"
+    assert storage.load_bundle("b1") == bundle
+    assert storage.load_bundle("missing") is None
+    assert storage.load_export("b1", "adr") == "# ADR"
+    assert storage.get_export_path("b1", "adr") == "memory://exports/b1/adr.md"
+
+    monkeypatch.setenv("DECISIONDOC_STORAGE", "memory")
+    assert get_storage().kind == "memory"
+
+
+def test_s3_storage_and_state_backend_share_one_client(monkeypatch):
+    pytest.importorskip("boto3")
+    import app.storage.s3 as s3_module
+    from app.storage.state_backend import S3StateBackend
+
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    monkeypatch.setattr(s3_module, "_shared_client", None)
+
+    storage = S3Storage(bucket="unit-bucket")
+    state = S3StateBackend(bucket="unit-bucket", prefix="state/")
+    assert storage.client is state.client
+    assert storage.client is S3Storage(bucket="other-bucket").client
+
+
+def test_shared_s3_client_is_built_once_under_concurrent_first_use(monkeypatch):
+    boto3 = pytest.importorskip("boto3")
+    import app.storage.s3 as s3_module
+
+    monkeypatch.setattr(s3_module, "_shared_client", None)
+    start = threading.Barrier(4, timeout=5)
+    builds: list[object] = []
+
+    def _client(*args, **kwargs):  # noqa: ANN002, ANN003
+        builds.append(object())
+        time.sleep(0.05)  # widen the window a racing second build would need
+        return builds[-1]
+
+    monkeypatch.setattr(boto3, "client", _client)
+    results: list[object] = []
+
+    def _first_use() -> None:
+        start.wait()
+        results.append(s3_module.shared_s3_client())
+
+    threads = [threading.Thread(target=_first_use) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(builds) == 1
+    assert results == [builds[0]] * 4
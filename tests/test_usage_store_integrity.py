@@ -464,6 +464,17 @@ def test_missing_usage_state_reads_have_no_side_effect(tmp_path: Path) -> None:
             + "\n"
         ).encode(),
     ],
+    # _event() stamps the current time, so the raw values can't double as ids
+    # (xdist workers must collect identical test ids).
+    ids=[
+        "malformed-json",
+        "invalid-utf8",
+        "blank-line",
+        "duplicate-key",
+        "tampered-total",
+        "non-iso-timestamp",
+        "duplicate-event",
+    ],
 )
 def test_usage_event_corruption_fails_closed_and_preserves_source(
     tmp_path: Path,
@@ -510,6 +521,7 @@ def test_usage_event_corruption_fails_closed_and_preserves_source(
             }
         ).encode(),
     ],
+    ids=["malformed-json", "non-object", "duplicate-month", "tampered-total"],
 )
 def test_usage_summary_corruption_fails_closed_and_preserves_source(
     tmp_path: Path,
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import pytest
+
+from app.services.validator import (
+    BundleValidationError,
+    DocumentValidationError,
+    _BULLET_RE,
+    _extract_section,
+    _index_sections,
+    _present_as_substring,
+    validate_doc,
+    validate_docs,
+)
+
+
+def _onepager(*headings: str) -> str:
+    return "\n\n".join(f"{heading}\nbody" for heading in headings)
+
+
+def test_validate_doc_accepts_heading_lines_with_trailing_whitespace():
+    markdown = _onepager("## Problem  ", "## Recommendation\r", "## Impact", "## Checks")
+    validate_doc("onepager", markdown)
+
+
+def test_validate_doc_keeps_substring_match_for_extended_headings():
+    markdown = _onepager("## Problem statement", "## Recommendation", "## Impact (est.)", "## Checks")
+    validate_doc("onepager", markdown)
+
+
+def test_validate_doc_reports_missing_headings_in_required_order():
+    with pytest.raises(DocumentValidationError) as exc_info:
+        validate_doc("onepager", _onepager("## Recommendation"))
+
+    assert exc_info.value.missing == [
+        "missing_heading:## Problem",
+        "missing_heading:## Impact",
+        "missing_heading:## Checks",
+    ]
+
+
+def test_validate_docs_reports_every_failing_document():
+    docs = [
+        {"doc_type": "onepager", "markdown": _onepager("## Problem", "## Recommendation", "## Impact")},
+        {"doc_type": "ops_checklist", "markdown": _onepager("## Security", "## Reliability", "## Cost", "## Operations")},
+        {"doc_type": "eval_plan", "markdown": _onepager("## Metrics", "## Test cases", "## Failure criteria")},
+    ]
+
+    with pytest.raises(BundleValidationError) as exc_info:
+        validate_docs(docs)
+
+    err = exc_info.value
+    assert isinstance(err, DocumentValidationError)
+    assert err.doc_type == "onepager"
+    assert [f.doc_type for f in err.failures] == ["onepager", "eval_plan"]
+    assert err.missing == [
+        "onepager:missing_heading:## Checks",
+        "eval_plan:missing_heading:## Monitoring",
+    ]
+
+
+def test_validate_docs_raises_single_document_error_unchanged():
+    docs = [{"doc_type": "onepager", "markdown": _onepager("## Problem", "## Recommendation", "## Impact")}]
+
+    with pytest.raises(DocumentValidationError) as exc_info:
+        validate_docs(docs)
+
+    assert type(exc_info.value) is DocumentValidationError
+    assert exc_info.value.missing == ["missing_heading:## Checks"]
+
+
+def test_index_sections_matches_extract_section():
+    markdown = "# ADR: X\n\n## Goal\ngoal\n\n## Options\n- A\n  - B\n### Detail\n- C\n## Risks\nrisk"
+
+    sections = _index_sections(markdown)
+
+    for heading in ("## Goal", "## Options", "## Risks"):
+        start, end = sections[heading]
+        assert markdown[start:end] == _extract_section(markdown, heading)
+
+
+def test_validate_doc_counts_adr_options_from_indexed_section():
+    base = ["## Goal", "## Decision", "## Risks", "## Assumptions", "## Checks", "## Next actions"]
+    one_option = "\n\n".join([*base, "## Options\n- Only A"])
+    two_options = "\n\n".join([*base, "## Options\n- A\n- B"])
+
+    with pytest.raises(DocumentValidationError) as exc_info:
+        validate_doc("adr", one_option)
+    assert exc_info.value.missing == ["adr_options_lt_2"]
+    validate_doc("adr", two_options)
+
+
+@pytest.mark.parametrize(
+    "section",
+    ["\n- A\n- B", "\n  - A\n\t- B\r\n", "\n- A\n-B\n- \n-\n", "\n* A\n- B", "\n-  A\n text - B"],
+)
+def test_bullet_count_matches_line_based_count(section):
+    expected = sum(1 for line in section.splitlines() if line.strip().startswith("- "))
+    assert len(_BULLET_RE.findall(section)) == expected
+
+
+@pytest.mark.parametrize(
+    "markdown",
+    [
+        "## Decision Drivers\nbody",
+        "intro ## Decision\n## Decision Drivers",
+        "## Impact (est.)\n## Checks and balances",
+        "nothing here",
+        "## Goal## Decision",
+    ],
+)
+def test_present_as_substring_matches_in_operator(markdown):
+    headings = ["## Decision", "## Decision Drivers", "## Impact", "## Checks", "## Goal", "## Risks"]
+    assert _present_as_substring(markdown, headings) == {h for h in headings if h in markdown}